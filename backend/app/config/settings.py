@@ -12,14 +12,112 @@ load_dotenv()
 class Settings:
     """Application settings loaded from environment variables"""
     
+    # LLM Provider Configuration
+    LLM_PROVIDER: str = os.getenv("LLM_PROVIDER", "gemini")  # "gemini", "stub" (offline testing) or "workers"
+    
+    # LLM Worker Pool (LLM_PROVIDER=workers) - model calls run in separate processes
+    LLM_WORKER_BACKEND: str = os.getenv("LLM_WORKER_BACKEND", "gemini")  # Provider each worker process runs
+    LLM_WORKER_PROCESSES: int = int(os.getenv("LLM_WORKER_PROCESSES", "2"))  # Per API process (each uvicorn worker has its own pool)
+    LLM_WORKER_CONCURRENCY: int = int(os.getenv("LLM_WORKER_CONCURRENCY", "16"))  # Calls per worker process at once
+    LLM_WORKER_MAX_PENDING: int = int(os.getenv("LLM_WORKER_MAX_PENDING", "64"))  # Calls waiting for a busy pool before 503
+    
     # Google AI Configuration
     GOOGLE_API_KEY: str = os.getenv("GOOGLE_API_KEY", "")
     GEMINI_MODEL: str = "gemini-2.5-flash"  # Using Gemini 2.5 Flash - stable and efficient
+    LLM_MAX_CONCURRENCY: int = int(os.getenv("LLM_MAX_CONCURRENCY", "16"))  # Max in-flight Gemini calls per worker (match quota)
+    LLM_REQUEST_TIMEOUT: float = float(os.getenv("LLM_REQUEST_TIMEOUT", "30"))  # Seconds before an upstream call is abandoned
+    
+    # LLM Scheduler - share of upstream slots and target max queue wait per bot
+    LLM_PRIORITY_WEIGHTS: dict = {
+        "pregnancy": 8,
+        "period": 4,
+        "krishi": 2,
+        "schemes": 1,
+        "default": 1,
+    }
+    LLM_QUEUE_SLO_MS: dict = {
+        "pregnancy": 2000,
+        "period": 4000,
+        "krishi": 8000,
+        "schemes": 15000,
+        "default": 15000,
+    }
+    
+    # Admission Control - shed LLM load early with 503 + Retry-After
+    LLM_MAX_QUEUE_DEPTH: int = int(os.getenv("LLM_MAX_QUEUE_DEPTH", "200"))  # Waiting calls across all queues
+    RETRY_AFTER_MIN_SECONDS: int = 1
+    RETRY_AFTER_MAX_SECONDS: int = 60
+    
+    # Circuit Breaker - fail fast while the upstream model is down
+    LLM_BREAKER_WINDOW: int = int(os.getenv("LLM_BREAKER_WINDOW", "20"))  # Recent calls considered
+    LLM_BREAKER_MIN_CALLS: int = int(os.getenv("LLM_BREAKER_MIN_CALLS", "5"))  # Calls needed before it can open
+    LLM_BREAKER_FAILURE_RATE: float = float(os.getenv("LLM_BREAKER_FAILURE_RATE", "0.5"))
+    LLM_BREAKER_OPEN_SECONDS: float = float(os.getenv("LLM_BREAKER_OPEN_SECONDS", "30"))
+    LLM_BREAKER_HALF_OPEN_PROBES: int = int(os.getenv("LLM_BREAKER_HALF_OPEN_PROBES", "1"))
+    
+    # Hedged Requests - send a second call when the first is slower than usual
+    LLM_HEDGE_ENABLED: bool = os.getenv("LLM_HEDGE_ENABLED", "false").lower() == "true"
+    LLM_HEDGE_PERCENTILE: float = float(os.getenv("LLM_HEDGE_PERCENTILE", "95"))
+    LLM_HEDGE_MIN_SAMPLES: int = int(os.getenv("LLM_HEDGE_MIN_SAMPLES", "20"))  # Latency samples before hedging starts
+    
+    # Stub LLM Provider (LLM_PROVIDER=stub) - offline load testing
+    STUB_LATENCY_DISTRIBUTION: str = os.getenv("STUB_LATENCY_DISTRIBUTION", "lognormal")  # fixed, uniform, normal, lognormal
+    STUB_LATENCY_MS: float = float(os.getenv("STUB_LATENCY_MS", "800"))  # Mean time to first token
+    STUB_LATENCY_JITTER_MS: float = float(os.getenv("STUB_LATENCY_JITTER_MS", "300"))
+    STUB_TOKENS_PER_SECOND: float = float(os.getenv("STUB_TOKENS_PER_SECOND", "60"))  # 0 = return text instantly
+    STUB_ERROR_RATE: float = float(os.getenv("STUB_ERROR_RATE", "0"))  # Fraction of calls that fail
+    STUB_RATE_LIMIT_RATE: float = float(os.getenv("STUB_RATE_LIMIT_RATE", "0"))  # Fraction of calls that get a 429
+    STUB_RESPONSES_FILE: str = os.getenv("STUB_RESPONSES_FILE", "")  # JSON list of {"match", "response"}
+    STUB_SEED: int = int(os.getenv("STUB_SEED", "42"))
+    STUB_PREFILL_MS_PER_1K_TOKENS: float = float(os.getenv("STUB_PREFILL_MS_PER_1K_TOKENS", "0"))  # Extra delay for an uncached prompt prefix
+    
+    # AI Response Cache
+    RESPONSE_CACHE_MAX_ENTRIES: int = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "2000"))
+    RESPONSE_CACHE_TTLS: dict = {  # Seconds a cached answer stays valid, per bot
+        "period": int(os.getenv("RESPONSE_CACHE_TTL_PERIOD", "21600")),
+        "pregnancy": int(os.getenv("RESPONSE_CACHE_TTL_PREGNANCY", "21600")),
+        "krishi": int(os.getenv("RESPONSE_CACHE_TTL_KRISHI", "3600")),
+        "schemes": int(os.getenv("RESPONSE_CACHE_TTL_SCHEMES", "86400")),
+        "default": 3600,
+    }
+    
+    # Background Chat Jobs (/api/jobs) - answer later, poll or get it over Socket.IO
+    JOB_WORKERS: int = int(os.getenv("JOB_WORKERS", "4"))  # Jobs run at the same time per worker process
+    JOB_QUEUE_MAX: int = int(os.getenv("JOB_QUEUE_MAX", "200"))  # Waiting jobs before new ones get 503
+    JOB_RESULT_TTL_SECONDS: int = int(os.getenv("JOB_RESULT_TTL_SECONDS", "900"))  # How long a result can be fetched
+    JOB_MAX_JOBS: int = int(os.getenv("JOB_MAX_JOBS", "5000"))  # Jobs kept in memory
+    JOB_MAX_ATTEMPTS: int = int(os.getenv("JOB_MAX_ATTEMPTS", "3"))  # Tries for a job shed as overloaded
     
     # MongoDB Configuration
     MONGODB_URL: str = os.getenv("MONGODB_URL", "mongodb://localhost:27017")
     DATABASE_NAME: str = os.getenv("DATABASE_NAME", "sakhi_hub")
     
+    # MongoDB Connection Pool (per worker process, see services/database.py)
+    MONGO_MAX_POOL_SIZE: int = int(os.getenv("MONGO_MAX_POOL_SIZE", "100"))
+    MONGO_MIN_POOL_SIZE: int = int(os.getenv("MONGO_MIN_POOL_SIZE", "0"))  # Connections kept open when idle
+    MONGO_MAX_IDLE_TIME_MS: int = int(os.getenv("MONGO_MAX_IDLE_TIME_MS", "300000"))
+    MONGO_WAIT_QUEUE_TIMEOUT_MS: int = int(os.getenv("MONGO_WAIT_QUEUE_TIMEOUT_MS", "5000"))  # Wait for a free connection
+    MONGO_CONNECT_TIMEOUT_MS: int = int(os.getenv("MONGO_CONNECT_TIMEOUT_MS", "5000"))
+    MONGO_SERVER_SELECTION_TIMEOUT_MS: int = int(os.getenv("MONGO_SERVER_SELECTION_TIMEOUT_MS", "5000"))
+    MONGO_SOCKET_TIMEOUT_MS: int = int(os.getenv("MONGO_SOCKET_TIMEOUT_MS", "0"))  # 0 = no limit per operation
+    MONGO_WRITE_CONCERN: str = os.getenv("MONGO_WRITE_CONCERN", "1")  # "1", "majority", ...
+    MONGO_WRITE_JOURNAL: bool = os.getenv("MONGO_WRITE_JOURNAL", "false").lower() == "true"
+    MONGO_READ_CONCERN: str = os.getenv("MONGO_READ_CONCERN", "local")  # "local", "majority", ...
+    MONGO_READ_PREFERENCE: str = os.getenv("MONGO_READ_PREFERENCE", "primary")  # "primaryPreferred", "secondaryPreferred", ...
+    
+    # Catalog Cache - creators and products, invalidated on writes across workers
+    CATALOG_CACHE_MAX_ENTRIES: int = int(os.getenv("CATALOG_CACHE_MAX_ENTRIES", "2000"))
+    CATALOG_CACHE_TTL_SECONDS: int = int(os.getenv("CATALOG_CACHE_TTL_SECONDS", "300"))  # Upper bound on staleness
+    CATALOG_CACHE_CHANNEL: bool = os.getenv("CATALOG_CACHE_CHANNEL", "true").lower() == "true"  # Cross-worker invalidation feed
+    CATALOG_CACHE_CHANNEL_BYTES: int = int(os.getenv("CATALOG_CACHE_CHANNEL_BYTES", "1048576"))  # Capped collection size
+    
+    # Catalog Search (/api/skill-hub/search) - in-process index per worker
+    SEARCH_PREFIX_EXPANSIONS: int = int(os.getenv("SEARCH_PREFIX_EXPANSIONS", "30"))  # Terms one typed prefix may match
+    
+    # List Pagination - page sizes for creators, products and community posts
+    PAGE_SIZE_DEFAULT: int = int(os.getenv("PAGE_SIZE_DEFAULT", "20"))
+    PAGE_SIZE_MAX: int = int(os.getenv("PAGE_SIZE_MAX", "100"))
+    
     # API Configuration
     API_HOST: str = os.getenv("API_HOST", "0.0.0.0")
     API_PORT: int = int(os.getenv("API_PORT", "8000"))
@@ -37,8 +135,71 @@ class Settings:
         "http://127.0.0.1:5175",
     ]
     
+    # Generation Profiles - model settings per endpoint (see AIService)
+    # Keys map to google.generativeai GenerationConfig fields
+    GENERATION_PROFILES: dict = {
+        "period_chat": {
+            "temperature": 0.9,
+            "top_p": 0.95,
+            "max_output_tokens": int(os.getenv("GEN_PERIOD_CHAT_MAX_TOKENS", "1024")),
+            "stop_sequences": ["\nUser:", "\nUser's Message:"],  # Don't invent the user's next turn
+        },
+        "pregnancy_chat": {
+            "temperature": 0.9,
+            "top_p": 0.95,
+            "max_output_tokens": int(os.getenv("GEN_PREGNANCY_CHAT_MAX_TOKENS", "1024")),
+            "stop_sequences": ["\nUser:", "\nUser's Message:"],
+        },
+        "krishi_chat": {
+            "temperature": 0.7,
+            "top_p": 0.95,
+            "max_output_tokens": int(os.getenv("GEN_KRISHI_CHAT_MAX_TOKENS", "800")),
+            "stop_sequences": ["\nUser's Message:"],
+        },
+        "eligibility": {
+            "temperature": 0.1,
+            "max_output_tokens": int(os.getenv("GEN_ELIGIBILITY_MAX_TOKENS", "128")),
+            "response_mime_type": "application/json",  # Structured output, no free text to parse
+        },
+        "summary": {
+            "temperature": 0.2,
+            "max_output_tokens": 256,
+        },
+        "translation": {
+            "temperature": 0.2,
+            "max_output_tokens": int(os.getenv("GEN_TRANSLATION_MAX_TOKENS", "2048")),  # Indic scripts use more tokens than English
+        },
+        "default": {
+            "temperature": 0.9,
+            "top_p": 0.95,
+            "max_output_tokens": 1500,
+        },
+    }
+    
+    # Prompt Assembly - memoized context blocks per bot
+    PROMPT_CONTEXT_CACHE_SIZE: int = int(os.getenv("PROMPT_CONTEXT_CACHE_SIZE", "4096"))
+    
+    # Krishi Bot Retrieval - knowledge passages added to each prompt
+    KRISHI_RETRIEVAL_TOP_K: int = int(os.getenv("KRISHI_RETRIEVAL_TOP_K", "4"))
+    KRISHI_CONTEXT_BOOST: float = 2.0  # Query weight of the user's crops, location and season
+    
+    # Conversation Memory - server-side chat history per session
+    CONVERSATION_MAX_SESSIONS: int = int(os.getenv("CONVERSATION_MAX_SESSIONS", "5000"))
+    CONVERSATION_TTL_SECONDS: int = int(os.getenv("CONVERSATION_TTL_SECONDS", "3600"))  # Forget idle chats
+    CONVERSATION_TOKEN_BUDGET: int = int(os.getenv("CONVERSATION_TOKEN_BUDGET", "1200"))  # Max history tokens per prompt
+    CONVERSATION_SUMMARY_MAX_TOKENS: int = int(os.getenv("CONVERSATION_SUMMARY_MAX_TOKENS", "300"))
+    CONVERSATION_KEEP_RECENT_TURNS: int = int(os.getenv("CONVERSATION_KEEP_RECENT_TURNS", "4"))  # Never summarized
+    
+    # Pregnancy Week Content - stock week-specific questions answered without the model
+    PREGNANCY_CONTENT_ENABLED: bool = os.getenv("PREGNANCY_CONTENT_ENABLED", "true").lower() == "true"
+    
     # Period Cycle Configuration
     DEFAULT_CYCLE_LENGTH: int = 28  # Default menstrual cycle length in days
+    CALENDAR_CACHE_SIZE: int = int(os.getenv("CALENDAR_CACHE_SIZE", "2048"))  # Memoized period/pregnancy calendars
+    CYCLE_PRIOR_STD_DEV: float = 3.0  # Cycle-to-cycle variation assumed before a user has history
+    CYCLE_PRIOR_WEIGHT: int = 3  # Logged cycles needed to outweigh the defaults
+    CYCLE_TREND_MIN_CYCLES: int = 6  # Cycles needed before a trend is used in predictions
+    CYCLE_REFRESH_BATCH_SIZE: int = int(os.getenv("CYCLE_REFRESH_BATCH_SIZE", "5000"))  # Users per NumPy batch in the nightly refresh
     
     # JWT Authentication Configuration
     JWT_SECRET_KEY: str = os.getenv("JWT_SECRET_KEY", "sakhi-hub-secret-key-change-in-production-2026")
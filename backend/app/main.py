@@ -5,15 +5,23 @@ This is the entry point for the backend server.
 It initializes the FastAPI app, connects to MongoDB, and registers all routes.
 """
 
-from fastapi import FastAPI, status, Depends
+from fastapi import FastAPI, Request, status, Depends
+from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
-from pymongo import MongoClient
 from pymongo.errors import ConnectionFailure
 from app.config.settings import settings
-from app.routes import skill_hub, health_bots, auth, community, krishi_bot, schemes
+from app.routes import skill_hub, health_bots, auth, community, krishi_bot, schemes, cycles, jobs
 from app.middleware.rate_limiter import api_limiter, auth_limiter
 from app.socket_events import sio
+from app.services.ai_service import AIService, RATE_LIMIT_MESSAGE
+from app.services.admission import LLMOverloadedError
+from app.services.llm_provider import close_provider
+from app.services import health_calendar, database
+from app.services.catalog_cache import catalog_cache
+from app.services.catalog_search import catalog_search
+from app.services.database import get_db
+from app.models.schemas import ChatResponse
 import socketio
 import uvicorn
 
@@ -41,8 +49,39 @@ fastapi_app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],  # Allow all HTTP methods
     allow_headers=["*"],  # Allow all headers
+    expose_headers=["Retry-After", "Location"],  # Let the web client back off on 503 and find job results
 )
 
+# ============================================
+# OVERLOAD HANDLING
+# ============================================
+
+@fastapi_app.exception_handler(LLMOverloadedError)
+async def llm_overloaded_handler(request: Request, exc: LLMOverloadedError):
+    """
+    Shed LLM requests with 503 + Retry-After instead of a 200 apology,
+    so clients can tell a real answer from a "please try later"
+    
+    Chat endpoints answer in their ChatResponse shape with a friendly
+    message; every other endpoint (schemes, streams, jobs) gets a plain
+    {"detail", "retry_after"} error body.
+    """
+    route = request.scope.get("route")
+    if getattr(route, "response_model", None) is ChatResponse:
+        content = ChatResponse(
+            response=RATE_LIMIT_MESSAGE,
+            status="overloaded",
+            error=exc.reason,
+            retry_after=exc.retry_after
+        ).model_dump()
+    else:
+        content = {"detail": exc.reason, "retry_after": exc.retry_after}
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content=content,
+        headers={"Retry-After": str(exc.retry_after)}
+    )
+
 # ============================================
 # MOUNT STATIC FILES
 # ============================================
@@ -57,39 +96,25 @@ fastapi_app.mount("/static", StaticFiles(directory=static_path), name="static")
 # DATABASE CONNECTION
 # ============================================
 
-# Global database instance
-db = None
-mongo_client = None
-
 @fastapi_app.on_event("startup")
 async def startup_db_client():
     """
-    Initialize MongoDB connection on application startup
+    Open the MongoDB connection pool on application startup
     """
-    global db, mongo_client
-    
     try:
-        # Connect to MongoDB with shorter timeout
-        mongo_client = MongoClient(settings.MONGODB_URL, serverSelectionTimeoutMS=5000)
-        
-        # Test connection
-        mongo_client.admin.command('ping')
+        # Connect and test the connection (pool settings: MONGO_*)
+        db = await database.connect()
         print("✅ Successfully connected to MongoDB")
         
-        # Get database
-        db = mongo_client[settings.DATABASE_NAME]
+        # Create indexes for better performance
+        await database.ensure_indexes(db)
+        await database.backfill_created_at(db)
         
-        # Initialize database in route modules
-        skill_hub.init_db(db)
-        auth.init_db(db)
-        community.init_db(db)
+        # Keep catalog caches of all workers in step
+        await catalog_cache.start(db)
         
-        # Create indexes for better performance
-        db.users.create_index("phone", unique=True)
-        db.creators.create_index("name")
-        db.creators.create_index("skill_category")
-        db.products.create_index("creator_name")
-        db.products.create_index("category")
+        # Build the search index in the background; /search answers 503 until it is ready
+        catalog_search.start()
         
         print(f"✅ Database '{settings.DATABASE_NAME}' initialized")
         
@@ -105,11 +130,15 @@ async def shutdown_db_client():
     """
     Close MongoDB connection on application shutdown
     """
-    global mongo_client
+    await catalog_search.stop()
+    await catalog_cache.stop()
     
-    if mongo_client:
-        mongo_client.close()
+    if database.get_database() is not None:
+        await database.close()
         print("✅ MongoDB connection closed")
+    
+    # Stop LLM worker processes (LLM_PROVIDER=workers)
+    close_provider()
 
 # ============================================
 # REGISTER ROUTES
@@ -133,6 +162,12 @@ fastapi_app.include_router(schemes.router, prefix="/api/schemes", tags=["Schemes
 # Include Krishi Bot routes
 fastapi_app.include_router(krishi_bot.router)
 
+# Include Cycle Tracking routes
+fastapi_app.include_router(cycles.router)
+
+# Include Background Job routes
+fastapi_app.include_router(jobs.router)
+
 # ============================================
 # ROOT ENDPOINT
 # ============================================
@@ -162,7 +197,7 @@ async def health_check():
     """
     Health check endpoint - verify API is running
     """
-    db_status = "connected" if db is not None else "disconnected"
+    db_status = "connected" if database.get_database() is not None else "disconnected"
     
     return {
         "status": "healthy",
@@ -170,23 +205,36 @@ async def health_check():
         "message": "SAKHI HUB API is running smoothly"
     }
 
+@fastapi_app.get("/metrics", status_code=status.HTTP_200_OK)
+async def metrics():
+    """
+    Internal counters for caches and AI request handling
+    """
+    return {
+        **AIService.metrics(),
+        "calendars": health_calendar.stats(),
+        "jobs": jobs.job_queue.stats(),
+        "catalog_cache": catalog_cache.stats(),
+        "search": catalog_search.stats()
+    }
+
 # ============================================
 # SEED DATA FOR DEMO (OPTIONAL)
 # ============================================
 
 @fastapi_app.post("/seed-demo-data", status_code=status.HTTP_201_CREATED)
-async def seed_demo_data():
+async def seed_demo_data(db=Depends(get_db)):
     """
     Seed database with demo data for hackathon presentation
     This is useful for quick setup during demo
     """
     try:
         # Check if data already exists
-        if db.creators.count_documents({}) > 0:
+        if await db.creators.count_documents({}) > 0:
             return {
                 "message": "Demo data already exists",
-                "creators": db.creators.count_documents({}),
-                "products": db.products.count_documents({})
+                "creators": await db.creators.count_documents({}),
+                "products": await db.products.count_documents({})
             }
         
         # Demo creators
@@ -275,8 +323,9 @@ async def seed_demo_data():
         for product in demo_products:
             product['created_at'] = datetime.fromisoformat(product['created_at'])
         
-        creators_result = db.creators.insert_many(demo_creators)
-        products_result = db.products.insert_many(demo_products)
+        creators_result = await db.creators.insert_many(demo_creators)
+        products_result = await db.products.insert_many(demo_products)
+        await catalog_cache.clear()
         
         return {
             "message": "✅ Demo data seeded successfully!",
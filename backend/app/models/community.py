@@ -21,3 +21,8 @@ class PostResponse(PostCreate):
     
     class Config:
         from_attributes = True
+
+class PostPage(BaseModel):
+    """One page of posts, newest first"""
+    items: List[PostResponse]
+    next_cursor: Optional[str] = None
@@ -5,11 +5,12 @@ This file defines the data structures used throughout the application:
 1. Creator Profiles
 2. Products
 3. Health Bot Interactions
+4. Cycle Tracking
 """
 
 from pydantic import BaseModel, Field, EmailStr
 from typing import Optional, List
-from datetime import datetime
+from datetime import date, datetime
 
 # ============================================
 # SKILL HUB SCHEMAS
@@ -82,8 +83,10 @@ class PeriodChatRequest(BaseModel):
     age: int = Field(..., ge=10, le=60, description="User's age")
     last_period_date: str = Field(..., description="Last period date in YYYY-MM-DD format")
     user_message: str = Field(..., min_length=1, max_length=1000, description="User's question/message")
-    language: Optional[str] = Field(default="en", description="Preferred language: en, hi, te")
-    history: Optional[List[dict]] = Field(default=[], description="Chat history")
+    language: Optional[str] = Field(default="en", description="Preferred language: en, hi, te (or English, Hindi, Telugu)")
+    history: Optional[List[dict]] = Field(default=[], description="Chat history; only needed to restore a session the server no longer has")
+    session_id: Optional[str] = Field(None, max_length=64, description="Conversation id from an earlier response; a new one is issued when missing")
+    use_cache: bool = Field(default=True, description="Allow a cached answer for a common question")
     
     class Config:
         json_schema_extra = {
@@ -92,7 +95,7 @@ class PeriodChatRequest(BaseModel):
                 "last_period_date": "2026-01-10",
                 "user_message": "I have severe cramps. What can I do?",
                 "language": "en",
-                "history": []
+                "session_id": None
             }
         }
 
@@ -102,8 +105,10 @@ class PregnancyChatRequest(BaseModel):
     """
     pregnancy_start_date: str = Field(..., description="Pregnancy confirmation/start date in YYYY-MM-DD format")
     user_message: str = Field(..., min_length=1, max_length=1000, description="User's question/message")
-    language: Optional[str] = Field(default="en", description="Preferred language: en, hi, te")
-    history: Optional[List[dict]] = Field(default=[], description="Chat history")
+    language: Optional[str] = Field(default="en", description="Preferred language: en, hi, te (or English, Hindi, Telugu)")
+    history: Optional[List[dict]] = Field(default=[], description="Chat history; only needed to restore a session the server no longer has")
+    session_id: Optional[str] = Field(None, max_length=64, description="Conversation id from an earlier response; a new one is issued when missing")
+    use_cache: bool = Field(default=True, description="Allow a cached answer for a common question")
     
     class Config:
         json_schema_extra = {
@@ -111,7 +116,7 @@ class PregnancyChatRequest(BaseModel):
                 "pregnancy_start_date": "2025-11-01",
                 "user_message": "What foods should I eat in my second trimester?",
                 "language": "en",
-                "history": []
+                "session_id": None
             }
         }
 
@@ -122,6 +127,11 @@ class ChatResponse(BaseModel):
     response: str = Field(..., description="AI-generated response")
     prediction: Optional[str] = Field(None, description="Prediction (next period date, trimester info, etc.)")
     additional_info: Optional[dict] = Field(None, description="Additional calculated information")
+    status: str = Field(default="success", description="success, or overloaded when the request was shed")
+    error: Optional[str] = Field(None, description="Why the request could not be answered")
+    retry_after: Optional[int] = Field(None, description="Seconds to wait before retrying (also sent as Retry-After)")
+    session_id: Optional[str] = Field(None, description="Conversation id to send with the next message")
+    source: str = Field(default="llm", description="llm, or content when answered from the week-by-week pregnancy table")
     
     class Config:
         json_schema_extra = {
@@ -135,10 +145,81 @@ class ChatResponse(BaseModel):
             }
         }
 
+# ============================================
+# CYCLE TRACKING SCHEMAS
+# ============================================
+
+class PeriodLogRequest(BaseModel):
+    """
+    A period start to add to the user's cycle history
+    """
+    start_date: str = Field(..., description="Period start date in YYYY-MM-DD format")
+
+class CycleSummary(BaseModel):
+    cycles: int = Field(..., description="Number of cycle lengths used for the statistics")
+    mean_length: Optional[float] = Field(None, description="Average cycle length in days")
+    std_dev: Optional[float] = Field(None, description="Cycle-to-cycle variation in days")
+    trend_per_cycle: Optional[float] = Field(None, description="Change in cycle length per cycle, in days")
+
+class CycleHistoryResponse(BaseModel):
+    starts: List[str] = Field(..., description="Logged period starts, oldest first")
+    lengths: List[int] = Field(..., description="Days between consecutive starts")
+    summary: CycleSummary
+
+class CycleWindow(BaseModel):
+    cycle: int = Field(..., description="1 for the next period, 2 for the one after, ...")
+    expected_start: date
+    earliest: date
+    latest: date
+    expected_length: float
+
+class CyclePredictionResponse(BaseModel):
+    last_period_start: date
+    personalized: bool = Field(..., description="False while predictions still use the default cycle length")
+    confidence: float
+    summary: CycleSummary
+    predictions: List[CycleWindow]
+
 # ============================================
 # RESPONSE MODELS
 # ============================================
 
+class CreatorSummary(BaseModel):
+    """Creator card in list views; the full profile is at /creator/{id}"""
+    id: str = Field(..., alias="_id")
+    name: str
+    village: str
+    skill_category: str
+    experience_preview: str = Field("", description="Start of the experience text")
+    work_samples: List[str] = Field(default=[], description="Cover image only")
+    contact_number: Optional[str] = None
+    created_at: datetime
+
+class ProductSummary(BaseModel):
+    """Product card in list views"""
+    id: str = Field(..., alias="_id")
+    product_name: str
+    creator_name: str
+    price: float
+    image_url: str
+    category: str
+    created_at: datetime
+
+class SearchResponse(BaseModel):
+    """Search results, best match first"""
+    query: str
+    items: List[dict] = Field(..., description="Creator or product summaries with 'type' and 'score'")
+
+class CreatorPage(BaseModel):
+    """One page of creators; pass next_cursor back as ?cursor= for the next"""
+    items: List[CreatorSummary]
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page, null on the last page")
+
+class ProductPage(BaseModel):
+    """One page of products; pass next_cursor back as ?cursor= for the next"""
+    items: List[ProductSummary]
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page, null on the last page")
+
 class SuccessResponse(BaseModel):
     """Generic success response"""
     success: bool = True
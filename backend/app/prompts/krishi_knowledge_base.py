@@ -0,0 +1,273 @@
+"""
+Krishi Sakhi Knowledge Base
+Short passages on crop calendars, pest remedies, soil/water practices and
+farmer schemes. The most relevant few are added to each Krishi Bot prompt
+(see app/services/krishi_knowledge.py).
+
+Each passage: id, title, tags (crops, seasons, regions, topics) and text.
+Keep passages short and self-contained - they are pasted into prompts.
+"""
+
+KRISHI_PASSAGES = [
+    # ============================================
+    # CROP CALENDARS
+    # ============================================
+    {
+        "id": "crop-rice",
+        "title": "Paddy (rice) calendar",
+        "tags": "rice paddy dhan kharif monsoon punjab bihar odisha west bengal andhra telangana tamil nadu",
+        "text": "Kharif paddy: raise nursery in late May-June, transplant 25-30 day old seedlings in June-July after monsoon onset, harvest October-November. Keep 2-5 cm standing water till flowering, drain 10 days before harvest. SRI method (single young seedling, 25x25 cm spacing, alternate wetting and drying) saves seed and up to 30% water.",
+    },
+    {
+        "id": "crop-wheat",
+        "title": "Wheat calendar",
+        "tags": "wheat gehun rabi winter punjab haryana uttar pradesh madhya pradesh rajasthan bihar",
+        "text": "Rabi wheat: sow 1-25 November in north India (late sowing up to mid-December with heat-tolerant varieties), 100 kg seed per hectare. First irrigation at crown root initiation (21 days) is the most important; 4-6 irrigations in total. Harvest March-April when grains are hard.",
+    },
+    {
+        "id": "crop-maize",
+        "title": "Maize calendar",
+        "tags": "maize makka corn kharif rabi karnataka bihar madhya pradesh telangana",
+        "text": "Kharif maize is sown June-July with the first rains; rabi maize October-November in Bihar and the south. Sow on ridges at 60x20 cm. Critical water stages are knee-high, tasseling and grain filling. Harvest when husks turn brown and grains are hard, about 90-110 days.",
+    },
+    {
+        "id": "crop-cotton",
+        "title": "Cotton calendar",
+        "tags": "cotton kapas kharif maharashtra gujarat telangana andhra punjab",
+        "text": "Cotton is sown May (irrigated north India) to June-July (rainfed Maharashtra, Telangana, Gujarat). Picking runs October to January. Install pheromone traps (5 per acre) from 45 days to watch for pink bollworm, and destroy crop residue after the last picking.",
+    },
+    {
+        "id": "crop-soybean",
+        "title": "Soybean calendar",
+        "tags": "soybean kharif madhya pradesh maharashtra rajasthan",
+        "text": "Sow soybean late June to mid-July after 100 mm of rain. Treat seed with Rhizobium culture and sow 3 cm deep. Broad bed furrow planting protects from both waterlogging and dry spells. Harvest in October when 95% pods turn brown.",
+    },
+    {
+        "id": "crop-mustard",
+        "title": "Mustard calendar",
+        "tags": "mustard sarson rapeseed rabi rajasthan haryana uttar pradesh madhya pradesh",
+        "text": "Sow mustard late September to mid-October with 4-5 kg seed per hectare in rows 45 cm apart. Thin to 15 cm at 20 days. One or two irrigations (flowering and pod filling) are enough. Watch for aphids in December-January. Harvest February-March when pods turn yellow.",
+    },
+    {
+        "id": "crop-chickpea",
+        "title": "Chickpea (chana) calendar",
+        "tags": "chickpea chana gram pulses rabi madhya pradesh rajasthan maharashtra karnataka",
+        "text": "Sow chana in October-November on residual moisture, 30 cm row spacing. Nip the tips at 30-40 days to increase branching. Avoid excess irrigation; one light irrigation at pod formation is usually enough. Harvest February-March.",
+    },
+    {
+        "id": "crop-groundnut",
+        "title": "Groundnut calendar",
+        "tags": "groundnut moongphali peanut kharif rabi gujarat andhra tamil nadu karnataka",
+        "text": "Kharif groundnut is sown June-July, rabi/summer groundnut January-February with irrigation. Apply gypsum (400-500 kg/ha) at pegging for bigger, well-filled pods. Keep soil moist but not waterlogged during pegging and pod development. Harvest at 100-120 days.",
+    },
+    {
+        "id": "crop-millets",
+        "title": "Millets (bajra, jowar, ragi)",
+        "tags": "millet bajra jowar ragi sorghum finger millet kharif rajasthan karnataka maharashtra dry rainfed",
+        "text": "Millets suit low-rain, poor soils. Bajra and jowar are sown with the first monsoon rains (June-July), ragi June-August in Karnataka. They need 2-3 times less water than paddy and fetch good prices as nutri-cereals. Many states buy millets at MSP and include them in the public distribution system.",
+    },
+    {
+        "id": "crop-pulses-moong-urad",
+        "title": "Moong and urad",
+        "tags": "moong urad green gram black gram pulses kharif zaid summer",
+        "text": "Moong and urad are 60-75 day crops. Summer (zaid) moong sown in March-April after wheat harvest adds income and fixes nitrogen for the next crop. Kharif sowing is June-July. Pick moong pods in 2-3 rounds as they turn black.",
+    },
+    {
+        "id": "crop-sugarcane",
+        "title": "Sugarcane planting",
+        "tags": "sugarcane ganna uttar pradesh maharashtra karnataka tamil nadu",
+        "text": "Plant sugarcane in spring (February-March) or autumn (October) using 2-3 bud setts treated with fungicide. Trench planting with drip irrigation saves water. Intercrop with onion, garlic or pulses in the first 3 months for extra income.",
+    },
+    {
+        "id": "crop-tomato",
+        "title": "Tomato growing",
+        "tags": "tomato vegetable kitchen garden rabi kharif karnataka maharashtra andhra",
+        "text": "Raise tomato seedlings in a nursery and transplant at 25-30 days, 60x45 cm apart. Main seasons: July-August and October-November planting. Stake plants, water at the base and mulch to prevent leaf diseases. Yellow lower leaves usually mean nitrogen shortage or overwatering.",
+    },
+    {
+        "id": "crop-onion",
+        "title": "Onion growing",
+        "tags": "onion pyaz vegetable rabi kharif maharashtra karnataka madhya pradesh",
+        "text": "Rabi onion: nursery in October-November, transplant December-January, harvest April-May; it stores best. Kharif onion is transplanted July-August. Stop irrigation 10-15 days before harvest and cure bulbs in shade for a week before storage.",
+    },
+    {
+        "id": "crop-potato",
+        "title": "Potato growing",
+        "tags": "potato aloo vegetable rabi uttar pradesh west bengal bihar punjab",
+        "text": "Plant potato in October-November using healthy seed tubers of 30-40 g. Earth up at 25-30 days. Light, frequent irrigation keeps tubers smooth. Watch for late blight in foggy weather in December-January.",
+    },
+    {
+        "id": "kitchen-garden",
+        "title": "Kitchen garden (poshan vatika)",
+        "tags": "kitchen garden nutrition vegetable backyard small farm women",
+        "text": "A 5x5 metre kitchen garden can feed a family year round. Kharif: okra, bottle gourd, beans, chilli. Rabi: spinach, methi, carrot, radish, tomato. Zaid: cucumber, pumpkin, amaranth. Use kitchen waste compost and grey water. Plant papaya, drumstick and lemon on the borders.",
+    },
+    {
+        "id": "season-kharif",
+        "title": "Kharif season checklist",
+        "tags": "kharif monsoon june july season sowing",
+        "text": "Kharif season (June-October): prepare fields and bunds before monsoon, sow after 75-100 mm of rain, keep drains open to prevent waterlogging, and enrol in crop insurance (PMFBY) before the July cut-off.",
+    },
+    {
+        "id": "season-rabi",
+        "title": "Rabi season checklist",
+        "tags": "rabi winter october november season sowing",
+        "text": "Rabi season (October-March): sow on residual monsoon moisture, plan irrigation for critical stages, protect nurseries from frost with light irrigation and smoke on cold nights, and enrol in PMFBY by mid-December.",
+    },
+    {
+        "id": "season-zaid",
+        "title": "Zaid (summer) season",
+        "tags": "zaid summer april may season vegetables fodder",
+        "text": "Zaid season (March-June) suits short crops with irrigation: moong, watermelon, cucumber, bottle gourd and fodder. Irrigate in the evening, mulch to save water and give shade nets to nurseries in peak heat.",
+    },
+
+    # ============================================
+    # PEST AND DISEASE REMEDIES
+    # ============================================
+    {
+        "id": "pest-neem-spray",
+        "title": "Neem oil spray",
+        "tags": "neem spray organic pesticide aphid whitefly jassid caterpillar",
+        "text": "Neem spray: mix 5 ml neem oil and 1-2 ml liquid soap in 1 litre of water, or soak 5 kg crushed neem seed kernels overnight in 100 litres. Spray in the evening every 7-10 days. Works on aphids, whitefly, jassids and young caterpillars.",
+    },
+    {
+        "id": "pest-fall-armyworm",
+        "title": "Fall armyworm in maize",
+        "tags": "fall armyworm maize corn caterpillar pest",
+        "text": "Fall armyworm makes ragged holes in maize whorls with sawdust-like droppings. Put sand mixed with lime or ash into the whorl, spray neem (5%) early, and install 5 pheromone traps per acre. Hand-pick egg masses. Consult the KVK before chemical sprays.",
+    },
+    {
+        "id": "pest-aphids",
+        "title": "Aphids (mahu)",
+        "tags": "aphid mahu mustard wheat vegetable sucking pest",
+        "text": "Aphids cluster on tender shoots and pods, mostly in cloudy cold weather. Spray a strong jet of water, then neem spray. Yellow sticky traps help monitor. Ladybird beetles eat aphids, so avoid broad-spectrum chemicals. In mustard, early sowing (before mid-October) avoids peak attack.",
+    },
+    {
+        "id": "pest-whitefly",
+        "title": "Whitefly",
+        "tags": "whitefly cotton tomato chilli brinjal sucking pest leaf curl virus",
+        "text": "Whitefly sucks sap and spreads leaf curl virus in cotton, tomato and chilli. Use yellow sticky traps (10 per acre), remove weed hosts, spray neem oil or a fermented buttermilk-neem mix, and pull out virus-infected plants early.",
+    },
+    {
+        "id": "pest-stem-borer",
+        "title": "Rice stem borer",
+        "tags": "stem borer rice paddy dead heart white ear pest",
+        "text": "Stem borer causes dead hearts in young paddy and white ears at flowering. Clip seedling tips before transplanting to remove eggs, install pheromone and light traps, and release Trichogramma egg parasitoid cards available at KVKs.",
+    },
+    {
+        "id": "pest-pink-bollworm",
+        "title": "Pink bollworm in cotton",
+        "tags": "pink bollworm cotton boll pest",
+        "text": "Pink bollworm damages cotton bolls from inside. Use pheromone traps, pick and destroy rosette flowers and damaged bolls, avoid extending the crop past January, and do not store cotton seed near the field.",
+    },
+    {
+        "id": "pest-fruit-fly",
+        "title": "Fruit fly in gourds and mango",
+        "tags": "fruit fly gourd cucumber bitter gourd mango pest",
+        "text": "Fruit flies lay eggs in gourds and mango, making fruit rot. Collect and bury fallen fruit, hang methyl eugenol or cue-lure traps, and use a bait of jaggery with a little insecticide on a few plants only.",
+    },
+    {
+        "id": "pest-termites",
+        "title": "Termites (deemak)",
+        "tags": "termite deemak wheat sugarcane groundnut soil pest",
+        "text": "Termites attack roots in dry, sandy soils. Use only well-decomposed manure, irrigate regularly, and mix neem cake (250 kg/ha) into the soil at sowing. Remove old stubble and destroy termite mounds near fields.",
+    },
+    {
+        "id": "disease-early-blight",
+        "title": "Early and late blight",
+        "tags": "blight tomato potato leaf spot fungus disease yellow leaves",
+        "text": "Early blight shows brown rings on older tomato and potato leaves; late blight spreads fast as dark water-soaked patches in foggy weather. Remove infected leaves, avoid overhead watering, rotate crops and spray a copper-based fungicide or sour buttermilk at the first sign.",
+    },
+    {
+        "id": "disease-powdery-mildew",
+        "title": "Powdery mildew",
+        "tags": "powdery mildew pea gourd mango chilli fungus disease white powder",
+        "text": "White powder on leaves of pea, gourds and mango is powdery mildew. Spray wettable sulphur, or a home mix of 1 litre milk in 10 litres of water, every 10 days. Improve spacing and airflow.",
+    },
+
+    # ============================================
+    # SOIL AND WATER
+    # ============================================
+    {
+        "id": "soil-vermicompost",
+        "title": "Vermicompost",
+        "tags": "vermicompost compost organic manure soil fertility earthworm",
+        "text": "Vermicompost: layer cow dung and crop waste in a shaded pit or bed, add earthworms (Eisenia fetida), keep moist. Ready in 45-60 days. Apply 2-3 tonnes per acre; surplus sells at ₹8-10 per kg and is a good income for SHGs.",
+    },
+    {
+        "id": "soil-jeevamrut",
+        "title": "Jeevamrut",
+        "tags": "jeevamrut natural farming organic soil microbes cow dung urine jaggery",
+        "text": "Jeevamrut for one acre: 10 kg cow dung, 10 litres cow urine, 2 kg jaggery, 2 kg pulse flour and a handful of field soil in 200 litres of water. Stir twice daily and use within 7 days, with irrigation water or as a spray.",
+    },
+    {
+        "id": "soil-testing",
+        "title": "Soil testing",
+        "tags": "soil test soil health card fertilizer nutrient",
+        "text": "Test soil every 2-3 years. Take samples from 8-10 spots in a zig-zag at 15 cm depth after harvest, mix, and send 500 g to the nearest soil testing lab or KVK. The Soil Health Card then tells you the exact fertilizer dose, usually saving money.",
+    },
+    {
+        "id": "water-drip",
+        "title": "Drip irrigation",
+        "tags": "drip irrigation water saving vegetable sugarcane subsidy",
+        "text": "Drip irrigation saves 30-50% water and raises vegetable yields. Under PMKSY 'Per Drop More Crop', small and marginal farmers get 55% subsidy (more in some states). Apply through the state horticulture or agriculture department portal.",
+    },
+    {
+        "id": "water-harvesting",
+        "title": "Rainwater harvesting and mulching",
+        "tags": "rainwater harvesting farm pond mulching water conservation dry rainfed",
+        "text": "A farm pond stores monsoon runoff for protective irrigation in dry spells; MGNREGA can fund its digging. Mulching with straw or crop residue cuts evaporation, keeps soil cool and suppresses weeds.",
+    },
+    {
+        "id": "soil-crop-rotation",
+        "title": "Crop rotation",
+        "tags": "crop rotation pulses legumes soil health intercropping",
+        "text": "Rotate cereals with pulses (for example paddy-chickpea or maize-moong) to restore nitrogen and break pest cycles. Intercropping pigeon pea with soybean or cotton spreads risk if one crop fails.",
+    },
+
+    # ============================================
+    # SCHEMES AND MARKETS
+    # ============================================
+    {
+        "id": "scheme-pm-kisan",
+        "title": "PM-KISAN",
+        "tags": "pm kisan scheme income support land owner",
+        "text": "PM-KISAN pays ₹6,000 a year in three installments to land-holding farmer families. Register on pmkisan.gov.in or at a Common Service Centre with Aadhaar, bank account and land records; complete e-KYC to keep receiving installments.",
+    },
+    {
+        "id": "scheme-pmfby",
+        "title": "Crop insurance (PMFBY)",
+        "tags": "pmfby crop insurance fasal bima scheme loss flood drought",
+        "text": "PM Fasal Bima Yojana insures crops against drought, flood, pests and hailstorm. Premium is only 2% for kharif, 1.5% for rabi and 5% for horticulture crops. Enrol through your bank, CSC or the PMFBY app before the season cut-off; report local losses within 72 hours.",
+    },
+    {
+        "id": "scheme-kcc",
+        "title": "Kisan Credit Card",
+        "tags": "kisan credit card kcc loan credit scheme",
+        "text": "Kisan Credit Card gives crop loans up to ₹3 lakh at 7% interest, falling to 4% with prompt repayment. Apply at any bank with land records and ID. Tenant farmers and SHG members can also get KCC through joint liability groups.",
+    },
+    {
+        "id": "scheme-soil-health-card",
+        "title": "Soil Health Card scheme",
+        "tags": "soil health card scheme free soil test",
+        "text": "The Soil Health Card scheme gives free soil testing and a card with crop-wise fertilizer recommendations. Ask the village agriculture officer or KVK when sampling is planned in your village.",
+    },
+    {
+        "id": "scheme-lakhpati-didi",
+        "title": "SHG support for women farmers",
+        "tags": "shg self help group women nrlm lakhpati didi drone didi training",
+        "text": "Women in NRLM self-help groups can get revolving funds, bank loans and training as Krishi Sakhis or Pashu Sakhis. Under Lakhpati Didi and Namo Drone Didi, SHG women are trained for livelihoods and agri-drone services.",
+    },
+    {
+        "id": "market-enam",
+        "title": "Selling produce (e-NAM and FPOs)",
+        "tags": "market mandi price sell e-nam fpo farmer producer organisation",
+        "text": "Check mandi prices on the e-NAM app or Agmarknet before selling. Joining a Farmer Producer Organisation (FPO) gives bulk buying of inputs and better selling prices. Grade, clean and dry produce to get a higher rate.",
+    },
+    {
+        "id": "livestock-poultry-dairy",
+        "title": "Backyard poultry and dairy",
+        "tags": "livestock poultry dairy goat cow buffalo income animal",
+        "text": "Backyard poultry (Kadaknath, Vanaraja, Gramapriya) needs little space and gives eggs and meat income. For dairy, give mineral mixture daily, clean water, and vaccinate for FMD and HS. Goats are low-cost 'ATMs' for small families. Consult the veterinary centre for sick animals.",
+    },
+]
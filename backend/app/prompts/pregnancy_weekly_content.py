@@ -0,0 +1,139 @@
+"""
+Pregnancy Week-by-Week Content
+Reviewed answers for the questions that only depend on the week of
+pregnancy: how the baby is growing, what to eat, warning signs and which
+checkups are due. Served directly by the Pregnancy Care Bot for those
+questions (see app/services/pregnancy_content.py); everything else goes
+to the model.
+
+Bump CONTENT_VERSION whenever the text changes - it is returned with
+every answer served from this table.
+"""
+
+CONTENT_VERSION = "2026.10.2"
+
+# Week -> (baby development, size comparison or None before conception)
+BABY_DEVELOPMENT = {
+    1: ("Your body is getting ready. Week 1 is counted from the first day of your last period, before the baby is conceived.", None),
+    2: ("Ovulation happens around the end of this week, and the egg can meet the sperm.", None),
+    3: ("The fertilised egg divides again and again and travels to the womb.", "a tiny cluster of cells"),
+    4: ("The ball of cells settles into the lining of the womb and the placenta starts to form.", "a poppy seed"),
+    5: ("The heart, brain and spinal cord begin to form. A tiny heart starts beating.", "a sesame seed"),
+    6: ("Small buds appear that will become arms and legs. The face is starting to take shape.", "a lentil (masoor dal)"),
+    7: ("The brain is growing fast and the baby is making about 100 new brain cells every minute.", "a blueberry"),
+    8: ("Fingers and toes are forming and the baby starts making small movements you cannot feel yet.", "a rajma bean"),
+    9: ("The heart now has four chambers and tiny muscles are forming.", "a grape"),
+    10: ("All the important organs are in place and will now grow and mature. Tiny nails begin to form.", "a kumquat"),
+    11: ("The baby can open and close fists, and the bones are starting to harden.", "a fig (anjeer)"),
+    12: ("Reflexes are developing - the baby can curl fingers and toes. The risk of miscarriage drops a lot after this week.", "a lime (nimbu)"),
+    13: ("Vocal cords are forming and the intestines move from the cord into the baby's tummy.", "a pea pod"),
+    14: ("The baby can make faces - squint, frown and even suck a thumb.", "a lemon"),
+    15: ("Bones are getting stronger and the baby can sense light through closed eyelids.", "an apple"),
+    16: ("The eyes move and the baby's heart pumps about 25 litres of blood a day.", "an avocado"),
+    17: ("Fat starts to build up under the skin, which keeps the baby warm after birth.", "a pomegranate (anar)"),
+    18: ("The baby can hear sounds now, including your heartbeat and your voice. Many mothers feel the first flutters around now.", "a sweet potato (shakarkandi)"),
+    19: ("A creamy coating (vernix) forms on the skin to protect it inside the womb.", "a mango"),
+    20: ("Halfway there! The baby swallows, kicks and has regular times of sleeping and waking.", "a banana"),
+    21: ("Movements get stronger and more regular. The baby's taste buds are working.", "a carrot"),
+    22: ("Eyebrows and eyelids are formed and the sense of touch is developing.", "a papaya"),
+    23: ("The lungs are practising breathing movements and the baby can hear loud sounds outside.", "a large mango"),
+    24: ("The lungs start making the substance that will help them open after birth.", "an ear of corn (bhutta)"),
+    25: ("The baby responds to your voice and touch and is gaining weight steadily.", "a cauliflower (gobhi)"),
+    26: ("The eyes begin to open and the baby may react to bright light on your tummy.", "a lettuce head"),
+    27: ("The brain is very active and the baby sleeps and wakes at regular times.", "a cabbage (patta gobhi)"),
+    28: ("The baby can blink, dream and turn towards light. From now on, keep track of the baby's kicks every day.", "a brinjal (baingan)"),
+    29: ("Muscles and lungs keep maturing and the baby's kicks and stretches become strong.", "a butternut squash"),
+    30: ("The baby is gaining about 200 grams a week and the brain is growing fast.", "a large cucumber"),
+    31: ("All five senses are working. The baby turns its head from side to side.", "a coconut"),
+    32: ("Toenails and fingernails have grown and the baby practises breathing, sucking and swallowing.", "a bottle gourd (lauki)"),
+    33: ("The bones are hardening, except the skull, which stays soft to make birth easier.", "a pineapple"),
+    34: ("The baby's nervous system and lungs are nearly mature.", "a cantaloupe (kharbooja)"),
+    35: ("There is less room now, so you may feel more rolls and stretches than kicks.", "a honeydew melon"),
+    36: ("Most babies turn head-down around now, getting ready for birth.", "a large papaya"),
+    37: ("The baby is considered early term and is practising for life outside - breathing, sucking and gripping.", "a bunch of bananas"),
+    38: ("The baby is storing fat and the organs are ready to work on their own.", "a pumpkin (kaddu)"),
+    39: ("The baby is full term. Brain and lungs keep maturing until birth.", "a small watermelon"),
+    40: ("Your due week! The baby is ready to meet you. Many healthy babies come a little before or after this date.", "a watermelon (tarbooz)"),
+}
+
+# Trimester -> what to eat, adjusted in WEEK_NUTRITION_NOTES for particular weeks
+TRIMESTER_NUTRITION = {
+    1: "Eat small, frequent meals - dry toast, khakhra or a few biscuits before getting up helps with nausea. Take folic acid every day and eat folate-rich foods: spinach, methi, dal, chana, oranges. Drink plenty of water, nimbu pani or coconut water. Avoid raw or undercooked eggs and meat, unpasteurised milk and too much tea or coffee.",
+    2: "Eat 3 meals and 2-3 healthy snacks. Take the iron and calcium tablets given at your health centre (iron after meals, not with tea or milk). Iron: green leafy vegetables, jaggery (gur), dates, ragi, rajma. Calcium: milk, curd, paneer, til (sesame). Protein at every meal: dal, eggs, chana, paneer, soya. Eat vitamin C foods like amla, guava or orange with iron-rich meals.",
+    3: "Your stomach has less room, so eat smaller meals more often. Keep taking iron and calcium tablets. Choose easy-to-digest foods - khichdi, dalia, curd rice, fruits. Eat fibre (whole grains, fruits, vegetables) and drink 8-10 glasses of water to avoid constipation. Keep salt and fried food moderate if you have swelling.",
+}
+
+WEEK_NUTRITION_NOTES = {
+    4: "Folic acid is most important in these early weeks, while the baby's brain and spine are forming.",
+    8: "If nausea is strong, ginger, jeera water or dry snacks can help - try not to skip meals completely.",
+    14: "Iron and calcium tablets usually start around now - ask at your health centre or anganwadi if you have not received them.",
+    24: "Cut down on sweets and sugary drinks before your sugar test.",
+    28: "Your baby's brain is growing fast - eggs, walnuts, flaxseed (alsi) and fish (well cooked) are good choices.",
+    36: "Eating a few dates a day in the last weeks is a good, traditional source of energy and iron.",
+}
+
+# Trimester -> warning signs that need a doctor or hospital straight away
+TRIMESTER_WARNING_SIGNS = {
+    1: "bleeding or spotting from the vagina, severe pain in the lower tummy (especially on one side), vomiting so much that you cannot keep water down, high fever, fainting or dizziness",
+    2: "bleeding from the vagina, severe tummy pain or cramps, leaking water, high fever, severe headache or blurred vision, sudden swelling of face or hands, burning or pain while passing urine",
+    3: "bleeding from the vagina, water breaking or leaking fluid, the baby moving less than usual, severe headache, blurred vision or fits, sudden swelling of face and hands, regular painful contractions before 37 weeks, high fever",
+}
+
+# Week -> checkups, tests and vaccines that are due
+WEEK_CHECKUPS = {
+    4: "Confirm the pregnancy and register at your nearest health centre or with your ASHA worker - this gets you the Mother and Child Protection card and free checkups.",
+    6: "Register the pregnancy at your health centre if you have not yet. The first checkup includes blood tests (haemoglobin, blood group, sugar, HIV, syphilis), urine test and blood pressure.",
+    8: "Your first antenatal checkup should happen by week 12. Ask about blood and urine tests if they are not done yet.",
+    11: "The first scan (NT scan) is done between week 11 and 13 if your doctor advises it.",
+    12: "Finish your first antenatal checkup by this week if you have not yet.",
+    16: "The first Td (tetanus) injection is usually given in the early second trimester, with a second dose 4 weeks later.",
+    18: "The detailed anomaly scan is done between week 18 and 20. Ask about it at your health centre - it is free under PMSMA on the 9th of every month.",
+    20: "Second antenatal checkup is due around now: weight, blood pressure, haemoglobin and the baby's growth.",
+    24: "The sugar test (glucose tolerance test) is done between week 24 and 28.",
+    26: "If you were not tested for sugar yet, ask for the test at your next checkup.",
+    28: "Third antenatal checkup: blood pressure, haemoglobin and the baby's growth. Start counting kicks - at least 10 movements in 12 hours.",
+    32: "Checkups become more frequent now - every 2 weeks is common. Plan which hospital you will go to for delivery.",
+    34: "Fourth antenatal checkup is due between week 34 and 36: the doctor checks the baby's position. Keep your hospital bag and documents ready.",
+    36: "Weekly checkups from now. Know your nearest hospital and save the 102/108 ambulance number.",
+    40: "If labour has not started by your due date, see your doctor - they will check on you and the baby.",
+}
+
+
+def trimester_of(week: int) -> int:
+    """Trimester number (1-3) for a pregnancy week"""
+    if week <= 12:
+        return 1
+    if week <= 26:
+        return 2
+    return 3
+
+
+def _last_at_or_before(notes: dict, week: int, within: int) -> str:
+    # Notes stay relevant for a few weeks after the week they are listed under
+    for earlier in range(week, max(0, week - within), -1):
+        if earlier in notes:
+            return notes[earlier]
+    return ""
+
+
+def _build_table() -> dict:
+    table = {}
+    for week, (baby, size) in BABY_DEVELOPMENT.items():
+        trimester = trimester_of(week)
+        nutrition = TRIMESTER_NUTRITION[trimester]
+        note = _last_at_or_before(WEEK_NUTRITION_NOTES, week, within=4)
+        table[week] = {
+            "week": week,
+            "trimester": trimester,
+            "development": baby,
+            "size": size,
+            "nutrition": f"{nutrition} {note}".strip(),
+            "warning_signs": TRIMESTER_WARNING_SIGNS[trimester],
+            "checkups": _last_at_or_before(WEEK_CHECKUPS, week, within=4)
+                        or "No special test this week - keep going for your regular antenatal checkups.",
+        }
+    return table
+
+
+# Week 1-40 -> rendered sections, built once at import
+WEEKLY_CONTENT = _build_table()
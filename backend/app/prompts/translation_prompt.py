@@ -0,0 +1,36 @@
+"""
+Translation Prompt
+
+Health bot answers are generated once in English and translated into the
+user's language; see AIService.translate.
+"""
+
+# Languages the apps offer: code -> name used in the prompt
+SUPPORTED_LANGUAGES = {
+    "en": "English",
+    "hi": "Hindi",
+    "te": "Telugu",
+}
+
+DEFAULT_LANGUAGE = "en"
+
+TRANSLATION_SYSTEM_PROMPT = """You translate messages from Sakhi, a caring health assistant for rural women in India, into {language}.
+
+RULES:
+- Translate the whole message faithfully; do not add, drop or summarize anything
+- Keep the same warm, friendly tone and simple everyday words, the way people speak at home
+- Use the {language} script, but keep common English health words people already use (period, pad, BP, sugar, doctor) where that is more natural
+- Keep emojis, numbers, dates, bullet points and line breaks as they are
+- Reply with the translation only, no notes or explanations"""
+
+
+# The web app sends language names ("Hindi"), the API documents codes ("hi")
+_LANGUAGE_ALIASES = {
+    **{code: code for code in SUPPORTED_LANGUAGES},
+    **{name.lower(): code for code, name in SUPPORTED_LANGUAGES.items()},
+}
+
+
+def language_code(value: str) -> str:
+    """Supported language code for a request value (code or name), English when unknown"""
+    return _LANGUAGE_ALIASES.get((value or DEFAULT_LANGUAGE).strip().lower(), DEFAULT_LANGUAGE)
@@ -11,6 +11,7 @@ from jose import JWTError, jwt
 from datetime import datetime, timedelta
 from app.models.user import UserCreate, UserLogin, UserResponse, Token, TokenData, UserBase
 from app.config.settings import settings
+from app.services.database import get_database, get_db
 from typing import Optional
 
 # Create router
@@ -21,14 +22,7 @@ pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 # HTTP Bearer token security
 security = HTTPBearer()
-
-# MongoDB database (will be initialized in main.py)
-db = None
-
-def init_db(database):
-    """Initialize database connection"""
-    global db
-    db = database
+optional_security = HTTPBearer(auto_error=False)
 
 # ============================================
 # HELPER FUNCTIONS
@@ -55,16 +49,16 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     encoded_jwt = jwt.encode(to_encode, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
     return encoded_jwt
 
-def get_user_by_phone(phone: str):
+async def get_user_by_phone(db, phone: str):
     """Get user from database by phone number"""
-    return db.users.find_one({"phone": phone})
+    return await db.users.find_one({"phone": phone})
 
-def get_user_by_id(user_id: str):
+async def get_user_by_id(db, user_id: str):
     """Get user from database by ID"""
     from bson import ObjectId
-    return db.users.find_one({"_id": ObjectId(user_id)})
+    return await db.users.find_one({"_id": ObjectId(user_id)})
 
-async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
+async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security), db=Depends(get_db)):
     """Get current authenticated user from JWT token"""
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -84,18 +78,36 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
     except JWTError:
         raise credentials_exception
     
-    user = get_user_by_id(token_data.user_id)
+    user = await get_user_by_id(db, token_data.user_id)
     if user is None:
         raise credentials_exception
     
     return user
 
+def user_id_from_token(token: str) -> Optional[str]:
+    """User id in a valid JWT, or None (for Socket.IO, which has no HTTP dependencies)"""
+    try:
+        payload = jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
+    except JWTError:
+        return None
+    return payload.get("sub")
+
+async def get_optional_user(credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security)):
+    """Current user when a valid token is sent, otherwise None (for endpoints that also work anonymously)"""
+    db = get_database()
+    if credentials is None or db is None:
+        return None
+    try:
+        return await get_current_user(credentials, db)
+    except HTTPException:
+        return None
+
 # ============================================
 # AUTHENTICATION ENDPOINTS
 # ============================================
 
 @router.post("/signup", response_model=Token, status_code=status.HTTP_201_CREATED)
-async def signup(user: UserCreate):
+async def signup(user: UserCreate, db=Depends(get_db)):
     """
     Register a new user
     
@@ -103,7 +115,7 @@ async def signup(user: UserCreate):
     """
     try:
         # Check if user already exists
-        existing_user = get_user_by_phone(user.phone)
+        existing_user = await get_user_by_phone(db, user.phone)
         if existing_user:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -119,14 +131,14 @@ async def signup(user: UserCreate):
         user_dict["created_at"] = datetime.utcnow()
         
         # Insert into database
-        result = db.users.insert_one(user_dict)
+        result = await db.users.insert_one(user_dict)
         user_id = str(result.inserted_id)
         
         # Create access token
         access_token = create_access_token(data={"sub": user_id})
         
         # Get created user
-        created_user = get_user_by_id(user_id)
+        created_user = await get_user_by_id(db, user_id)
         created_user["id"] = str(created_user.pop("_id"))
         created_user.pop("hashed_password", None)
         
@@ -144,7 +156,7 @@ async def signup(user: UserCreate):
         )
 
 @router.post("/login", response_model=Token)
-async def login(credentials: UserLogin):
+async def login(credentials: UserLogin, db=Depends(get_db)):
     """
     User login
     
@@ -152,7 +164,7 @@ async def login(credentials: UserLogin):
     """
     try:
         # Get user from database
-        user = get_user_by_phone(credentials.phone)
+        user = await get_user_by_phone(db, credentials.phone)
         
         if not user:
             raise HTTPException(
@@ -202,7 +214,8 @@ async def get_current_user_info(current_user: dict = Depends(get_current_user)):
 @router.put("/me", response_model=UserResponse)
 async def update_current_user(
     update_data: UserBase,
-    current_user: dict = Depends(get_current_user)
+    current_user: dict = Depends(get_current_user),
+    db=Depends(get_db)
 ):
     """
     Update current user profile
@@ -217,13 +230,13 @@ async def update_current_user(
         update_dict["updated_at"] = datetime.utcnow()
         
         # Update user in database
-        db.users.update_one(
+        await db.users.update_one(
             {"_id": current_user["_id"]},
             {"$set": update_dict}
         )
         
         # Get updated user
-        updated_user = get_user_by_id(str(current_user["_id"]))
+        updated_user = await get_user_by_id(db, str(current_user["_id"]))
         updated_user["id"] = str(updated_user.pop("_id"))
         updated_user.pop("hashed_password", None)
         
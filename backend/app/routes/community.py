@@ -4,44 +4,40 @@ Community API Routes
 Handles community posts, discussions, and chat features.
 """
 
-from fastapi import APIRouter, HTTPException, status
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from typing import Optional
 from datetime import datetime
 from bson import ObjectId
-from app.models.community import PostCreate, PostResponse, Comment
+from app.models.community import PostCreate, PostResponse, PostPage, Comment
+from app.config.settings import settings
+from app.services.database import get_db, get_optional_db
+from app.services.pagination import fetch_page
 from app.socket_events import sio  # Import SocketIO instance
 
 # Create router
 router = APIRouter(prefix="/api/community", tags=["Community"])
 
-# MongoDB database (will be initialized in main.py)
-db = None
-
-def init_db(database):
-    """Initialize database connection"""
-    global db
-    db = database
-
-def get_posts_collection():
-    if db is not None:
-        return db.posts
-    return None
-
 # ============================================
 # API ENDPOINTS
 # ============================================
 
-@router.get("/posts", response_model=List[PostResponse])
-async def get_posts():
-    """Get all community posts"""
-    collection = get_posts_collection()
-    if collection is None:
-        return [] # Return empty if DB not ready
-        
-    posts = []
-    cursor = collection.find().sort("created_at", -1).limit(50)
+@router.get("/posts", response_model=PostPage)
+async def get_posts(
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
+    db=Depends(get_optional_db)
+):
+    """Get community posts, newest first, one page at a time"""
+    if db is None:
+        return PostPage(items=[]) # Return empty if DB not ready
     
-    for doc in cursor:
+    try:
+        docs, next_cursor = await fetch_page(db.posts, {}, cursor, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    posts = []
+    for doc in docs:
         posts.append(PostResponse(
             id=str(doc["_id"]),
             user_name=doc.get("user_name", "Anonymous"),
@@ -50,24 +46,20 @@ async def get_posts():
             category=doc.get("category", "General"),
             likes=doc.get("likes", 0),
             comments=[Comment(**c) for c in doc.get("comments", [])],
-            created_at=doc.get("created_at", datetime.utcnow())
+            created_at=doc["created_at"]
         ))
     
-    return posts
+    return PostPage(items=posts, next_cursor=next_cursor)
 
 @router.post("/posts", response_model=PostResponse, status_code=status.HTTP_201_CREATED)
-async def create_post(post: PostCreate):
+async def create_post(post: PostCreate, db=Depends(get_db)):
     """Create a new community post"""
-    collection = get_posts_collection()
-    if collection is None:
-         raise HTTPException(status_code=503, detail="Database unavailable")
-
     new_post = post.dict()
     new_post["created_at"] = datetime.utcnow()
     new_post["likes"] = 0
     new_post["comments"] = []
     
-    result = collection.insert_one(new_post)
+    result = await db.posts.insert_one(new_post)
     
     # Broadcast new post via WebSocket
     try:
@@ -86,12 +78,8 @@ async def create_post(post: PostCreate):
     )
 
 @router.post("/posts/{post_id}/comments", response_model=PostResponse)
-async def add_comment(post_id: str, comment: Comment):
+async def add_comment(post_id: str, comment: Comment, db=Depends(get_db)):
     """Add a comment to a post"""
-    collection = get_posts_collection()
-    if collection is None:
-         raise HTTPException(status_code=503, detail="Database unavailable")
-         
     try:
         oid = ObjectId(post_id)
     except:
@@ -99,7 +87,7 @@ async def add_comment(post_id: str, comment: Comment):
 
     comment_dict = comment.dict()
     
-    result = collection.find_one_and_update(
+    result = await db.posts.find_one_and_update(
         {"_id": oid},
         {"$push": {"comments": comment_dict}},
         return_document=True
@@ -120,18 +108,14 @@ async def add_comment(post_id: str, comment: Comment):
     )
 
 @router.post("/posts/{post_id}/like", response_model=PostResponse)
-async def like_post(post_id: str):
+async def like_post(post_id: str, db=Depends(get_db)):
     """Like a post"""
-    collection = get_posts_collection()
-    if collection is None:
-         raise HTTPException(status_code=503, detail="Database unavailable")
-         
     try:
         oid = ObjectId(post_id)
     except:
         raise HTTPException(status_code=400, detail="Invalid post ID")
         
-    result = collection.find_one_and_update(
+    result = await db.posts.find_one_and_update(
         {"_id": oid},
         {"$inc": {"likes": 1}},
         return_document=True
@@ -0,0 +1,131 @@
+"""
+Cycle Tracking API Routes
+
+Stores each user's period history and serves personalised predictions
+for the next few cycles, with confidence windows.
+"""
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from app.models.schemas import (
+    PeriodLogRequest, CycleHistoryResponse, CyclePredictionResponse, CycleSummary
+)
+from app.routes.auth import get_current_user
+from app.services.cycle_history import CycleHistoryConflict, CycleHistoryStore, parse_date
+from app.services.database import get_database, get_db
+from app.services.cycle_stats import CycleStats, cycle_lengths, expected_length, predict_cycles
+from datetime import date
+from typing import List, Optional
+
+# Create router
+router = APIRouter(prefix="/api/cycles", tags=["Cycle Tracking"])
+
+async def get_store(db=Depends(get_db)) -> CycleHistoryStore:
+    """FastAPI dependency: the cycle history store"""
+    return CycleHistoryStore(db.cycle_histories)
+
+async def personal_cycle_length(user_id: str) -> Optional[int]:
+    """
+    The user's expected cycle length for the period bot
+
+    Returns:
+        Days, or None when the user has no recorded cycles (or no database)
+    """
+    db = get_database()
+    if db is None:
+        return None
+    try:
+        stats = await CycleHistoryStore(db.cycle_histories).get_stats(user_id)
+    except Exception as e:
+        print(f"⚠️  Could not load cycle stats: {e}")
+        return None
+    if stats is None or stats.n == 0:
+        return None
+    return round(expected_length(stats)[0])
+
+def _parse(value: str) -> date:
+    try:
+        return parse_date(value)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid date format. Use YYYY-MM-DD"
+        )
+
+def _history_response(starts: List[date], stats: CycleStats) -> CycleHistoryResponse:
+    return CycleHistoryResponse(
+        starts=[start.isoformat() for start in starts],
+        lengths=cycle_lengths(starts),
+        summary=CycleSummary(**stats.summary())
+    )
+
+# ============================================
+# API ENDPOINTS
+# ============================================
+
+@router.post("/periods", response_model=CycleHistoryResponse)
+async def log_period(
+    request: PeriodLogRequest,
+    current_user: dict = Depends(get_current_user),
+    store: CycleHistoryStore = Depends(get_store)
+):
+    """
+    Log a period start
+
+    Logging the same date twice is a no-op. Dates in the future are rejected.
+    """
+    start = _parse(request.start_date)
+    if start > date.today():
+        raise HTTPException(status_code=400, detail="Period start cannot be in the future")
+
+    try:
+        starts, stats = await store.record_start(str(current_user["_id"]), start)
+    except CycleHistoryConflict:
+        raise HTTPException(status_code=409, detail="Your cycle history is being updated elsewhere, please try again")
+    return _history_response(starts, stats)
+
+@router.delete("/periods/{start_date}", response_model=CycleHistoryResponse)
+async def delete_period(
+    start_date: str,
+    current_user: dict = Depends(get_current_user),
+    store: CycleHistoryStore = Depends(get_store)
+):
+    """Remove a wrongly logged period start"""
+    try:
+        starts, stats = await store.remove_start(str(current_user["_id"]), _parse(start_date))
+    except CycleHistoryConflict:
+        raise HTTPException(status_code=409, detail="Your cycle history is being updated elsewhere, please try again")
+    return _history_response(starts, stats)
+
+@router.get("/history", response_model=CycleHistoryResponse)
+async def get_history(
+    current_user: dict = Depends(get_current_user),
+    store: CycleHistoryStore = Depends(get_store)
+):
+    """Logged period starts, cycle lengths and summary statistics"""
+    starts, stats = await store.get(str(current_user["_id"]))
+    return _history_response(starts, stats)
+
+@router.get("/prediction", response_model=CyclePredictionResponse)
+async def get_prediction(
+    cycles: int = Query(3, ge=1, le=12, description="Number of upcoming cycles"),
+    confidence: float = Query(0.8, gt=0.5, lt=1.0, description="Probability each window holds the start"),
+    current_user: dict = Depends(get_current_user),
+    store: CycleHistoryStore = Depends(get_store)
+):
+    """
+    Predicted windows for the next periods
+
+    Until a few cycles are logged, predictions lean on the default cycle
+    length; they move towards the user's own pattern as history builds up.
+    """
+    starts, stats = await store.get(str(current_user["_id"]))
+    if not starts:
+        raise HTTPException(status_code=404, detail="Log at least one period start first")
+
+    return CyclePredictionResponse(
+        last_period_start=starts[-1],
+        personalized=stats.n > 0,
+        confidence=confidence,
+        summary=CycleSummary(**stats.summary()),
+        predictions=predict_cycles(stats, starts[-1], cycles, confidence)
+    )
@@ -5,12 +5,22 @@ Handles Period Care Bot and Pregnancy Care Bot endpoints
 Includes date calculations and AI integration
 """
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from app.models.schemas import PeriodChatRequest, PregnancyChatRequest, ChatResponse
-from app.services.ai_service import AIService
+from app.services.ai_service import AIService, llm_breaker
+from app.services.admission import LLMOverloadedError
+from app.services.streaming import ChatEvent, chat_events, single_chunk, sse_response
+from app.services.conversation_store import new_session_id
+from app.services import pregnancy_content
+from app.services.health_calendar import (
+    CachedCalendar, cycle_phase, estimated_due_date, period_calendar, pregnancy_calendar, trimester_label
+)
+from app.routes.auth import get_optional_user
+from app.routes.cycles import personal_cycle_length
+from app.services.pregnancy_content import ContentAnswer
 from app.config.settings import settings
 from datetime import datetime, timedelta
-from typing import Dict
+from typing import AsyncIterator, Dict, Optional, Tuple
 
 # Create router
 router = APIRouter(prefix="/api/health-bots", tags=["Health Bots"])
@@ -48,14 +58,7 @@ def calculate_next_period(last_period_date_str: str, cycle_length: int = 28) ->
         days_until = (next_period_date - today).days
         
         # Determine cycle phase
-        if days_since < 5:
-            phase = "Menstrual Phase"
-        elif days_since < 14:
-            phase = "Follicular Phase"
-        elif days_since < 16:
-            phase = "Ovulation Phase"
-        else:
-            phase = "Luteal Phase"
+        phase = cycle_phase(days_since, cycle_length)
         
         return {
             "next_period_date": next_period_date.strftime("%Y-%m-%d"),
@@ -96,17 +99,11 @@ def calculate_pregnancy_info(confirmation_date_str: str) -> Dict:
             weeks_pregnant = 40
         
         # Determine trimester
-        if weeks_pregnant <= 12:
-            trimester = "First Trimester (Weeks 1-12)"
-        elif weeks_pregnant <= 26:
-            trimester = "Second Trimester (Weeks 13-26)"
-        else:
-            trimester = "Third Trimester (Weeks 27-40)"
+        trimester = trimester_label(weeks_pregnant)
         
         # Calculate due date (40 weeks from estimated conception)
         # Assuming confirmation was at week 4, add 36 more weeks
-        estimated_conception = confirmation_date - timedelta(weeks=4)
-        due_date = estimated_conception + timedelta(weeks=40)
+        due_date = datetime.combine(estimated_due_date(confirmation_date.date()), datetime.min.time())
         
         # Calculate days until due date
         days_until_due = (due_date - today).days
@@ -125,12 +122,120 @@ def calculate_pregnancy_info(confirmation_date_str: str) -> Dict:
             detail="Invalid date format. Use YYYY-MM-DD"
         )
 
+def build_period_prediction(request: PeriodChatRequest, cycle_length: Optional[int] = None) -> Tuple[Dict, str]:
+    """
+    Calculate cycle information and prediction text for a period chat request
+    
+    Args:
+        request: The chat request
+        cycle_length: The user's own cycle length from her logged history, if any
+    
+    Returns:
+        Tuple of (period_info, prediction_text)
+    """
+    period_info = calculate_next_period(
+        request.last_period_date,
+        cycle_length or settings.DEFAULT_CYCLE_LENGTH
+    )
+    period_info["cycle_length"] = cycle_length or settings.DEFAULT_CYCLE_LENGTH
+    period_info["personalized"] = cycle_length is not None
+    
+    prediction_text = f"Next period expected: {period_info['next_period_date']}"
+    if period_info['days_until_next'] > 0:
+        prediction_text += f" (in {period_info['days_until_next']} days)"
+    else:
+        prediction_text += " (period may have started or is due)"
+    
+    return period_info, prediction_text
+
+def build_pregnancy_prediction(request: PregnancyChatRequest) -> Tuple[Dict, str]:
+    """
+    Calculate pregnancy information and prediction text for a pregnancy chat request
+    
+    Returns:
+        Tuple of (pregnancy_info, prediction_text)
+    """
+    pregnancy_info = calculate_pregnancy_info(request.pregnancy_start_date)
+    
+    prediction_text = f"Week {pregnancy_info['weeks_pregnant']} - {pregnancy_info['trimester']}"
+    if pregnancy_info['days_until_due'] > 0:
+        prediction_text += f" | Due date: {pregnancy_info['due_date']} ({pregnancy_info['days_until_due']} days)"
+    
+    return pregnancy_info, prediction_text
+
+def answer_from_content(request: PregnancyChatRequest, pregnancy_info: Dict) -> Optional[ContentAnswer]:
+    """
+    Answer a stock week-specific question from the pregnancy content table
+    
+    The table is in English; callers translate the answer like a model answer.
+    
+    Returns:
+        ContentAnswer, or None when the model should answer
+    """
+    if not settings.PREGNANCY_CONTENT_ENABLED:
+        return None
+    return pregnancy_content.answer(request.user_message, pregnancy_info["weeks_pregnant"])
+
+def period_chat_events(request: PeriodChatRequest, cycle_length: Optional[int] = None) -> AsyncIterator[ChatEvent]:
+    """
+    Build the streaming event sequence for a period chat request
+    
+    Dates are validated eagerly so bad input raises before streaming starts.
+    """
+    period_info, prediction_text = build_period_prediction(request, cycle_length)
+    session_id = request.session_id or new_session_id()
+    
+    chunks = ai_service.stream_period_chat_response(
+        user_message=request.user_message,
+        age=request.age,
+        last_period_date=request.last_period_date,
+        next_period_prediction=period_info["next_period_date"],
+        days_since=period_info["days_since_last"],
+        use_cache=request.use_cache,
+        session_id=session_id,
+        history=request.history,
+        profile="period_chat",
+        cycle_length=period_info["cycle_length"],
+        language=request.language
+    )
+    return chat_events(chunks, prediction_text, period_info, session_id)
+
+def pregnancy_chat_events(request: PregnancyChatRequest) -> AsyncIterator[ChatEvent]:
+    """
+    Build the streaming event sequence for a pregnancy chat request
+    
+    Dates are validated eagerly so bad input raises before streaming starts.
+    """
+    pregnancy_info, prediction_text = build_pregnancy_prediction(request)
+    session_id = request.session_id or new_session_id()
+    
+    content = answer_from_content(request, pregnancy_info)
+    if content is not None:
+        ai_service.remember_exchange("pregnancy", session_id, request.user_message, content.text, request.history)
+        additional_info = {**pregnancy_info, "content_version": content.version}
+        chunks = ai_service.stream_translation(single_chunk(content.text), request.language, "pregnancy")
+        return chat_events(chunks, prediction_text, additional_info, session_id, source="content")
+    
+    chunks = ai_service.stream_pregnancy_chat_response(
+        user_message=request.user_message,
+        confirmation_date=request.pregnancy_start_date,
+        weeks_pregnant=pregnancy_info["weeks_pregnant"],
+        trimester=pregnancy_info["trimester"],
+        due_date=pregnancy_info["due_date"],
+        use_cache=request.use_cache,
+        session_id=session_id,
+        history=request.history,
+        profile="pregnancy_chat",
+        language=request.language
+    )
+    return chat_events(chunks, prediction_text, pregnancy_info, session_id)
+
 # ============================================
 # PERIOD CARE BOT ENDPOINT
 # ============================================
 
 @router.post("/period-chat", response_model=ChatResponse)
-async def period_chat(request: PeriodChatRequest):
+async def period_chat(request: PeriodChatRequest, current_user: Optional[dict] = Depends(get_optional_user)):
     """
     Period Care Bot Endpoint
     
@@ -139,13 +244,20 @@ async def period_chat(request: PeriodChatRequest):
     - Symptom management advice
     - Nutrition tips
     - Emotional support
+    
+    Send the returned session_id with the next message to continue the
+    conversation; earlier turns are kept on the server. For a signed-in
+    user with logged cycles (/api/cycles), the prediction uses her own
+    cycle length.
+    
+    With language "hi" or "te" the answer is generated in English and
+    translated; both are cached, so a repeated question is not regenerated.
     """
     try:
         # Calculate next period and cycle information
-        period_info = calculate_next_period(
-            request.last_period_date,
-            settings.DEFAULT_CYCLE_LENGTH
-        )
+        cycle_length = await personal_cycle_length(str(current_user["_id"])) if current_user else None
+        period_info, prediction_text = build_period_prediction(request, cycle_length)
+        session_id = request.session_id or new_session_id()
         
         # Get AI response with context
         ai_response = await ai_service.get_period_chat_response(
@@ -153,23 +265,23 @@ async def period_chat(request: PeriodChatRequest):
             age=request.age,
             last_period_date=request.last_period_date,
             next_period_prediction=period_info["next_period_date"],
-            days_since=period_info["days_since_last"]
+            days_since=period_info["days_since_last"],
+            use_cache=request.use_cache,
+            session_id=session_id,
+            history=request.history,
+            profile="period_chat",
+            cycle_length=period_info["cycle_length"],
+            language=request.language
         )
         
-        # Build response
-        prediction_text = f"Next period expected: {period_info['next_period_date']}"
-        if period_info['days_until_next'] > 0:
-            prediction_text += f" (in {period_info['days_until_next']} days)"
-        else:
-            prediction_text += " (period may have started or is due)"
-        
         return ChatResponse(
             response=ai_response,
             prediction=prediction_text,
-            additional_info=period_info
+            additional_info=period_info,
+            session_id=session_id
         )
     
-    except HTTPException:
+    except (HTTPException, LLMOverloadedError):
         raise
     except Exception as e:
         raise HTTPException(
@@ -177,6 +289,18 @@ async def period_chat(request: PeriodChatRequest):
             detail=f"Failed to process period chat request: {str(e)}"
         )
 
+@router.post("/period-chat/stream")
+async def period_chat_stream(request: PeriodChatRequest, current_user: Optional[dict] = Depends(get_optional_user)):
+    """
+    Streaming Period Care Bot Endpoint
+    
+    Same input as /period-chat. Responds with Server-Sent Events:
+    a `meta` event with the prediction first, then `chunk` events as the
+    answer is generated, then a final `done` event.
+    """
+    cycle_length = await personal_cycle_length(str(current_user["_id"])) if current_user else None
+    return sse_response(period_chat_events(request, cycle_length))
+
 # ============================================
 # PREGNANCY CARE BOT ENDPOINT
 # ============================================
@@ -192,10 +316,31 @@ async def pregnancy_chat(request: PregnancyChatRequest):
     - Exercise safety tips
     - Emotional support
     - Due date tracking
+    
+    Stock questions about the current week (baby's growth, what to eat,
+    warning signs, checkups) are answered from the week-by-week content
+    table without a model call; source is "content" for those.
+    
+    Send the returned session_id with the next message to continue the
+    conversation; earlier turns are kept on the server. Answers in Hindi
+    or Telugu are translated from the English answer, as for /period-chat.
     """
     try:
         # Calculate pregnancy information
-        pregnancy_info = calculate_pregnancy_info(request.pregnancy_start_date)
+        pregnancy_info, prediction_text = build_pregnancy_prediction(request)
+        session_id = request.session_id or new_session_id()
+        
+        # Stock week-specific questions are answered from the content table
+        content = answer_from_content(request, pregnancy_info)
+        if content is not None:
+            ai_service.remember_exchange("pregnancy", session_id, request.user_message, content.text, request.history)
+            return ChatResponse(
+                response=await ai_service.translate(content.text, request.language, "pregnancy"),
+                prediction=prediction_text,
+                additional_info={**pregnancy_info, "content_version": content.version},
+                session_id=session_id,
+                source="content"
+            )
         
         # Get AI response with context
         ai_response = await ai_service.get_pregnancy_chat_response(
@@ -203,21 +348,22 @@ async def pregnancy_chat(request: PregnancyChatRequest):
             confirmation_date=request.pregnancy_start_date,
             weeks_pregnant=pregnancy_info["weeks_pregnant"],
             trimester=pregnancy_info["trimester"],
-            due_date=pregnancy_info["due_date"]
+            due_date=pregnancy_info["due_date"],
+            use_cache=request.use_cache,
+            session_id=session_id,
+            history=request.history,
+            profile="pregnancy_chat",
+            language=request.language
         )
         
-        # Build prediction text
-        prediction_text = f"Week {pregnancy_info['weeks_pregnant']} - {pregnancy_info['trimester']}"
-        if pregnancy_info['days_until_due'] > 0:
-            prediction_text += f" | Due date: {pregnancy_info['due_date']} ({pregnancy_info['days_until_due']} days)"
-        
         return ChatResponse(
             response=ai_response,
             prediction=prediction_text,
-            additional_info=pregnancy_info
+            additional_info=pregnancy_info,
+            session_id=session_id
         )
     
-    except HTTPException:
+    except (HTTPException, LLMOverloadedError):
         raise
     except Exception as e:
         raise HTTPException(
@@ -225,6 +371,85 @@ async def pregnancy_chat(request: PregnancyChatRequest):
             detail=f"Failed to process pregnancy chat request: {str(e)}"
         )
 
+@router.post("/pregnancy-chat/stream")
+async def pregnancy_chat_stream(request: PregnancyChatRequest):
+    """
+    Streaming Pregnancy Care Bot Endpoint
+    
+    Same input as /pregnancy-chat. Responds with Server-Sent Events:
+    a `meta` event with the pregnancy info first, then `chunk` events as
+    the answer is generated, then a final `done` event.
+    """
+    return sse_response(pregnancy_chat_events(request))
+
+
+# ============================================
+# CALENDAR ENDPOINTS
+# ============================================
+
+def parse_calendar_date(value: str) -> datetime:
+    try:
+        return datetime.strptime(value, "%Y-%m-%d")
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid date format. Use YYYY-MM-DD"
+        )
+
+def calendar_response(request: Request, calendar: CachedCalendar) -> Response:
+    """
+    Send a memoized calendar, or 304 Not Modified when the client's copy is current
+    
+    Calendars never change for the same inputs, so clients may keep them
+    for a day and then revalidate with If-None-Match.
+    """
+    headers = {
+        "ETag": calendar.etag,
+        "Cache-Control": "private, max-age=86400",
+        "Vary": "Authorization"  # The cycle length may come from the signed-in user's history
+    }
+    client_tags = [tag.strip().removeprefix("W/") for tag in request.headers.get("if-none-match", "").split(",")]
+    if calendar.etag in client_tags or "*" in client_tags:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=calendar.body, media_type="application/json", headers=headers)
+
+@router.get("/period-calendar")
+async def get_period_calendar(
+    request: Request,
+    last_period_date: str = Query(..., description="Last period start in YYYY-MM-DD format"),
+    cycle_length: Optional[int] = Query(None, ge=15, le=60, description="Cycle length in days; defaults to the user's own or 28"),
+    months: int = Query(6, ge=1, le=12, description="How many months ahead to cover"),
+    period_length: int = Query(5, ge=2, le=10, description="Days of bleeding per period"),
+    current_user: Optional[dict] = Depends(get_optional_user)
+):
+    """
+    Period calendar for the next months
+    
+    Every predicted cycle with its period days, ovulation date, fertile
+    window and phase date ranges - without a chatbot call. Responses carry
+    an ETag; send it back as If-None-Match to get 304 when nothing changed.
+    """
+    start = parse_calendar_date(last_period_date).date()
+    if cycle_length is None and current_user:
+        cycle_length = await personal_cycle_length(str(current_user["_id"]))
+    
+    calendar = period_calendar(start, cycle_length or settings.DEFAULT_CYCLE_LENGTH, months, period_length)
+    return calendar_response(request, calendar)
+
+@router.get("/pregnancy-calendar")
+async def get_pregnancy_calendar(
+    request: Request,
+    pregnancy_start_date: str = Query(..., description="Pregnancy confirmation/start date in YYYY-MM-DD format")
+):
+    """
+    Pregnancy timeline: all 40 weeks with trimesters, checkups and the due date
+    
+    Uses the same week counting as the Pregnancy Care Bot. Responses carry
+    an ETag for offline caching, like /period-calendar.
+    """
+    confirmation = parse_calendar_date(pregnancy_start_date).date()
+    return calendar_response(request, pregnancy_calendar(confirmation))
+
 
 # ============================================
 # HEALTH CHECK ENDPOINT
@@ -234,13 +459,21 @@ async def pregnancy_chat(request: PregnancyChatRequest):
 async def health_check():
     """
     Check if AI service is connected and working
+    
+    While the circuit breaker is open the upstream is known to be down,
+    so no test call is made and the answer comes back immediately.
     """
-    is_connected = ai_service.test_connection()
+    breaker = llm_breaker.stats()
+    if breaker["state"] == "open":
+        is_connected = False
+    else:
+        is_connected = await ai_service.test_connection()
     
     return {
         "status": "healthy" if is_connected else "unhealthy",
         "ai_service": "connected" if is_connected else "disconnected",
-        "message": "Health bots are ready" if is_connected else "AI service connection issue"
+        "message": "Health bots are ready" if is_connected else "AI service connection issue",
+        "circuit_breaker": breaker
     }
 
 # End of file
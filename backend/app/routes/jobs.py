@@ -0,0 +1,170 @@
+"""
+Background Chat Job API Routes
+
+Same requests as the chat endpoints, answered in the background. The
+POST returns 202 with a job id at once; the answer is fetched later from
+GET /api/jobs/{job_id}, or pushed as a Socket.IO 'job_done' event to the
+job's room (see socket_events.watch_job) and to the signed-in user's room.
+
+Signed-in users can send an Idempotency-Key header to make a submission
+safe to retry: the same key returns the same job, so an answer is never
+computed twice when a client resubmits after losing its connection. The
+key is ignored for anonymous requests, and reusing it for a different
+request body is refused with 422.
+
+A job is only shown to the user who submitted it (404 for anyone else);
+an anonymous job is reachable by its random id alone.
+"""
+
+import hashlib
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
+from pydantic import BaseModel
+from app.models.schemas import PeriodChatRequest, PregnancyChatRequest
+from app.routes import health_bots, krishi_bot
+from app.routes.auth import get_optional_user
+from app.routes.krishi_bot import KrishiBotRequest
+from app.services.job_queue import Job, JobError, JobQueue
+from app.config.settings import settings
+from app.socket_events import sio
+from typing import Awaitable, Callable, Dict, Optional
+
+# Create router
+router = APIRouter(prefix="/api/jobs", tags=["Background Jobs"])
+
+def job_event(job: Job) -> Dict:
+    """Payload of the 'job_done' Socket.IO event"""
+    return {"jobId": job.id, "status": job.state, "result": job.result, "error": job.error}
+
+async def notify_finished(job: Job) -> None:
+    """Push a finished job to everyone watching it"""
+    for room in job.rooms:
+        await sio.emit('job_done', job_event(job), room=room)
+
+job_queue = JobQueue(
+    workers=settings.JOB_WORKERS,
+    max_queued=settings.JOB_QUEUE_MAX,
+    result_ttl=settings.JOB_RESULT_TTL_SECONDS,
+    max_jobs=settings.JOB_MAX_JOBS,
+    max_attempts=settings.JOB_MAX_ATTEMPTS,
+    on_finish=notify_finished
+)
+
+def _runner(handler: Callable[[], Awaitable]) -> Callable[[], Awaitable[Dict]]:
+    """Wrap a chat handler so the job stores its response body"""
+    async def run() -> Dict:
+        try:
+            response = await handler()
+        except HTTPException as e:
+            raise JobError(e.status_code, e.detail)
+        return response.model_dump()
+    return run
+
+def _user_id(current_user: Optional[dict]) -> str:
+    return str(current_user["_id"]) if current_user else ""
+
+def request_fingerprint(request: BaseModel) -> str:
+    """Hash of a request body, to tell a retry from a different request under the same key"""
+    return hashlib.sha256(request.model_dump_json().encode("utf-8")).hexdigest()
+
+async def _submit(
+    kind: str,
+    request: BaseModel,
+    handler: Callable[[], Awaitable],
+    response: Response,
+    idempotency_key: Optional[str],
+    current_user: Optional[dict]
+) -> Dict:
+    user_id = _user_id(current_user)
+    try:
+        job, created = await job_queue.submit(
+            kind,
+            _runner(handler),
+            idempotency_key=idempotency_key,
+            owner=user_id,
+            rooms=[f"user:{user_id}"] if user_id else None,
+            fingerprint=request_fingerprint(request)
+        )
+    except JobError as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
+    poll_url = f"{router.prefix}/{job.id}"
+    response.headers["Location"] = poll_url
+    if not created and job.finished:
+        response.status_code = status.HTTP_200_OK
+    return {"job_id": job.id, "status": job.state, "poll_url": poll_url, "created": created}
+
+# ============================================
+# SUBMIT ENDPOINTS
+# ============================================
+
+@router.post("/period-chat", status_code=status.HTTP_202_ACCEPTED)
+async def submit_period_chat(
+    request: PeriodChatRequest,
+    response: Response,
+    idempotency_key: Optional[str] = Header(None),
+    current_user: Optional[dict] = Depends(get_optional_user)
+):
+    """
+    Queue a Period Care Bot request
+
+    Same body as /api/health-bots/period-chat. The job's result is that
+    endpoint's response.
+    """
+    health_bots.build_period_prediction(request)  # Reject a bad date now rather than in the job
+    return await _submit(
+        "period", request, lambda: health_bots.period_chat(request, current_user),
+        response, idempotency_key, current_user
+    )
+
+@router.post("/pregnancy-chat", status_code=status.HTTP_202_ACCEPTED)
+async def submit_pregnancy_chat(
+    request: PregnancyChatRequest,
+    response: Response,
+    idempotency_key: Optional[str] = Header(None),
+    current_user: Optional[dict] = Depends(get_optional_user)
+):
+    """
+    Queue a Pregnancy Care Bot request
+
+    Same body as /api/health-bots/pregnancy-chat.
+    """
+    health_bots.build_pregnancy_prediction(request)
+    return await _submit(
+        "pregnancy", request, lambda: health_bots.pregnancy_chat(request),
+        response, idempotency_key, current_user
+    )
+
+@router.post("/krishi-chat", status_code=status.HTTP_202_ACCEPTED)
+async def submit_krishi_chat(
+    request: KrishiBotRequest,
+    response: Response,
+    idempotency_key: Optional[str] = Header(None),
+    current_user: Optional[dict] = Depends(get_optional_user)
+):
+    """
+    Queue a Krishi Bot request
+
+    Same body as /api/krishi-bot/chat.
+    """
+    return await _submit(
+        "krishi", request, lambda: krishi_bot.krishi_bot_chat(request),
+        response, idempotency_key, current_user
+    )
+
+# ============================================
+# RESULT ENDPOINT
+# ============================================
+
+@router.get("/{job_id}")
+async def get_job(job_id: str, current_user: Optional[dict] = Depends(get_optional_user)):
+    """
+    Status of a background job, with the result once it is done
+
+    status is queued, running, done (result holds the chat response) or
+    failed (error holds status_code and detail). Jobs are kept for
+    JOB_RESULT_TTL_SECONDS after they finish; after that this returns 404.
+    A job submitted by a signed-in user needs that user's token.
+    """
+    job = job_queue.get(job_id, _user_id(current_user))
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found or expired")
+    return job.to_dict()
@@ -7,9 +7,12 @@ Handles Agricultural guidance bot endpoints
 from fastapi import APIRouter, HTTPException, status
 from app.models.schemas import ChatResponse
 from app.services.ai_service import AIService
+from app.services.admission import LLMOverloadedError
+from app.services.streaming import ChatEvent, chat_events, sse_response
 from app.config.settings import settings
-from app.prompts.krishi_bot_prompt import get_krishi_prompt
+from app.prompts.krishi_bot_prompt import KRISHI_SYSTEM_PROMPT, get_krishi_context
 from pydantic import BaseModel
+from typing import AsyncIterator
 
 # Create router
 router = APIRouter(prefix="/api/krishi-bot", tags=["Krishi Bot"])
@@ -20,6 +23,19 @@ ai_service = AIService()
 class KrishiBotRequest(BaseModel):
     message: str
     user_info: dict  # Contains farm_size, crops, location, season
+    use_cache: bool = True  # Allow a cached answer for a common question
+
+def krishi_chat_events(request: KrishiBotRequest) -> AsyncIterator[ChatEvent]:
+    """Build the streaming event sequence for a Krishi Bot request"""
+    chunks = ai_service.stream_chat_response(
+        user_message=request.message,
+        system_prompt=KRISHI_SYSTEM_PROMPT,
+        bot="krishi",
+        use_cache=request.use_cache,
+        profile="krishi_chat",
+        context=get_krishi_context(request.user_info, request.message)
+    )
+    return chat_events(chunks)
 
 @router.post("/chat", response_model=ChatResponse)
 async def krishi_bot_chat(request: KrishiBotRequest):
@@ -33,13 +49,14 @@ async def krishi_bot_chat(request: KrishiBotRequest):
     - Season
     """
     try:
-        # Generate agricultural system prompt with user context
-        system_prompt = get_krishi_prompt(request.user_info)
-        
-        # Get AI response
+        # Static system prompt plus the farmer's context and retrieved knowledge
         ai_response = await ai_service.get_chat_response(
             user_message=request.message,
-            system_prompt=system_prompt
+            system_prompt=KRISHI_SYSTEM_PROMPT,
+            bot="krishi",
+            use_cache=request.use_cache,
+            profile="krishi_chat",
+            context=get_krishi_context(request.user_info, request.message)
         )
         
         return ChatResponse(
@@ -47,8 +64,20 @@ async def krishi_bot_chat(request: KrishiBotRequest):
             status="success"
         )
         
+    except LLMOverloadedError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to get Krishi Bot response: {str(e)}"
         )
+
+@router.post("/chat/stream")
+async def krishi_bot_chat_stream(request: KrishiBotRequest):
+    """
+    Streaming Krishi Sakhi Endpoint
+    
+    Same input as /chat. Responds with Server-Sent Events: a `meta`
+    event, then `chunk` events as the answer is generated, then `done`.
+    """
+    return sse_response(krishi_chat_events(request))
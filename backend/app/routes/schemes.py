@@ -1,63 +1,128 @@
 from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from app.services.ai_service import AIService
+from app.services.admission import LLMOverloadedError
+from app.services import scheme_rules
+from typing import Dict, List, Optional
 import json
 
 router = APIRouter()
 
-class EligibilityRequest(BaseModel):
-    scheme_name: str
-    age: int
-    income: int
+# Bounds keep values inside the int64 columns the batch rules engine uses
+MAX_AGE = 150
+MAX_INCOME = 2 ** 63 - 1
+
+class ApplicantProfile(BaseModel):
+    age: int = Field(..., ge=0, le=MAX_AGE)
+    income: int = Field(..., ge=0, le=MAX_INCOME)  # Annual household income, rupees
     residence: str = "Rural"
     caste: str = "General"
 
+class EligibilityRequest(ApplicantProfile):
+    scheme_name: str
+
 class EligibilityResponse(BaseModel):
     is_eligible: bool
     reason: str
+    source: str = "llm"  # rules (scheme catalog), llm, or fallback
+    scheme_id: Optional[str] = None  # Catalog id when answered by the rules engine
+
+ELIGIBILITY_SYSTEM_PROMPT = """You are an expert on Indian Government Welfare Schemes for women (e.g., Sukanya Samriddhi Yojana, PMMVY, Ujjwala, NRLM, Stand Up India).
+
+Task: precise eligibility check for the scheme and user data given below.
+
+Rules:
+1. Check specific age limits and income caps for the named scheme.
+2. Respond with a JSON object only: {"is_eligible": boolean, "reason": "string"}.
+3. Reason should be 1 short sentence encouraging the user ("You meet the age criteria!") or explaining the blocker ("Income limit is 1.5L")."""
 
 @router.post("/check-eligibility", response_model=EligibilityResponse)
 async def check_eligibility(request: EligibilityRequest):
-    system_prompt = f"""
-    You are an expert on Indian Government Welfare Schemes for women (e.g., Sukanya Samriddhi Yojana, PMMVY, Ujjwala, NRLM, Stand Up India).
+    # Catalogued schemes are answered locally; the model only sees the rest
+    result = scheme_rules.check_eligibility(
+        request.scheme_name, request.age, request.income, request.residence, request.caste
+    )
+    if result is not None:
+        return EligibilityResponse(
+            is_eligible=result.is_eligible,
+            reason=result.reason,
+            source="rules",
+            scheme_id=result.scheme_id
+        )
     
-    Task: precise eligibility check.
-    Scheme: "{request.scheme_name}"
-    User Data: Age {request.age}, Income ₹{request.income}, {request.residence}, {request.caste}.
-
-    Rules:
-    1. Check specific age limits and income caps for the named scheme.
-    2. Respond with valid JSON only. format: {{"is_eligible": boolean, "reason": "string"}}.
-    3. Reason should be 1 short sentence encouraging the user ("You meet the age criteria!") or explaining the blocker ("Income limit is 1.5L").
-    """
+    # Static instructions go first so they can be reused as a cached prompt prefix
+    context = f"""Scheme: "{request.scheme_name}"
+User Data: Age {request.age}, Income ₹{request.income}, {request.residence}, {request.caste}."""
     
     try:
-        # We reuse get_chat_response but pass empty user message since system prompt has everything
-        response_text = await AIService.get_chat_response("Check eligibility", system_prompt)
-        
-        # Cleanup response
-        clean_text = response_text.replace("```json", "").replace("```", "").strip()
-        # Find start and end of json if extra text exists
-        start = clean_text.find("{")
-        end = clean_text.rfind("}") + 1
-        if start != -1 and end != -1:
-            clean_text = clean_text[start:end]
-            
-        result = json.loads(clean_text)
+        # The eligibility profile asks the model for JSON output, so the reply parses directly
+        response_text = await AIService.get_chat_response(
+            "Check eligibility", ELIGIBILITY_SYSTEM_PROMPT, bot="schemes", profile="eligibility", context=context
+        )
+        try:
+            answer = json.loads(response_text)
+        except ValueError:
+            # Do not keep serving a reply that will never parse
+            AIService.forget_chat_response(
+                "Check eligibility", ELIGIBILITY_SYSTEM_PROMPT, bot="schemes", profile="eligibility", context=context
+            )
+            raise
         
         return EligibilityResponse(
-            is_eligible=result.get("is_eligible", False),
-            reason=result.get("reason", "Please verify documents at center.")
+            is_eligible=answer.get("is_eligible", False),
+            reason=answer.get("reason", "Please verify documents at center."),
+            source="llm"
         )
+    except LLMOverloadedError:
+        raise
     except Exception as e:
         print(f"AI Check Error: {e}")
-        # Simple fallback logic
-        eligible = True
-        reason = "Preliminary check passed. Please visit center."
-        
-        # Super basic fallback logic for common failures
-        if "Sukanya" in request.scheme_name and request.age > 10:
-            eligible = False
-            reason = "Age must be less than 10 years."
-            
-        return EligibilityResponse(is_eligible=eligible, reason=reason)
+        # The scheme is not in the catalog and the model gave no usable answer:
+        # do not approve by default
+        return EligibilityResponse(
+            is_eligible=False,
+            reason="We could not check this scheme right now. Please ask at your nearest enrolment center.",
+            source="fallback"
+        )
+
+class BatchEligibilityRequest(BaseModel):
+    profiles: List[ApplicantProfile] = Field(..., min_length=1, max_length=5000)
+    scheme_ids: Optional[List[str]] = None  # Catalog ids to check; all catalogued schemes when omitted
+    include_reasons: bool = False
+
+class BatchEligibilityResponse(BaseModel):
+    schemes: List[Dict[str, str]]  # Column order of the matrix: [{"id", "name"}]
+    eligible: List[List[bool]]  # One row per profile, one column per scheme
+    reasons: Optional[List[List[str]]] = None  # Same shape, when include_reasons is set
+    eligible_counts: Dict[str, int]  # Scheme id -> number of eligible profiles
+    source: str = "rules"
+
+@router.post("/check-eligibility/batch", response_model=BatchEligibilityResponse)
+async def check_eligibility_batch(request: BatchEligibilityRequest):
+    """
+    Eligibility matrix for many women across the scheme catalog
+    
+    For field workers registering a whole self-help group at once. All
+    profile x scheme checks run in one vectorized pass over the rules
+    engine; the model is never called.
+    """
+    if request.scheme_ids is not None:
+        unknown = [scheme_id for scheme_id in request.scheme_ids if scheme_id not in scheme_rules.COMPILED_SCHEMES]
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown scheme ids: {', '.join(unknown)}")
+    
+    applicants = [
+        scheme_rules.make_applicant(profile.age, profile.income, profile.residence, profile.caste)
+        for profile in request.profiles
+    ]
+    result = scheme_rules.evaluate_batch(applicants, request.scheme_ids)
+    
+    return BatchEligibilityResponse(
+        schemes=[
+            {"id": scheme_id, "name": scheme_rules.COMPILED_SCHEMES[scheme_id].name}
+            for scheme_id in result.scheme_ids
+        ],
+        eligible=result.eligible.tolist(),
+        reasons=result.reasons() if request.include_reasons else None,
+        eligible_counts=dict(zip(result.scheme_ids, result.eligible.sum(axis=0).tolist()))
+    )
@@ -4,11 +4,17 @@ Skill Hub API Routes
 Handles creator profiles and product management
 """
 
-from fastapi import APIRouter, HTTPException, status, UploadFile, File
-from app.models.schemas import CreatorProfile, Product, SuccessResponse, ErrorResponse
-from pymongo import MongoClient
+from fastapi import APIRouter, Depends, HTTPException, Query, status, UploadFile, File
+from app.models.schemas import (
+    CreatorProfile, Product, CreatorPage, ProductPage, ProductSummary, SearchResponse, SuccessResponse, ErrorResponse
+)
 from app.config.settings import settings
-from typing import List
+from app.services.database import get_db
+from app.services.pagination import fetch_page
+from app.services.serialization import dumps, encoded_response, json_response
+from app.services.catalog_cache import CREATORS, PRODUCTS, catalog_cache, sort_key
+from app.services.catalog_search import CREATOR, PRODUCT, catalog_search
+from typing import List, Optional
 import shutil
 import os
 import uuid
@@ -17,13 +23,41 @@ from datetime import datetime
 # Create router
 router = APIRouter(prefix="/api/skill-hub", tags=["Skill Hub"])
 
-# MongoDB client (will be initialized in main.py)
-db = None
+# ============================================
+# LIST PROJECTIONS
+# ============================================
+
+# Characters of the experience text shown on a creator card
+EXPERIENCE_PREVIEW_CHARS = 160
+
+# Card fields only: the full experience text, every work sample and the
+# product description stay in the database until a detail view asks
+CREATOR_SUMMARY = {
+    "name": 1,
+    "village": 1,
+    "skill_category": 1,
+    "experience_preview": {"$substrCP": ["$experience", 0, EXPERIENCE_PREVIEW_CHARS]},
+    "work_samples": {"$slice": 1},
+    "contact_number": 1,
+    "created_at": 1
+}
 
-def init_db(database):
-    """Initialize database connection"""
-    global db
-    db = database
+PRODUCT_SUMMARY = {
+    "product_name": 1,
+    "creator_name": 1,
+    "price": 1,
+    "image_url": 1,
+    "category": 1,
+    "created_at": 1
+}
+
+def page_loader(collection, query: dict, cursor: Optional[str], limit: int, projection: dict):
+    """Catalog cache loader for one page: encoded body and the sort key it ends on"""
+    async def load():
+        items, next_cursor = await fetch_page(collection, query, cursor, limit, projection)
+        lower = sort_key(items[-1]["created_at"], items[-1]["_id"]) if next_cursor else None
+        return dumps({"items": items, "next_cursor": next_cursor}), lower
+    return load
 
 # ============================================
 # CREATOR PROFILE ENDPOINTS
@@ -60,7 +94,7 @@ async def upload_work_sample(file: UploadFile = File(...)):
         )
 
 @router.post("/create-profile", response_model=SuccessResponse, status_code=status.HTTP_201_CREATED)
-async def create_creator_profile(profile: CreatorProfile):
+async def create_creator_profile(profile: CreatorProfile, db=Depends(get_db)):
     """
     Create a new creator profile
     
@@ -71,7 +105,8 @@ async def create_creator_profile(profile: CreatorProfile):
         profile_dict = profile.model_dump()
         
         # Insert into database
-        result = db.creators.insert_one(profile_dict)
+        result = await db.creators.insert_one(profile_dict)
+        await catalog_cache.item_added(CREATORS, profile.created_at, result.inserted_id)
         
         # Return success response
         return SuccessResponse(
@@ -88,27 +123,24 @@ async def create_creator_profile(profile: CreatorProfile):
             detail=f"Failed to create profile: {str(e)}"
         )
 
-@router.get("/creators", response_model=List[dict])
-async def get_all_creators():
+@router.get("/creators", response_model=CreatorPage)
+async def get_all_creators(
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
+    db=Depends(get_db)
+):
     """
-    Get all creator profiles
+    Get creator profiles, newest first
     
-    Returns list of all registered creators for the skill marketplace
+    Returns one page of creator cards for the skill marketplace
+    (summary fields only; see /creator/{creator_id} for the full profile)
     """
     try:
-        # Fetch all creators from database
-        creators_cursor = db.creators.find()
-        creators = []
-        
-        for creator in creators_cursor:
-            # Convert MongoDB ObjectId to string
-            creator['_id'] = str(creator['_id'])
-            # Convert datetime to string for JSON serialization
-            creator['created_at'] = creator['created_at'].isoformat()
-            creators.append(creator)
-        
-        return creators
+        load = page_loader(db.creators, {}, cursor, limit, CREATOR_SUMMARY)
+        return encoded_response(await catalog_cache.read_page(CREATORS, cursor, limit, load))
     
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -116,27 +148,29 @@ async def get_all_creators():
         )
 
 @router.get("/creator/{creator_id}")
-async def get_creator_by_id(creator_id: str):
+async def get_creator_by_id(creator_id: str, db=Depends(get_db)):
     """
     Get specific creator profile by ID
     """
     try:
         from bson import ObjectId
         
-        creator = db.creators.find_one({"_id": ObjectId(creator_id)})
+        async def load():
+            creator = await db.creators.find_one({"_id": ObjectId(creator_id)})
+            return dumps(creator) if creator else None
+        
+        body = await catalog_cache.read(("creator", creator_id), load)
         
-        if not creator:
+        if body is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Creator not found"
             )
         
-        # Convert ObjectId and datetime
-        creator['_id'] = str(creator['_id'])
-        creator['created_at'] = creator['created_at'].isoformat()
-        
-        return creator
+        return encoded_response(body)
     
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -148,7 +182,7 @@ async def get_creator_by_id(creator_id: str):
 # ============================================
 
 @router.post("/add-product", response_model=SuccessResponse, status_code=status.HTTP_201_CREATED)
-async def add_product(product: Product):
+async def add_product(product: Product, db=Depends(get_db)):
     """
     Add a new product to the marketplace
     
@@ -159,7 +193,9 @@ async def add_product(product: Product):
         product_dict = product.model_dump()
         
         # Insert into database
-        result = db.products.insert_one(product_dict)
+        result = await db.products.insert_one(product_dict)
+        if product.available:
+            await catalog_cache.item_added(PRODUCTS, product.created_at, result.inserted_id, product.creator_name)
         
         # Return success response
         return SuccessResponse(
@@ -176,51 +212,98 @@ async def add_product(product: Product):
             detail=f"Failed to add product: {str(e)}"
         )
 
-@router.get("/products", response_model=List[dict])
-async def get_all_products():
+@router.get("/products", response_model=ProductPage)
+async def get_all_products(
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
+    db=Depends(get_db)
+):
     """
-    Get all products from marketplace
+    Get products from marketplace, newest first
     
-    Returns list of all available products
+    Returns one page of available products (summary fields only)
     """
     try:
         # Fetch only available products
-        products_cursor = db.products.find({"available": True})
-        products = []
-        
-        for product in products_cursor:
-            # Convert MongoDB ObjectId to string
-            product['_id'] = str(product['_id'])
-            # Convert datetime to string
-            product['created_at'] = product['created_at'].isoformat()
-            products.append(product)
-        
-        return products
+        load = page_loader(db.products, {"available": True}, cursor, limit, PRODUCT_SUMMARY)
+        return encoded_response(await catalog_cache.read_page(PRODUCTS, cursor, limit, load))
     
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to fetch products: {str(e)}"
         )
 
-@router.get("/products/creator/{creator_name}")
-async def get_products_by_creator(creator_name: str):
+@router.get("/products/creator/{creator_name}", response_model=List[ProductSummary])
+async def get_products_by_creator(creator_name: str, db=Depends(get_db)):
     """
-    Get all products by a specific creator
+    Get all products by a specific creator (summary fields only)
     """
     try:
-        products_cursor = db.products.find({"creator_name": creator_name, "available": True})
-        products = []
-        
-        for product in products_cursor:
-            product['_id'] = str(product['_id'])
-            product['created_at'] = product['created_at'].isoformat()
-            products.append(product)
+        async def load():
+            products = await db.products.find(
+                {"creator_name": creator_name, "available": True}, PRODUCT_SUMMARY
+            ).to_list(None)
+            return dumps(products)
         
-        return products
+        return encoded_response(await catalog_cache.read(("creator_products", creator_name), load))
     
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to fetch creator products: {str(e)}"
         )
+
+# ============================================
+# SEARCH
+# ============================================
+
+@router.get("/search", response_model=SearchResponse)
+async def search_catalog(
+    q: str = Query(..., min_length=1, max_length=200, description="Search text; the last word may be partial"),
+    type: str = Query("all", pattern="^(all|creators|products)$", description="What to search"),
+    limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
+    prefix: bool = Query(True, description="Match the last word as a prefix (type-ahead)"),
+    db=Depends(get_db)
+):
+    """
+    Search creators and products
+    
+    Ranked by relevance across product names, categories and descriptions
+    and creator names, skills, villages and experience. Hindi, Hinglish and
+    English spellings match each other (मटका, matka); with prefix=true the
+    last word matches as you type.
+    """
+    if not catalog_search.ready:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Search index is loading",
+            headers={"Retry-After": "2"}
+        )
+    
+    kind = {"creators": CREATOR, "products": PRODUCT}.get(type)
+    hits = catalog_search.search(q, kind=kind, k=limit, prefix=prefix)
+    
+    try:
+        # Read the hits back by _id, with the same card fields as the list endpoints
+        found = {}
+        for hit_kind, collection, projection in ((CREATOR, db.creators, CREATOR_SUMMARY), (PRODUCT, db.products, PRODUCT_SUMMARY)):
+            ids = [item_id for doc_kind, item_id, _ in hits if doc_kind == hit_kind]
+            if ids:
+                async for document in collection.find({"_id": {"$in": ids}}, projection):
+                    found[(hit_kind, document["_id"])] = document
+        
+        items = [
+            {"type": hit_kind, "score": round(score, 3), **found[(hit_kind, item_id)]}
+            for hit_kind, item_id, score in hits
+            if (hit_kind, item_id) in found
+        ]
+        return json_response({"query": q, "items": items})
+    
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Search failed: {str(e)}"
+        )
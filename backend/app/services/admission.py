@@ -0,0 +1,152 @@
+"""
+Admission Control for LLM Requests
+
+Decides up front whether a new LLM call can finish in time. If the
+scheduler queues are already deeper than we can drain within the bot's
+wait SLO (based on recent upstream latency), the request is rejected
+immediately with a Retry-After hint instead of holding a worker while it
+waits, retries and finally apologises.
+"""
+
+import math
+from collections import deque
+from typing import Deque, Dict
+from app.config.settings import settings
+from app.services.llm_scheduler import LLMScheduler, llm_scheduler
+
+
+class LLMOverloadedError(Exception):
+    """
+    The LLM path cannot take this request right now
+
+    Routes turn this into HTTP 503 with a Retry-After header.
+    """
+
+    def __init__(self, retry_after: int, reason: str):
+        super().__init__(reason)
+        self.retry_after = retry_after
+        self.reason = reason
+
+
+class LatencyTracker:
+    """Rolling window of recent upstream call latencies"""
+
+    def __init__(self, window: int = 200):
+        self._samples: Deque[float] = deque(maxlen=window)
+
+    def record(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    def percentile(self, pct: float, default: float = 0.0) -> float:
+        """Latency in seconds at the given percentile of the window"""
+        if not self._samples:
+            return default
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def stats(self) -> Dict:
+        return {
+            "samples": len(self._samples),
+            "p50_ms": round(self.percentile(50) * 1000, 1),
+            "p95_ms": round(self.percentile(95) * 1000, 1),
+            "p99_ms": round(self.percentile(99) * 1000, 1)
+        }
+
+
+class AdmissionController:
+    """
+    Reject LLM work that cannot start within its queue's wait SLO
+
+    The expected wait for a new request is the number of calls that will
+    be served before it, divided by the concurrency cap, times the median
+    upstream latency (slots free up at staggered times, so on average one
+    frees every latency / concurrency seconds). Calls in higher-weight
+    queues count fully; calls in lower-weight queues count in proportion
+    to the weight ratio, since the scheduler only gives them that share.
+    
+    Calls admitted with a reservation are counted as outstanding until
+    release() is called, so a burst that has been admitted but has not
+    reached the scheduler yet still counts against the next request.
+    """
+
+    def __init__(self, scheduler: LLMScheduler, latency: LatencyTracker, max_queue_depth: int):
+        self.scheduler = scheduler
+        self.latency = latency
+        self.max_queue_depth = max_queue_depth
+
+        self.outstanding = 0  # Reserved calls that have not finished yet
+        self.admitted = 0
+        self.rejected = 0
+
+    def estimated_wait(self, bot: str) -> float:
+        """Expected queue wait in seconds for a new call from this bot"""
+        own_queue = self.scheduler.queue_name(bot)
+        own_weight = self.scheduler.weights[own_queue]
+
+        ahead = 0.0
+        for name, weight in self.scheduler.weights.items():
+            ahead += self.scheduler.depth(name) * min(1.0, weight / own_weight)
+        ahead = max(ahead, self.outstanding - self.scheduler.active)
+
+        free_slots = self.scheduler.max_concurrency - self.scheduler.active
+        if ahead < free_slots:
+            return 0.0
+
+        # No latency samples yet (cold start): only the depth limit applies
+        typical_latency = self.latency.percentile(50)
+        return (ahead + 1 - free_slots) / self.scheduler.max_concurrency * typical_latency
+
+    def check(self, bot: str, reserve: bool = False) -> None:
+        """
+        Admit or reject a new LLM call
+
+        :param bot: Caller name, selects the queue and its wait SLO
+        :param reserve: Count the call as outstanding until release()
+
+        Raises:
+            LLMOverloadedError: with a computed retry_after in seconds
+        """
+        total_depth = self.scheduler.depth()
+        wait = self.estimated_wait(bot)
+        slo = self.scheduler.slo_ms(bot) / 1000
+
+        if total_depth >= self.max_queue_depth or wait > slo:
+            self.rejected += 1
+            raise LLMOverloadedError(
+                retry_after=retry_after_seconds(wait),
+                reason=f"LLM queue for '{bot}' is full (depth {total_depth}, expected wait {wait:.1f}s)"
+            )
+
+        self.admitted += 1
+        if reserve:
+            self.outstanding += 1
+
+    def release(self) -> None:
+        """Mark a reserved call as finished"""
+        self.outstanding -= 1
+
+    def stats(self) -> Dict:
+        return {
+            "outstanding": self.outstanding,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "max_queue_depth": self.max_queue_depth,
+            "upstream_latency": self.latency.stats()
+        }
+
+
+def retry_after_seconds(seconds: float) -> int:
+    """Clamp a wait estimate to a sensible Retry-After value"""
+    return max(settings.RETRY_AFTER_MIN_SECONDS, min(settings.RETRY_AFTER_MAX_SECONDS, math.ceil(seconds)))
+
+
+# Shared instances used by AIService
+upstream_latency = LatencyTracker()
+admission_controller = AdmissionController(
+    scheduler=llm_scheduler,
+    latency=upstream_latency,
+    max_queue_depth=settings.LLM_MAX_QUEUE_DEPTH
+)
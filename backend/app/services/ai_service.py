@@ -1,67 +1,544 @@
 """
-AI Service - Google Gemini Integration
+AI Service - LLM Integration
 
-Handles communication with Google AI Studio (Gemini API) for both chatbots
+Handles communication with the configured LLM provider (Google Gemini by
+default, see llm_provider.py) for all chatbots
 Manages system prompts and context injection
 """
 
-import google.generativeai as genai
 from app.config.settings import settings
-from app.prompts.period_bot_prompt import PERIOD_CARE_SYSTEM_PROMPT, get_period_context_prompt
-from app.prompts.pregnancy_bot_prompt import PREGNANCY_CARE_SYSTEM_PROMPT, get_pregnancy_context_prompt
-from typing import List, Dict
+from app.services import prompt_assembly, pregnancy_content
+from app.services.prompt_assembly import Prompt
+from app.services.response_cache import (
+    response_cache, get_ttl, period_cache_key, pregnancy_cache_key, prompt_cache_key, translation_cache_key
+)
+from app.services.single_flight import SingleFlight
+from app.services.llm_scheduler import llm_scheduler
+from app.services.admission import (
+    LLMOverloadedError, admission_controller, upstream_latency, retry_after_seconds
+)
+from app.services.llm_provider import LLMRateLimitError, LLMTransientError, get_provider
+from app.services.resilience import CircuitBreaker, HedgeStats, hedged_call
+from app.services.conversation_store import Turn, conversation_store, format_turn, normalize_history
+from app.prompts.translation_prompt import DEFAULT_LANGUAGE, language_code
+from typing import List, Dict, AsyncIterator, Callable, Hashable, Optional, Set
+import asyncio
 import time
 
-# Configure Google AI with API key
-genai.configure(api_key=settings.GOOGLE_API_KEY)
+# Identical prompts that are in flight at the same time share one Gemini call
+llm_single_flight = SingleFlight()
 
-# Initialize Gemini model
-model = genai.GenerativeModel(settings.GEMINI_MODEL)
+# Fails fast while the upstream model is down instead of every request timing out
+llm_breaker = CircuitBreaker(
+    window=settings.LLM_BREAKER_WINDOW,
+    min_calls=settings.LLM_BREAKER_MIN_CALLS,
+    failure_rate=settings.LLM_BREAKER_FAILURE_RATE,
+    open_seconds=settings.LLM_BREAKER_OPEN_SECONDS,
+    half_open_probes=settings.LLM_BREAKER_HALF_OPEN_PROBES
+)
+hedge_stats = HedgeStats()
+
+# Streaming upstream calls running in the background (kept referenced until they finish)
+stream_tasks: Set[asyncio.Task] = set()
+
+# Answers requested in another language, and how they were served
+translation_counts = {"requests": 0, "cache_hits": 0, "fallbacks": 0}
+
+# Upstream failures worth another attempt; anything else fails immediately
+RETRYABLE_ERRORS = (LLMRateLimitError, LLMTransientError, asyncio.TimeoutError)
+
+def get_generation_config(profile: str) -> Dict:
+    """Model settings for a named profile from settings.GENERATION_PROFILES"""
+    profiles = settings.GENERATION_PROFILES
+    return dict(profiles.get(profile, profiles["default"]))
+
+RATE_LIMIT_MESSAGE = "Oh dear! I'm getting a lot of questions right now and need a short break. Could you please try again in a few seconds? I promise I'll be right here waiting to help you!"
+TECHNICAL_ERROR_MESSAGE = "I'm having a small technical hiccup right now. Please try again in a moment. If this keeps happening, please let someone know so they can help fix it!"
+
+class AIServiceError(Exception):
+    """Upstream call failed; carries the friendly message to show the user"""
+    
+    def __init__(self, user_message: str):
+        super().__init__(user_message)
+        self.user_message = user_message
+
+SUMMARY_PROMPT = """Summarize this conversation between a user and Sakhi, a health assistant, in at most 120 words.
+Keep facts about the user (symptoms, dates, concerns, advice already given) and drop greetings and small talk.
+Write plain sentences in English."""
 
 class AIService:
     """Service class for AI chatbot interactions"""
     
     @staticmethod
-    def _make_api_call_with_retry(prompt: str, max_retries: int = 2):
+    async def _make_api_call_with_retry(
+        prompt: Prompt,
+        bot: str = "default",
+        max_retries: int = 2,
+        profile: str = "default"
+    ):
         """
-        Make API call with retry logic for rate limits
+        Make API call with retry logic for rate limits and transient failures
+        
+        Uses the async provider client and non-blocking backoff so a slow
+        upstream call never stalls the event loop for other requests.
+        Each attempt waits for a slot in the bot's scheduler queue and asks
+        the circuit breaker first, so a dead upstream is not hammered.
+        Only rate limits, transient upstream errors and timeouts are
+        retried; anything else fails straight away.
         
         Args:
-            prompt: The full prompt to send
+            prompt: Prompt to send (stable prefix and per-request body)
+            bot: Caller name, selects the scheduler queue (pregnancy, period, ...)
             max_retries: Maximum number of retries
+            profile: Generation profile name (see settings.GENERATION_PROFILES)
             
         Returns:
             API response text
+            
+        Raises:
+            LLMOverloadedError: upstream is still rate limiting after all
+                retries, the circuit breaker is open (CircuitOpenError) or
+                the LLM worker pool is full
+            AIServiceError: when the call fails, with a friendly message
         """
         for attempt in range(max_retries + 1):
             try:
-                response = model.generate_content(
-                    prompt,
-                    generation_config=genai.types.GenerationConfig(
-                        temperature=0.9,
-                        max_output_tokens=1500,  # Slightly reduced to save quota
-                        top_p=0.95,
-                    )
-                )
-                return response.text.strip()
+                return await AIService._call_provider(prompt, bot, get_generation_config(profile))
             except Exception as e:
                 error_message = str(e)
-                print(f"❌ API Error (Attempt {attempt + 1}/{max_retries + 1}): {error_message}")
+                print(f"❌ API Error (Attempt {attempt + 1}/{max_retries + 1}): {type(e).__name__}: {error_message}")
                 
-                # Check if it's a rate limit error
-                if "429" in error_message or "quota" in error_message.lower():
-                    if attempt < max_retries:
-                        # Wait a bit before retrying
-                        time.sleep(2 ** attempt)  # Exponential backoff: 1s, 2s, 4s
-                        continue
-                    else:
-                        return "Oh dear! I'm getting a lot of questions right now and need a short break. Could you please try again in a few seconds? I promise I'll be right here waiting to help you!"
-                else:
-                    # Other errors - log details
-                    print(f"❌ Non-rate-limit error: {type(e).__name__}: {error_message}")
-                    return f"I'm having a small technical hiccup right now. Please try again in a moment. If this keeps happening, please let someone know so they can help fix it!"
-        
-        return "I'm having trouble responding right now. Please try again shortly!"
+                if isinstance(e, LLMOverloadedError):
+                    raise
+                if not isinstance(e, RETRYABLE_ERRORS):
+                    raise AIServiceError(TECHNICAL_ERROR_MESSAGE)
+                
+                if attempt < max_retries:
+                    # Wait a bit before retrying
+                    await asyncio.sleep(2 ** attempt)  # Exponential backoff: 1s, 2s, 4s
+                    continue
+                if isinstance(e, LLMRateLimitError):
+                    raise LLMOverloadedError(
+                        retry_after=retry_after_seconds(2 ** (attempt + 1)),
+                        reason="Upstream model is rate limiting requests"
+                    )
+                raise AIServiceError(TECHNICAL_ERROR_MESSAGE)
+        
+        raise AIServiceError("I'm having trouble responding right now. Please try again shortly!")
+    
+    @staticmethod
+    async def _call_provider(prompt: Prompt, bot: str, config: Dict) -> str:
+        """
+        One upstream attempt, hedged when enabled and enough latency is known
+        
+        Raises:
+            CircuitOpenError: the breaker is not letting calls through
+        """
+        async def primary() -> str:
+            async with llm_scheduler.slot(bot):
+                return await AIService._guarded_generate(prompt, config)
+        
+        if not settings.LLM_HEDGE_ENABLED or len(upstream_latency) < settings.LLM_HEDGE_MIN_SAMPLES:
+            return await primary()
+        
+        return await hedged_call(
+            primary,
+            # The hedge's scheduler slot is taken by try_acquire_hedge
+            lambda: AIService._guarded_generate(prompt, config),
+            hedge_delay=upstream_latency.percentile(settings.LLM_HEDGE_PERCENTILE),
+            try_acquire_hedge=lambda: llm_scheduler.try_acquire(bot),
+            release_hedge=llm_scheduler.release,
+            stats=hedge_stats
+        )
+    
+    @staticmethod
+    async def _guarded_generate(prompt: Prompt, config: Dict) -> str:
+        """Call the provider through the circuit breaker, with timeout and latency tracking"""
+        llm_breaker.before_call()
+        started = time.monotonic()
+        try:
+            response_text = await asyncio.wait_for(
+                get_provider().generate(prompt.body, config, prefix=prompt.prefix),
+                timeout=settings.LLM_REQUEST_TIMEOUT
+            )
+        except RETRYABLE_ERRORS:
+            llm_breaker.record_failure()
+            raise
+        except BaseException:
+            # Cancelled, refused by the worker pool, or refused for this request only
+            # (safety block, empty answer, bad argument): no verdict on the upstream
+            llm_breaker.release_probe()
+            raise
+        llm_breaker.record_success()
+        upstream_latency.record(time.monotonic() - started)
+        return response_text
+    
+    @staticmethod
+    async def _cached_api_call(
+        prompt: Prompt,
+        bot: str = "default",
+        cache_key: Optional[Hashable] = None,
+        profile: str = "default"
+    ) -> str:
+        """
+        Serve from the response cache, or call the API and cache the answer
+        
+        Concurrent calls with an identical prompt and profile are coalesced
+        into a single upstream request. Only successful answers are cached;
+        friendly error messages never are.
+        
+        Args:
+            prompt: Prompt to send (stable prefix and per-request body)
+            bot: Caller name, selects the scheduler queue and cache TTL
+            cache_key: Key from response_cache, or None to bypass the cache
+            profile: Generation profile name (see settings.GENERATION_PROFILES)
+        """
+        if cache_key is not None:
+            cached = response_cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
+        reserved = AIService._admit(prompt, bot, cache_key, reserve=True, profile=profile)
+        
+        async def call_and_cache() -> str:
+            try:
+                response_text = await AIService._make_api_call_with_retry(prompt, bot, profile=profile)
+            finally:
+                if reserved:
+                    admission_controller.release()
+            # Cache inside the shared call so the answer is kept even if
+            # every waiter disconnects before it arrives
+            if cache_key is not None:
+                response_cache.set(cache_key, response_text, get_ttl(bot))
+            return response_text
+        
+        return await llm_single_flight.do((profile, prompt), call_and_cache)
+    
+    @staticmethod
+    def _admit(
+        prompt: Prompt,
+        bot: str,
+        cache_key: Optional[Hashable] = None,
+        reserve: bool = False,
+        profile: str = "default"
+    ) -> bool:
+        """
+        Run admission control for a call that would need a new upstream request
+        
+        Cache hits and calls that can join an identical in-flight request
+        cost no upstream capacity, so they are always admitted. Everything
+        else is rejected straight away while the circuit breaker is open.
+        
+        Returns:
+            True if a reservation was taken (caller must release it)
+        
+        Raises:
+            LLMOverloadedError: the bot's queue cannot take more work right now
+        """
+        if cache_key is not None and cache_key in response_cache:
+            return False
+        if llm_single_flight.in_flight((profile, prompt)):
+            return False
+        llm_breaker.check()
+        get_provider().check_capacity()  # Out-of-process worker pool reports backpressure here
+        admission_controller.check(bot, reserve=reserve)
+        return reserve
+    
+    @staticmethod
+    def _stream_api_call(
+        prompt: Prompt,
+        bot: str = "default",
+        cache_key: Optional[Hashable] = None,
+        on_complete: Optional[Callable[[str], None]] = None,
+        profile: str = "default",
+        reserved: bool = False
+    ) -> AsyncIterator[str]:
+        """
+        Stream an API call, yielding text chunks as the model produces them
+        
+        Streaming is not retried: once text has reached the client a retry
+        would duplicate it. Errors are turned into the same friendly
+        messages used by the non-streaming path. A cached answer is sent
+        as a single chunk, and a completed stream is added to the cache.
+        
+        The upstream call starts right away in its own task and buffers
+        chunks for the caller, so its scheduler slot (and admission
+        reservation) is given back when the model finishes, not when a slow
+        client has read the last chunk. A client that goes away cancels it.
+        
+        Args:
+            prompt: Prompt to send (stable prefix and per-request body)
+            bot: Caller name, selects the scheduler queue and cache TTL
+            cache_key: Key from response_cache, or None to bypass the cache
+            on_complete: Called with the full answer after a successful stream
+            profile: Generation profile name (see settings.GENERATION_PROFILES)
+            reserved: An admission reservation was taken (see _admit); released
+                when the upstream call ends
+            
+        Returns:
+            Iterator of partial response text
+        """
+        if cache_key is not None:
+            cached = response_cache.get(cache_key)
+            if cached is not None:
+                if reserved:
+                    admission_controller.release()
+                return AIService._replay(cached, on_complete)
+        
+        chunks: asyncio.Queue = asyncio.Queue()
+        task = asyncio.create_task(
+            AIService._pump_stream(prompt, bot, cache_key, on_complete, profile, reserved, chunks)
+        )
+        stream_tasks.add(task)
+        task.add_done_callback(stream_tasks.discard)
+        return AIService._drain(chunks, task)
+    
+    @staticmethod
+    async def _replay(text: str, on_complete: Optional[Callable[[str], None]]) -> AsyncIterator[str]:
+        yield text
+        if on_complete is not None:
+            on_complete(text)
+    
+    @staticmethod
+    async def _drain(chunks: asyncio.Queue, task: asyncio.Task) -> AsyncIterator[str]:
+        """Yield buffered chunks until the end marker (None)"""
+        try:
+            while True:
+                text = await chunks.get()
+                if text is None:
+                    return
+                yield text
+        finally:
+            # Client went away before the end: stop the upstream call
+            if not task.done():
+                task.cancel()
+    
+    @staticmethod
+    async def _pump_stream(
+        prompt: Prompt,
+        bot: str,
+        cache_key: Optional[Hashable],
+        on_complete: Optional[Callable[[str], None]],
+        profile: str,
+        reserved: bool,
+        chunks: asyncio.Queue
+    ) -> None:
+        """Run one streaming upstream call, putting its chunks (then None) on the queue"""
+        parts = []
+        try:
+            try:
+                async with llm_scheduler.slot(bot):
+                    llm_breaker.before_call()
+                    try:
+                        stream = get_provider().stream(prompt.body, get_generation_config(profile), prefix=prompt.prefix)
+                        while True:
+                            try:
+                                # Time out each chunk so a stalled stream frees its slot
+                                text = await asyncio.wait_for(stream.__anext__(), timeout=settings.LLM_REQUEST_TIMEOUT)
+                            except StopAsyncIteration:
+                                break
+                            parts.append(text)
+                            chunks.put_nowait(text)
+                    except RETRYABLE_ERRORS:
+                        llm_breaker.record_failure()
+                        raise
+                    except BaseException:
+                        # Client went away mid-stream, the worker pool is full, or the request
+                        # itself was refused (e.g. safety block): no verdict on the upstream
+                        llm_breaker.release_probe()
+                        raise
+                    llm_breaker.record_success()
+            finally:
+                if reserved:
+                    admission_controller.release()
+        except Exception as e:
+            error_message = str(e)
+            print(f"❌ API Streaming Error: {type(e).__name__}: {error_message}")
+            if isinstance(e, (LLMRateLimitError, LLMOverloadedError)):
+                chunks.put_nowait(RATE_LIMIT_MESSAGE)
+            else:
+                chunks.put_nowait(TECHNICAL_ERROR_MESSAGE)
+            chunks.put_nowait(None)
+            return
+        
+        response_text = "".join(parts).strip()
+        if cache_key is not None and parts:
+            response_cache.set(cache_key, response_text, get_ttl(bot))
+        if on_complete is not None and parts:
+            on_complete(response_text)
+        chunks.put_nowait(None)
+    
+    # ============================================
+    # CONVERSATION MEMORY
+    # ============================================
+    
+    @staticmethod
+    def _conversation_history(bot: str, session_id: Optional[str], history: Optional[List[dict]]) -> str:
+        """
+        History block for the prompt, within the conversation token budget
+        
+        With a session id the server-side conversation is used; client-sent
+        history only seeds a session the server has not seen yet (e.g.
+        after a restart). Without one, client history is used as-is.
+        """
+        if session_id:
+            if history:
+                conversation_store.seed(bot, session_id, history)
+            return conversation_store.history_block(bot, session_id)
+        return conversation_store.render("", normalize_history(history))
+    
+    @staticmethod
+    def remember_exchange(
+        bot: str,
+        session_id: Optional[str],
+        user_message: str,
+        reply: str,
+        history: Optional[List[dict]] = None
+    ) -> None:
+        """
+        Record an answered message in the session's conversation, however it was answered
+        
+        Client-sent history seeds a session the server has not seen yet,
+        as it does for model answers.
+        """
+        if not session_id:
+            return
+        if history:
+            conversation_store.seed(bot, session_id, history)
+        conversation_store.append(bot, session_id, user_message, reply)
+        conversation_store.schedule_compaction(bot, session_id, AIService.summarize_conversation)
+    
+    @staticmethod
+    def _remember(bot: str, session_id: Optional[str], user_message: str) -> Callable[[str], None]:
+        """Callback that records a completed answer in the session's conversation"""
+        def record(reply: str) -> None:
+            AIService.remember_exchange(bot, session_id, user_message, reply)
+        return record
+    
+    @staticmethod
+    async def summarize_conversation(summary: str, turns: List[Turn]) -> str:
+        """
+        Fold older turns into the running conversation summary
+        
+        Raises:
+            LLMOverloadedError, AIServiceError: the summary stays as it was
+        """
+        transcript = "\n".join(format_turn(turn) for turn in turns)
+        previous = f"Summary so far: {summary}\n\n" if summary else ""
+        prompt = Prompt(SUMMARY_PROMPT, f"""{previous}Conversation:
+{transcript}
+
+Summary:""")
+        return await AIService._make_api_call_with_retry(prompt, "default", profile="summary")
+    
+    # ============================================
+    # TRANSLATION
+    # ============================================
+    
+    @staticmethod
+    async def translate(text: str, language: str, bot: str = "default") -> str:
+        """
+        An English answer in the user's language
+        
+        Answers are generated (and cached) once in English; each translation
+        is cached under the exact English text and language, so a repeated
+        question in Hindi or Telugu costs two cache lookups, not a model
+        call. Conversation memory keeps the English answer.
+        If the translation cannot be made right now, the English answer is
+        returned rather than nothing.
+        
+        Args:
+            text: English answer
+            language: Requested language code (en, hi, te; anything else is English)
+            bot: Caller name, selects the scheduler queue and cache TTL
+        """
+        language = language_code(language)
+        if language == DEFAULT_LANGUAGE or not text:
+            return text
+        
+        translation_counts["requests"] += 1
+        cache_key = translation_cache_key(text, language)
+        if cache_key in response_cache:
+            translation_counts["cache_hits"] += 1
+        try:
+            return await AIService._cached_api_call(
+                prompt_assembly.translation_prompt(text, language), bot, cache_key, "translation"
+            )
+        except (LLMOverloadedError, AIServiceError) as e:
+            translation_counts["fallbacks"] += 1
+            print(f"⚠️  Translation to '{language}' unavailable, answering in English: {e}")
+            return text
+    
+    @staticmethod
+    async def stream_translation(chunks: AsyncIterator[str], language: str, bot: str = "default") -> AsyncIterator[str]:
+        """
+        Stream an English answer in the user's language
+        
+        English chunks pass straight through. Otherwise the English answer
+        is collected first, then its translation is streamed (or sent in
+        one chunk from the cache), falling back to English when the
+        translation is shed.
+        """
+        language = language_code(language)
+        if language == DEFAULT_LANGUAGE:
+            async for text in chunks:
+                yield text
+            return
+        
+        text = "".join([part async for part in chunks]).strip()
+        if not text:
+            return
+        translation_counts["requests"] += 1
+        prompt = prompt_assembly.translation_prompt(text, language)
+        cache_key = translation_cache_key(text, language)
+        if cache_key in response_cache:
+            translation_counts["cache_hits"] += 1
+        try:
+            reserved = AIService._admit(prompt, bot, cache_key, reserve=True, profile="translation")
+        except LLMOverloadedError as e:
+            translation_counts["fallbacks"] += 1
+            print(f"⚠️  Translation to '{language}' unavailable, answering in English: {e}")
+            yield text
+            return
+        async for part in AIService._stream_api_call(prompt, bot, cache_key, profile="translation", reserved=reserved):
+            yield part
+    
+    # ============================================
+    # PROMPT BUILDERS
+    # ============================================
+    
+    @staticmethod
+    def build_period_prompt(
+        user_message: str,
+        age: int,
+        last_period_date: str,
+        next_period_prediction: str,
+        days_since: int,
+        history: str = ""
+    ) -> Prompt:
+        """Build the Period Care Bot prompt with user context and conversation history"""
+        return prompt_assembly.period_prompt(
+            user_message, age, last_period_date, next_period_prediction, days_since, history
+        )
+    
+    @staticmethod
+    def build_pregnancy_prompt(
+        user_message: str,
+        confirmation_date: str,
+        weeks_pregnant: int,
+        trimester: str,
+        due_date: str,
+        history: str = ""
+    ) -> Prompt:
+        """Build the Pregnancy Care Bot prompt with user context and conversation history"""
+        return prompt_assembly.pregnancy_prompt(
+            user_message, confirmation_date, weeks_pregnant, trimester, due_date, history
+        )
+    
+    @staticmethod
+    def build_chat_prompt(user_message: str, system_prompt: str, context: str = "") -> Prompt:
+        """Build a generic prompt from a custom system prompt and optional per-request context"""
+        return prompt_assembly.chat_prompt(user_message, system_prompt, context)
     
     @staticmethod
     async def get_period_chat_response(
@@ -69,7 +546,13 @@ class AIService:
         age: int,
         last_period_date: str,
         next_period_prediction: str,
-        days_since: int
+        days_since: int,
+        use_cache: bool = True,
+        session_id: Optional[str] = None,
+        history: Optional[List[dict]] = None,
+        profile: str = "period_chat",
+        cycle_length: int = settings.DEFAULT_CYCLE_LENGTH,
+        language: str = DEFAULT_LANGUAGE
     ) -> str:
         """
         Get response from Period Care Bot
@@ -80,31 +563,39 @@ class AIService:
             last_period_date: Date of last period
             next_period_prediction: Calculated next period date
             days_since: Days since last period
+            use_cache: Reuse a cached answer for the same question and cycle phase
+            session_id: Conversation to continue and record this exchange in
+            history: Client-sent earlier messages, used when the server has none
+            profile: Generation profile name (see settings.GENERATION_PROFILES)
+            cycle_length: The user's cycle length used for the prediction
+            language: Answer language (en, hi, te); see translate()
             
         Returns:
             AI-generated response string
         """
         try:
-            # Build context-aware system prompt
-            context_prompt = get_period_context_prompt(
+            # Combine system prompt with context, conversation and user message
+            history_text = AIService._conversation_history("period", session_id, history)
+            full_prompt = AIService.build_period_prompt(
+                user_message=user_message,
                 age=age,
                 last_period_date=last_period_date,
                 next_period_prediction=next_period_prediction,
-                days_since=days_since
+                days_since=days_since,
+                history=history_text
             )
-            
-            # Combine system prompt with context and user message
-            full_prompt = f"""{PERIOD_CARE_SYSTEM_PROMPT}
-
-{context_prompt}
-
-User's Message: {user_message}
-
-Respond as a caring friend. Be warm, empathetic, and conversational. Answer their question completely and thoroughly. If they're sharing pain or discomfort, comfort them first. Make them feel heard and supported:"""
+            # Answers that depend on earlier turns are not shared through the cache
+            cache_key = period_cache_key(user_message, age, days_since, cycle_length) if use_cache and not history_text else None
             
             # Call API with retry logic
-            return AIService._make_api_call_with_retry(full_prompt)
+            response_text = await AIService._cached_api_call(full_prompt, "period", cache_key, profile)
+            AIService._remember("period", session_id, user_message)(response_text)
+            return await AIService.translate(response_text, language, "period")
             
+        except LLMOverloadedError:
+            raise
+        except AIServiceError as e:
+            return e.user_message
         except Exception as e:
             # Handle unexpected errors gracefully
             return "I'm having a small technical hiccup right now. Please try again in a moment! I'm here for you. 💕"
@@ -115,7 +606,12 @@ Respond as a caring friend. Be warm, empathetic, and conversational. Answer thei
         confirmation_date: str,
         weeks_pregnant: int,
         trimester: str,
-        due_date: str
+        due_date: str,
+        use_cache: bool = True,
+        session_id: Optional[str] = None,
+        history: Optional[List[dict]] = None,
+        profile: str = "pregnancy_chat",
+        language: str = DEFAULT_LANGUAGE
     ) -> str:
         """
         Get response from Pregnancy Care Bot
@@ -126,76 +622,225 @@ Respond as a caring friend. Be warm, empathetic, and conversational. Answer thei
             weeks_pregnant: Current pregnancy week
             trimester: Current trimester
             due_date: Estimated due date
+            use_cache: Reuse a cached answer for the same question and week
+            session_id: Conversation to continue and record this exchange in
+            history: Client-sent earlier messages, used when the server has none
+            profile: Generation profile name (see settings.GENERATION_PROFILES)
+            language: Answer language (en, hi, te); see translate()
             
         Returns:
             AI-generated response string
         """
         try:
-            # Build context-aware system prompt
-            context_prompt = get_pregnancy_context_prompt(
+            # Combine system prompt with context, conversation and user message
+            history_text = AIService._conversation_history("pregnancy", session_id, history)
+            full_prompt = AIService.build_pregnancy_prompt(
+                user_message=user_message,
                 confirmation_date=confirmation_date,
                 weeks_pregnant=weeks_pregnant,
                 trimester=trimester,
-                due_date=due_date
+                due_date=due_date,
+                history=history_text
             )
-            
-            # Combine system prompt with context and user message
-            full_prompt = f"""{PREGNANCY_CARE_SYSTEM_PROMPT}
-
-{context_prompt}
-
-User's Message: {user_message}
-
-Respond as a caring friend. Be warm, empathetic, and conversational. Answer their question completely and thoroughly. If they're sharing pain or discomfort, comfort them first. Make them feel heard and supported:"""
+            # Answers that depend on earlier turns are not shared through the cache
+            cache_key = pregnancy_cache_key(user_message, weeks_pregnant) if use_cache and not history_text else None
             
             # Call API with retry logic
-            return AIService._make_api_call_with_retry(full_prompt)
+            response_text = await AIService._cached_api_call(full_prompt, "pregnancy", cache_key, profile)
+            AIService._remember("pregnancy", session_id, user_message)(response_text)
+            return await AIService.translate(response_text, language, "pregnancy")
             
+        except LLMOverloadedError:
+            raise
+        except AIServiceError as e:
+            return e.user_message
         except Exception as e:
             # Handle unexpected errors gracefully
             return "I'm having a small technical hiccup right now. Please try again in a moment! I'm here for you. 💕"
     
     @staticmethod
-    async def get_chat_response(user_message: str, system_prompt: str) -> str:
+    async def get_chat_response(
+        user_message: str,
+        system_prompt: str,
+        bot: str = "default",
+        use_cache: bool = True,
+        profile: str = "default",
+        context: str = ""
+    ) -> str:
         """
         Generic chat response method for any bot with custom system prompt
         
         Args:
             user_message: User's question or message
-            system_prompt: Custom system prompt for the specific bot
+            system_prompt: Custom system prompt for the specific bot; keep it
+                static so it can be reused as a cached prefix
+            bot: Caller name (krishi, schemes, ...), selects the scheduler queue and cache namespace
+            use_cache: Reuse a cached answer for the same prompt and message
+            profile: Generation profile name (see settings.GENERATION_PROFILES)
+            context: Per-request context block (user details, retrieved knowledge)
             
         Returns:
             AI-generated response string
         """
         try:
-            # Combine system prompt with user message
-            full_prompt = f"""{system_prompt}
-
-User's Message: {user_message}
-
-Respond warmly and helpfully:"""
+            # Combine system prompt with context and user message
+            full_prompt = AIService.build_chat_prompt(user_message, system_prompt, context)
+            cache_key = prompt_cache_key(f"{bot}:{profile}", user_message, f"{system_prompt}\n\n{context}") if use_cache else None
             
             # Call API with retry logic
-            return AIService._make_api_call_with_retry(full_prompt)
+            return await AIService._cached_api_call(full_prompt, bot, cache_key, profile)
             
+        except LLMOverloadedError:
+            raise
+        except AIServiceError as e:
+            return e.user_message
         except Exception as e:
             # Handle unexpected errors gracefully
             return "I'm having a small technical hiccup right now. Please try again in a moment!"
     
     @staticmethod
-    def test_connection() -> bool:
+    def forget_chat_response(
+        user_message: str,
+        system_prompt: str,
+        bot: str = "default",
+        profile: str = "default",
+        context: str = ""
+    ) -> None:
+        """Drop a cached get_chat_response answer the caller could not use (e.g. malformed JSON)"""
+        response_cache.delete(prompt_cache_key(f"{bot}:{profile}", user_message, f"{system_prompt}\n\n{context}"))
+    
+    # ============================================
+    # STREAMING RESPONSES
+    # ============================================
+    
+    @staticmethod
+    def stream_period_chat_response(
+        user_message: str,
+        age: int,
+        last_period_date: str,
+        next_period_prediction: str,
+        days_since: int,
+        use_cache: bool = True,
+        session_id: Optional[str] = None,
+        history: Optional[List[dict]] = None,
+        profile: str = "period_chat",
+        cycle_length: int = settings.DEFAULT_CYCLE_LENGTH,
+        language: str = DEFAULT_LANGUAGE
+    ) -> AsyncIterator[str]:
+        """
+        Stream response from Period Care Bot, chunk by chunk
+        
+        Takes the same arguments as get_period_chat_response. Admission control runs
+        before the iterator is returned, so an overloaded call raises
+        LLMOverloadedError instead of starting a stream.
+        """
+        history_text = AIService._conversation_history("period", session_id, history)
+        full_prompt = AIService.build_period_prompt(
+            user_message=user_message,
+            age=age,
+            last_period_date=last_period_date,
+            next_period_prediction=next_period_prediction,
+            days_since=days_since,
+            history=history_text
+        )
+        cache_key = period_cache_key(user_message, age, days_since, cycle_length) if use_cache and not history_text else None
+        reserved = AIService._admit(full_prompt, "period", cache_key, reserve=True, profile=profile)
+        chunks = AIService._stream_api_call(
+            full_prompt, "period", cache_key,
+            on_complete=AIService._remember("period", session_id, user_message),
+            profile=profile,
+            reserved=reserved
+        )
+        return AIService.stream_translation(chunks, language, "period")
+    
+    @staticmethod
+    def stream_pregnancy_chat_response(
+        user_message: str,
+        confirmation_date: str,
+        weeks_pregnant: int,
+        trimester: str,
+        due_date: str,
+        use_cache: bool = True,
+        session_id: Optional[str] = None,
+        history: Optional[List[dict]] = None,
+        profile: str = "pregnancy_chat",
+        language: str = DEFAULT_LANGUAGE
+    ) -> AsyncIterator[str]:
         """
-        Test Google Gemini API connection
+        Stream response from Pregnancy Care Bot, chunk by chunk
+        
+        Takes the same arguments as get_pregnancy_chat_response. Admission control runs
+        before the iterator is returned, so an overloaded call raises
+        LLMOverloadedError instead of starting a stream.
+        """
+        history_text = AIService._conversation_history("pregnancy", session_id, history)
+        full_prompt = AIService.build_pregnancy_prompt(
+            user_message=user_message,
+            confirmation_date=confirmation_date,
+            weeks_pregnant=weeks_pregnant,
+            trimester=trimester,
+            due_date=due_date,
+            history=history_text
+        )
+        cache_key = pregnancy_cache_key(user_message, weeks_pregnant) if use_cache and not history_text else None
+        reserved = AIService._admit(full_prompt, "pregnancy", cache_key, reserve=True, profile=profile)
+        chunks = AIService._stream_api_call(
+            full_prompt, "pregnancy", cache_key,
+            on_complete=AIService._remember("pregnancy", session_id, user_message),
+            profile=profile,
+            reserved=reserved
+        )
+        return AIService.stream_translation(chunks, language, "pregnancy")
+    
+    @staticmethod
+    def stream_chat_response(
+        user_message: str,
+        system_prompt: str,
+        bot: str = "default",
+        use_cache: bool = True,
+        profile: str = "default",
+        context: str = ""
+    ) -> AsyncIterator[str]:
+        """
+        Stream a generic chat response, chunk by chunk
+        
+        Takes the same arguments as get_chat_response. Admission control runs
+        before the iterator is returned, so an overloaded call raises
+        LLMOverloadedError instead of starting a stream.
+        """
+        full_prompt = AIService.build_chat_prompt(user_message, system_prompt, context)
+        cache_key = prompt_cache_key(f"{bot}:{profile}", user_message, f"{system_prompt}\n\n{context}") if use_cache else None
+        reserved = AIService._admit(full_prompt, bot, cache_key, reserve=True, profile=profile)
+        return AIService._stream_api_call(full_prompt, bot, cache_key, profile=profile, reserved=reserved)
+    
+    @staticmethod
+    def metrics() -> Dict:
+        """Counters for the response cache, request coalescing, scheduler and resilience"""
+        provider = get_provider()
+        return {
+            "prompt_assembly": prompt_assembly.stats(),
+            "pregnancy_content": pregnancy_content.stats(),
+            "provider": provider.stats(),
+            "response_cache": response_cache.stats(),
+            "single_flight": llm_single_flight.stats(),
+            "scheduler": llm_scheduler.stats(),
+            "admission": admission_controller.stats(),
+            "circuit_breaker": llm_breaker.stats(),
+            "hedging": hedge_stats.stats(),
+            "conversations": conversation_store.stats(),
+            "translation": dict(translation_counts)
+        }
+    
+    @staticmethod
+    async def test_connection() -> bool:
+        """
+        Test connection to the configured LLM provider
         
         Returns:
             True if connection successful, False otherwise
         """
         try:
-            response = model.generate_content(
-                "test",
-                generation_config=genai.types.GenerationConfig(max_output_tokens=5)
-            )
-            return True
+            return await asyncio.wait_for(get_provider().ping(), timeout=settings.LLM_REQUEST_TIMEOUT)
         except Exception as e:
-            print(f"Google Gemini connection test failed: {e}")
+            print(f"LLM connection test failed: {e}")
             return False
@@ -0,0 +1,95 @@
+"""
+In-Process Cache
+
+Small size-bounded LRU cache with per-entry TTLs and hit/miss counters.
+Used for AI responses and other hot read paths within one worker.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+_MISSING = object()
+
+
+class TTLLRUCache:
+    """
+    LRU cache where every entry also expires after a TTL
+    
+    - get/set are O(1)
+    - the least recently used entry is evicted when max_entries is reached
+    - expired entries are dropped lazily when they are read
+    """
+    
+    def __init__(self, max_entries: int = 1024, default_ttl: float = 300):
+        """
+        :param max_entries: Maximum number of entries kept in memory
+        :param default_ttl: TTL in seconds used when set() is not given one
+        """
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+    
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value, or default on a miss or expired entry"""
+        entry = self._entries.get(key, _MISSING)
+        
+        if entry is _MISSING:
+            self.misses += 1
+            return default
+        
+        value, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return default
+        
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+    
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value, evicting the least recently used entry if full"""
+        ttl = self.default_ttl if ttl is None else ttl
+        
+        if key in self._entries:
+            self._entries.move_to_end(key)
+        self._entries[key] = (value, time.monotonic() + ttl)
+        
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+    
+    def delete(self, key: Hashable) -> bool:
+        """Remove one entry. Returns True if it was present"""
+        return self._entries.pop(key, _MISSING) is not _MISSING
+    
+    def clear(self) -> None:
+        """Remove all entries (counters are kept)"""
+        self._entries.clear()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def __contains__(self, key: Hashable) -> bool:
+        entry = self._entries.get(key, _MISSING)
+        return entry is not _MISSING and entry[1] > time.monotonic()
+    
+    def stats(self) -> Dict[str, Any]:
+        """Counters for the /metrics endpoint"""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations
+        }
@@ -0,0 +1,332 @@
+"""
+Catalog Cache
+
+Read-through cache for the Skill Hub catalog, which is read far more
+often than it is written:
+
+    ("creator", id)                 full creator profile (/creator/{id})
+    ("page", list, cursor, limit)   a page of /creators or /products
+    ("creator_products", name)      /products/creator/{name}
+
+Entries hold encoded JSON bodies, so a hit costs neither a MongoDB query
+nor serialization. Concurrent misses for one key share a single load.
+Entries are bounded by count (LRU) and age (TTL); the TTL also caps how
+stale anything can get if an invalidation is lost.
+
+Invalidation is precise. Each cached page remembers the (created_at, _id)
+range it covers; a new creator or product drops only the pages whose range
+it falls into (usually just the first page per page size) plus the
+per-creator list it belongs to. Pages further down stay valid because
+keyset cursors do not shift when items are inserted above them.
+
+With several uvicorn workers, each process has its own cache. Writes are
+also published to a small capped MongoDB collection (cache_events) that
+every worker tails, so all processes drop the same entries within
+milliseconds. No extra infrastructure is needed. If the channel breaks,
+the listener clears the local cache once and reconnects with exponential
+backoff; after repeated failures it gives up and the TTL bounds staleness.
+"""
+
+import asyncio
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+from bson import ObjectId
+from pymongo import CursorType
+from pymongo.errors import CollectionInvalid
+from app.config.settings import settings
+from app.services.cache import TTLLRUCache
+from app.services.pagination import decode_cursor
+from app.services.single_flight import SingleFlight
+
+# Page lists and the per-creator product lists
+CREATORS = "creators"
+PRODUCTS = "products"
+
+EVENTS_COLLECTION = "cache_events"
+
+# Wait before re-opening the invalidation feed; doubles after each consecutive error
+LISTEN_RETRY_SECONDS = 2.0
+LISTEN_MAX_RETRY_SECONDS = 60.0
+
+# Consecutive feed errors after which the channel is switched off
+LISTEN_MAX_ERRORS = 8
+
+SortKey = Tuple[datetime, ObjectId]
+
+
+def sort_key(created_at: datetime, oid: ObjectId) -> SortKey:
+    """(created_at, _id) as MongoDB stores it: naive UTC, millisecond precision"""
+    if created_at.tzinfo is not None:
+        created_at = created_at.astimezone(timezone.utc).replace(tzinfo=None)
+    return created_at.replace(microsecond=created_at.microsecond // 1000 * 1000), oid
+
+
+class PageRange:
+    """Sort keys a cached page covers: below upper and above lower (None = unbounded)"""
+
+    __slots__ = ("upper", "lower")
+
+    def __init__(self, upper: Optional[SortKey], lower: Optional[SortKey]):
+        self.upper = upper
+        self.lower = lower
+
+    def covers(self, key: SortKey) -> bool:
+        return (self.upper is None or key < self.upper) and (self.lower is None or key > self.lower)
+
+
+class CatalogCache:
+    """
+    Read-through catalog cache with precise, cross-worker invalidation
+
+    Usage:
+        body = await catalog_cache.read(("creator", creator_id), load_creator)
+        body = await catalog_cache.read_page(PRODUCTS, cursor, limit, load_page)
+        await catalog_cache.item_added(PRODUCTS, created_at, product_id, creator_name)
+    """
+
+    def __init__(self, max_entries: int = 2000, ttl: float = 300):
+        self._cache = TTLLRUCache(max_entries=max_entries, default_ttl=ttl)
+        self._flight = SingleFlight()
+        self._ranges: Dict[str, Dict[Hashable, PageRange]] = {CREATORS: {}, PRODUCTS: {}}
+        self._generation = 0  # Bumped by every invalidation; loads that raced one are not stored
+        self._subscribers: List[Callable[[Dict], None]] = []
+
+        self.origin = uuid.uuid4().hex
+        self._events = None
+        self._listener: Optional[asyncio.Task] = None
+
+        self.hits: Dict[str, int] = {}
+        self.misses: Dict[str, int] = {}
+        self.invalidations = 0
+        self.remote_invalidations = 0
+        self.channel_errors = 0
+
+    # ---------- reads ----------
+
+    async def read(self, key: Tuple, load: Callable[[], Awaitable[Any]]) -> Optional[str]:
+        """
+        Cached body for key, loading it on a miss
+
+        :param key: Cache key; its kind (key[0], or the list for pages) labels hit-rate metrics
+        :param load: Coroutine function returning the encoded body, or None
+            for "not found" (not cached); page loads return (body, PageRange)
+        """
+        kind = f"{key[1]}_page" if key[0] == "page" else key[0]
+        body = self._cache.get(key)
+        if body is not None:
+            self.hits[kind] = self.hits.get(kind, 0) + 1
+            return body
+
+        self.misses[kind] = self.misses.get(kind, 0) + 1
+        return await self._flight.do(key, lambda: self._load(key, load))
+
+    async def _load(self, key: Tuple, load: Callable[[], Awaitable[Any]]) -> Optional[str]:
+        generation = self._generation
+        result = await load()
+        body, page_range = result if isinstance(result, tuple) else (result, None)
+        if body is not None and generation == self._generation:
+            self._cache.set(key, body)
+            if page_range is not None:
+                ranges = self._ranges[key[1]]
+                ranges[key] = page_range
+                if len(ranges) > self._cache.max_entries:
+                    self._prune(ranges)
+        return body
+
+    def _prune(self, ranges: Dict[Hashable, PageRange]) -> None:
+        """Forget ranges of pages the LRU evicted or the TTL expired"""
+        for page_key in [page_key for page_key in ranges if page_key not in self._cache]:
+            del ranges[page_key]
+
+    async def read_page(
+        self,
+        name: str,
+        cursor: Optional[str],
+        limit: int,
+        load: Callable[[], Awaitable[Tuple[str, Optional[SortKey]]]]
+    ) -> str:
+        """
+        Cached page of a list
+
+        :param load: Returns the encoded page and the sort key of its last
+            item when another page follows (None on the last page)
+
+        Raises:
+            ValueError: invalid cursor
+        """
+        upper = sort_key(*decode_cursor(cursor)) if cursor else None
+
+        async def load_with_range():
+            body, lower = await load()
+            return body, PageRange(upper, lower)
+
+        return await self.read(("page", name, cursor, limit), load_with_range)
+
+    # ---------- invalidation ----------
+
+    def subscribe(self, callback: Callable[[Dict], None]) -> None:
+        """Also pass every catalog change, local or remote, to callback (e.g. the search index)"""
+        self._subscribers.append(callback)
+
+    def _drop(self, key: Tuple) -> None:
+        self._cache.delete(key)
+        if key[0] == "page":
+            self._ranges[key[1]].pop(key, None)
+
+    def apply(self, event: Dict) -> None:
+        """Drop the entries a catalog change affects (local or from another worker)"""
+        self._generation += 1
+        self.invalidations += 1
+        op = event["op"]
+
+        if op == "clear":
+            self._cache.clear()
+            for ranges in self._ranges.values():
+                ranges.clear()
+
+        elif op == "added":
+            key = sort_key(event["created_at"], event["item_id"])
+            ranges = self._ranges[event["list"]]
+            self._prune(ranges)
+            for page_key in [page_key for page_key, page_range in ranges.items() if page_range.covers(key)]:
+                self._drop(page_key)
+            if event.get("creator_name") is not None:
+                self._drop(("creator_products", event["creator_name"]))
+
+        for callback in self._subscribers:
+            callback(event)
+
+    async def item_added(
+        self,
+        name: str,
+        created_at: datetime,
+        item_id: ObjectId,
+        creator_name: Optional[str] = None
+    ) -> None:
+        """
+        A creator (name=CREATORS) or product (PRODUCTS) was inserted
+
+        :param creator_name: For products, the per-creator list to drop
+        """
+        await self._publish({
+            "op": "added",
+            "list": name,
+            "created_at": created_at,
+            "item_id": item_id,
+            "creator_name": creator_name
+        })
+
+    async def clear(self) -> None:
+        """Drop everything (bulk writes such as the demo seed)"""
+        await self._publish({"op": "clear"})
+
+    async def _publish(self, event: Dict) -> None:
+        self.apply(event)
+        if self._events is None:
+            return
+        try:
+            await self._events.insert_one({**event, "origin": self.origin})
+        except Exception as e:
+            # Other workers catch up when their entries expire (TTL)
+            self.channel_errors += 1
+            print(f"⚠️  Catalog cache invalidation not published: {e}")
+
+    # ---------- cross-worker channel ----------
+
+    async def start(self, database) -> None:
+        """Open the invalidation channel and start listening (app startup)"""
+        if not settings.CATALOG_CACHE_CHANNEL or self._listener is not None:
+            return
+        try:
+            await database.create_collection(
+                EVENTS_COLLECTION, capped=True, size=settings.CATALOG_CACHE_CHANNEL_BYTES
+            )
+        except CollectionInvalid:
+            # Already exists: created by another worker, or by hand without capped=True
+            try:
+                options = await database[EVENTS_COLLECTION].options()
+            except Exception as e:
+                print(f"⚠️  Catalog cache channel unavailable: {e}")
+                return
+            if not options.get("capped"):
+                print(f"⚠️  Catalog cache channel off: '{EVENTS_COLLECTION}' exists but is not capped, so it cannot be tailed")
+                return
+        except Exception as e:
+            # Without the feed each worker still invalidates its own cache; others rely on the TTL
+            print(f"⚠️  Catalog cache channel unavailable: {e}")
+            return
+        self._events = database[EVENTS_COLLECTION]
+        self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+        self._listener = None
+        self._events = None
+
+    async def _listen(self) -> None:
+        # Events from before this worker started are irrelevant: its cache was empty.
+        # The marker keeps the tailable cursor alive on an otherwise empty collection.
+        after = ObjectId.from_datetime(datetime.now(timezone.utc) - timedelta(seconds=1))
+        await self._events.insert_one({"op": "start", "origin": self.origin})
+
+        errors = 0  # Consecutive failures; reset once the feed delivers again
+        while True:
+            try:
+                cursor = self._events.find({"_id": {"$gt": after}}, cursor_type=CursorType.TAILABLE_AWAIT)
+                async for event in cursor:
+                    after = event["_id"]
+                    errors = 0
+                    if event.get("origin") != self.origin and event["op"] != "start":
+                        self.remote_invalidations += 1
+                        self.apply(event)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                errors += 1
+                self.channel_errors += 1
+                if errors >= LISTEN_MAX_ERRORS:
+                    print(f"⚠️  Catalog cache channel off after {errors} errors in a row, relying on the TTL: {e}")
+                    self._events = None
+                    return
+                if errors == 1:
+                    # Events may have been missed: start clean, once per run of errors
+                    print(f"⚠️  Catalog cache channel error, clearing local cache: {e}")
+                    self.apply({"op": "clear"})
+                await asyncio.sleep(min(LISTEN_RETRY_SECONDS * 2 ** (errors - 1), LISTEN_MAX_RETRY_SECONDS))
+                continue
+            await asyncio.sleep(LISTEN_RETRY_SECONDS)
+
+    # ---------- metrics ----------
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters for the /metrics endpoint"""
+        kinds = sorted(set(self.hits) | set(self.misses))
+        return {
+            **self._cache.stats(),
+            "by_kind": {
+                kind: {
+                    "hits": self.hits.get(kind, 0),
+                    "misses": self.misses.get(kind, 0),
+                    "hit_rate": round(self.hits.get(kind, 0) / (self.hits.get(kind, 0) + self.misses.get(kind, 0)), 4)
+                }
+                for kind in kinds
+            },
+            "cached_pages": {name: len(ranges) for name, ranges in self._ranges.items()},
+            "invalidations": self.invalidations,
+            "remote_invalidations": self.remote_invalidations,
+            "channel": "listening" if self._listener is not None and not self._listener.done() else "off",
+            "channel_errors": self.channel_errors,
+            "single_flight": self._flight.stats()
+        }
+
+
+catalog_cache = CatalogCache(
+    max_entries=settings.CATALOG_CACHE_MAX_ENTRIES,
+    ttl=settings.CATALOG_CACHE_TTL_SECONDS
+)
@@ -0,0 +1,221 @@
+"""
+Catalog Search
+
+Ranked search over creators and products for /api/skill-hub/search,
+served from an in-process inverted index (text_index.SearchIndex) so a
+query never scans MongoDB:
+
+    hits = catalog_search.search("mitti ka matka", kind="product", k=20)
+    # [("product", ObjectId("..."), 7.9), ...]
+
+- Fields: product name, category and description; creator name, skill,
+  village and experience, weighted so names and categories outrank words
+  deep in a description
+- Hindi in Devanagari, Hinglish and English spellings of a word fold to
+  one term (मटका / matka, saree / sari), and the last word matches as a
+  prefix for type-ahead
+- Each worker loads the index from MongoDB at startup, in batches that
+  yield to the event loop (retrying with backoff until it succeeds), then
+  follows catalog changes through the
+  catalog cache's invalidation feed, so new creators and products become
+  searchable in every worker without a rebuild
+
+The index holds ids and term statistics only; the route reads the
+matching documents back by _id with the usual summary projections.
+"""
+
+import asyncio
+import time
+from typing import Dict, List, Optional, Set, Tuple
+from bson import ObjectId
+from app.config.settings import settings
+from app.services.catalog_cache import CREATORS, PRODUCTS, catalog_cache
+from app.services.database import get_database
+from app.services.text_index import SearchIndex
+
+CREATOR = "creator"
+PRODUCT = "product"
+
+# Index groups, so a search can be limited to one kind
+GROUPS = {CREATOR: 1, PRODUCT: 2}
+
+SEARCH_FIELDS = {
+    "product_name": 3.0,
+    "name": 2.5,
+    "skill_category": 2.0,
+    "category": 2.0,
+    "village": 1.5,
+    "description": 1.0,
+    "experience": 1.0,
+}
+
+CREATOR_PROJECTION = {"name": 1, "skill_category": 1, "village": 1, "experience": 1}
+PRODUCT_PROJECTION = {"product_name": 1, "category": 1, "description": 1, "creator_name": 1, "available": 1}
+
+# Documents indexed between yields to the event loop while loading
+LOAD_BATCH_SIZE = 1000
+
+# Wait before retrying a failed load; doubles after each failure
+LOAD_RETRY_SECONDS = 2.0
+LOAD_MAX_RETRY_SECONDS = 60.0
+
+# Catalog list -> (search kind, collection, projection, filter)
+SOURCES = {
+    CREATORS: (CREATOR, "creators", CREATOR_PROJECTION, {}),
+    PRODUCTS: (PRODUCT, "products", PRODUCT_PROJECTION, {"available": True}),
+}
+
+
+def new_index() -> SearchIndex:
+    return SearchIndex(SEARCH_FIELDS, max_expansions=settings.SEARCH_PREFIX_EXPANSIONS)
+
+
+class CatalogSearch:
+    """Per-worker search index over the catalog, kept current on writes"""
+
+    def __init__(self):
+        self.index = new_index()
+        self.ready = False
+        self._loading: Optional[asyncio.Task] = None
+        self._reload_requested = False  # A reload asked for while a load was running
+        self._pending: List[Tuple[str, ObjectId]] = []  # Items added while a load runs
+        self._tasks: Set[asyncio.Task] = set()
+
+        self.loads = 0
+        self.load_failures = 0
+        self.load_seconds = 0.0
+        self.indexed_on_write = 0
+        self.searches = 0
+
+    # ---------- lifecycle ----------
+
+    def start(self) -> None:
+        """Load the index in the background and follow catalog changes (app startup)"""
+        catalog_cache.subscribe(self._on_change)
+        self.reload()
+
+    def reload(self) -> None:
+        """
+        Rebuild from MongoDB; the current index keeps serving until the new one is ready
+
+        A reload asked for while a load is running (e.g. the demo seed
+        clearing the catalog mid-load) runs again once that load finishes.
+        """
+        if self._loading is None or self._loading.done():
+            self._loading = asyncio.create_task(self._load_until_done())
+        else:
+            self._reload_requested = True
+
+    async def stop(self) -> None:
+        for task in [self._loading, *self._tasks]:
+            if task is not None and not task.done():
+                task.cancel()
+        self._loading = None
+
+    async def _load_until_done(self) -> None:
+        """Load, retrying with backoff while MongoDB is unreachable, and again if a reload was requested meanwhile"""
+        delay = LOAD_RETRY_SECONDS
+        while True:
+            self._reload_requested = False
+            if await self._load():
+                if not self._reload_requested:
+                    return
+                continue
+            self.load_failures += 1
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, LOAD_MAX_RETRY_SECONDS)
+
+    async def _load(self) -> bool:
+        """One load from MongoDB; False if it failed"""
+        database = get_database()
+        if database is None:
+            print("⚠️  Search index not loaded yet: database not connected")
+            return False
+        started = time.perf_counter()
+        index = new_index()
+        self._pending = []
+        try:
+            for kind, collection, projection, query in SOURCES.values():
+                batch = 0
+                async for document in database[collection].find(query, projection).batch_size(LOAD_BATCH_SIZE):
+                    index.add((kind, document["_id"]), document, GROUPS[kind])
+                    batch += 1
+                    if batch == LOAD_BATCH_SIZE:
+                        batch = 0
+                        await asyncio.sleep(0)
+        except Exception as e:
+            print(f"⚠️  Search index load failed, will retry: {e}")
+            return False
+
+        self.index = index
+        self.ready = True
+        self.loads += 1
+        self.load_seconds = round(time.perf_counter() - started, 2)
+        print(f"✅ Search index loaded: {len(index)} documents in {self.load_seconds}s")
+
+        # Writes that landed during the load may not be in what was read
+        pending, self._pending = self._pending, []
+        for name, item_id in pending:
+            await self._index_item(name, item_id)
+        return True
+
+    # ---------- updates ----------
+
+    def _on_change(self, event: Dict) -> None:
+        if event["op"] == "clear":
+            self.reload()
+        elif event["op"] == "added":
+            if self._loading is not None and not self._loading.done():
+                self._pending.append((event["list"], event["item_id"]))
+            task = asyncio.create_task(self._index_item(event["list"], event["item_id"]))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _index_item(self, name: str, item_id: ObjectId) -> None:
+        """Read a new creator or product back and add it to the index"""
+        kind, collection, projection, query = SOURCES[name]
+        if (kind, item_id) in self.index:
+            return
+        database = get_database()
+        if database is None:
+            return
+        try:
+            document = await database[collection].find_one({**query, "_id": item_id}, projection)
+        except Exception as e:
+            print(f"⚠️  Could not index new {kind}: {e}")
+            return
+        if document is not None and self.index.add((kind, item_id), document, GROUPS[kind]):
+            self.indexed_on_write += 1
+
+    # ---------- queries ----------
+
+    def search(
+        self,
+        query: str,
+        kind: Optional[str] = None,
+        k: int = 20,
+        prefix: bool = True
+    ) -> List[Tuple[str, ObjectId, float]]:
+        """
+        Best matches, best first
+
+        :param kind: CREATOR or PRODUCT to search one of them, None for both
+        :param prefix: Match the last word as a prefix (type-ahead)
+        """
+        self.searches += 1
+        hits = self.index.search(query, k=k, prefix=prefix, group=GROUPS.get(kind))
+        return [(doc_kind, item_id, score) for (doc_kind, item_id), score in hits]
+
+    def stats(self) -> Dict:
+        return {
+            **self.index.stats(),
+            "ready": self.ready,
+            "loads": self.loads,
+            "load_failures": self.load_failures,
+            "load_seconds": self.load_seconds,
+            "indexed_on_write": self.indexed_on_write,
+            "searches": self.searches
+        }
+
+
+catalog_search = CatalogSearch()
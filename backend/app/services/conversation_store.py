@@ -0,0 +1,221 @@
+"""
+Conversation Store
+
+Server-side chat memory for the health bots, keyed by bot and session id,
+so clients only send the new message and their session id.
+
+Each conversation keeps a running summary of older turns plus the most
+recent turns verbatim. The history block added to a prompt always fits
+in a token budget: the summary comes first, then as many of the newest
+turns as fit. When the stored turns grow past the budget, the oldest ones
+are folded into the summary by a summarizer callback (an LLM call) in the
+background, so long chats stay cheap without losing their context.
+
+Sessions live in this worker's memory and expire after a period of
+inactivity, like the response cache.
+"""
+
+import math
+import uuid
+import asyncio
+from typing import Awaitable, Callable, Dict, List, Optional
+from app.config.settings import settings
+from app.services.cache import TTLLRUCache
+
+Turn = Dict[str, str]  # {"role": "user" | "assistant", "content": str}
+Summarizer = Callable[[str, List[Turn]], Awaitable[str]]
+
+ROLE_LABELS = {"user": "User", "assistant": "Sakhi"}
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (about 4 characters per token for Gemini)"""
+    return math.ceil(len(text) / 4)
+
+
+def format_turn(turn: Turn) -> str:
+    return f"{ROLE_LABELS.get(turn['role'], 'User')}: {turn['content']}"
+
+
+def new_session_id() -> str:
+    return uuid.uuid4().hex
+
+
+def _truncate_to_tokens(text: str, max_tokens: int) -> str:
+    max_chars = max_tokens * 4
+    if len(text) <= max_chars:
+        return text
+    return "..." + text[-(max_chars - 3):]
+
+
+class Conversation:
+    """Summary of older turns plus the recent turns of one chat"""
+
+    def __init__(self):
+        self.summary = ""
+        self.turns: List[Turn] = []
+        self.compacting = False
+
+    def turn_tokens(self) -> int:
+        return sum(estimate_tokens(format_turn(turn)) for turn in self.turns)
+
+
+class ConversationStore:
+    """
+    Bounded per-session chat memory
+
+    Usage:
+        history = store.history_block("period", session_id)
+        ... build the prompt with history, call the model ...
+        store.append("period", session_id, user_message, reply)
+        store.schedule_compaction("period", session_id, summarize)
+    """
+
+    def __init__(
+        self,
+        max_sessions: int = 5000,
+        ttl_seconds: float = 3600,
+        token_budget: int = 1200,
+        summary_max_tokens: int = 300,
+        keep_recent_turns: int = 4
+    ):
+        """
+        :param max_sessions: Conversations kept in memory (least recently used are dropped)
+        :param ttl_seconds: Idle time after which a conversation is forgotten
+        :param token_budget: Maximum tokens of history added to one prompt
+        :param summary_max_tokens: Cap on the running summary
+        :param keep_recent_turns: Turns never folded into the summary
+        """
+        self.token_budget = token_budget
+        self.summary_max_tokens = summary_max_tokens
+        self.keep_recent_turns = keep_recent_turns
+        self._sessions = TTLLRUCache(max_entries=max_sessions, default_ttl=ttl_seconds)
+
+        self._tasks = set()  # Keeps background compactions referenced until they finish
+
+        self.compactions = 0
+        self.compaction_failures = 0
+
+    @staticmethod
+    def _key(bot: str, session_id: str) -> str:
+        return f"{bot}:{session_id}"
+
+    def get(self, bot: str, session_id: str) -> Conversation:
+        """Return the conversation, starting a new one if needed (refreshes its TTL)"""
+        key = self._key(bot, session_id)
+        conversation = self._sessions.get(key)
+        if conversation is None:
+            conversation = Conversation()
+        self._sessions.set(key, conversation)
+        return conversation
+
+    def seed(self, bot: str, session_id: str, history: List[dict]) -> None:
+        """Import client-sent history into a conversation the server has not seen yet"""
+        conversation = self.get(bot, session_id)
+        if conversation.turns or conversation.summary:
+            return
+        conversation.turns = normalize_history(history)
+
+    def append(self, bot: str, session_id: str, user_message: str, reply: str) -> None:
+        """Record one completed exchange"""
+        conversation = self.get(bot, session_id)
+        conversation.turns.append({"role": "user", "content": user_message})
+        conversation.turns.append({"role": "assistant", "content": reply})
+
+    def history_block(self, bot: str, session_id: str) -> str:
+        """Prompt text for the conversation so far, within the token budget"""
+        conversation = self._sessions.get(self._key(bot, session_id))
+        if conversation is None:
+            return ""
+        return self.render(conversation.summary, conversation.turns)
+
+    def render(self, summary: str, turns: List[Turn]) -> str:
+        """Summary first, then the newest turns that still fit in the budget"""
+        budget = self.token_budget
+        lines = []
+
+        if summary:
+            summary_line = f"Summary of earlier conversation: {_truncate_to_tokens(summary, self.summary_max_tokens)}"
+            budget -= estimate_tokens(summary_line)
+            lines.append(summary_line)
+
+        recent = []
+        for turn in reversed(turns):
+            line = format_turn(turn)
+            cost = estimate_tokens(line)
+            if cost > budget:
+                break
+            budget -= cost
+            recent.append(line)
+
+        if len(recent) < len(turns) and not summary:
+            lines.append("(Earlier messages omitted)")
+        lines.extend(reversed(recent))
+
+        if not lines:
+            return ""
+        return "Conversation so far:\n" + "\n".join(lines)
+
+    def schedule_compaction(self, bot: str, session_id: str, summarize: Summarizer) -> None:
+        """Fold old turns into the summary in the background once they outgrow the budget"""
+        conversation = self._sessions.get(self._key(bot, session_id))
+        if conversation is None or conversation.compacting:
+            return
+        if conversation.turn_tokens() <= self.token_budget:
+            return
+        if len(conversation.turns) <= self.keep_recent_turns:
+            return
+
+        conversation.compacting = True
+        task = asyncio.get_running_loop().create_task(self._compact(conversation, summarize))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _compact(self, conversation: Conversation, summarize: Summarizer) -> None:
+        old_turns = conversation.turns[:-self.keep_recent_turns]
+        try:
+            summary = await summarize(conversation.summary, old_turns)
+        except Exception as e:
+            # Keep the turns; render() still holds the prompt inside the budget
+            self.compaction_failures += 1
+            print(f"⚠️  Conversation compaction failed: {type(e).__name__}: {e}")
+            return
+        finally:
+            conversation.compacting = False
+
+        # Turns appended while summarizing stay after the folded ones
+        conversation.turns = conversation.turns[len(old_turns):]
+        conversation.summary = _truncate_to_tokens(summary.strip(), self.summary_max_tokens)
+        self.compactions += 1
+
+    def stats(self) -> Dict:
+        return {
+            "sessions": len(self._sessions),
+            "token_budget": self.token_budget,
+            "compactions": self.compactions,
+            "compaction_failures": self.compaction_failures
+        }
+
+
+def normalize_history(history: Optional[List[dict]]) -> List[Turn]:
+    """Convert client chat history ({"role": ..., "content": ...} messages) to turns"""
+    turns = []
+    for message in history or []:
+        content = message.get("content")
+        if not content:
+            continue
+        turns.append({
+            "role": "user" if message.get("role") == "user" else "assistant",
+            "content": str(content)
+        })
+    return turns
+
+
+# Shared store used by AIService
+conversation_store = ConversationStore(
+    max_sessions=settings.CONVERSATION_MAX_SESSIONS,
+    ttl_seconds=settings.CONVERSATION_TTL_SECONDS,
+    token_budget=settings.CONVERSATION_TOKEN_BUDGET,
+    summary_max_tokens=settings.CONVERSATION_SUMMARY_MAX_TOKENS,
+    keep_recent_turns=settings.CONVERSATION_KEEP_RECENT_TURNS
+)
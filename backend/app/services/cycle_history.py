@@ -0,0 +1,202 @@
+"""
+Cycle History Store
+
+Per-user period start dates and running cycle statistics in MongoDB
+(collection `cycle_histories`, one document per user):
+
+    {
+        "user_id": "...",
+        "starts": ["2026-07-03", "2026-07-31", ...],   # sorted, YYYY-MM-DD
+        "last_start": "2026-08-28",
+        "stats": {"n": ..., "mean": ..., "m2": ..., ...},  # CycleStats
+        "version": 12,                                  # bumped by every write
+        "updated_at": datetime
+    }
+
+Logging a new period after the last one updates the statistics in O(1)
+(see cycle_stats.CycleStats.add). Back-filled or removed dates rebuild that
+user's statistics from the history; refresh_all() rebuilds everyone's in
+NumPy batches.
+
+Every write is conditional on the version it read (optimistic
+concurrency), so two writes for the same user that overlap never lose
+one another: the one that loses the race reads again and retries.
+"""
+
+from datetime import date, datetime
+from typing import Dict, List, Optional, Tuple
+from pymongo import ASCENDING, UpdateOne
+from pymongo.errors import DuplicateKeyError
+from app.services.cycle_stats import CycleStats, cycle_lengths, recompute_batch
+
+DATE_FORMAT = "%Y-%m-%d"
+
+# Attempts at a conditional write before giving up on a busy history
+MAX_WRITE_ATTEMPTS = 5
+
+
+class CycleHistoryConflict(Exception):
+    """The history kept changing under a write (more than MAX_WRITE_ATTEMPTS times)"""
+
+
+def parse_date(value: str) -> date:
+    return datetime.strptime(value, DATE_FORMAT).date()
+
+
+class CycleHistoryStore:
+    """MongoDB-backed cycle history with incrementally maintained statistics"""
+
+    def __init__(self, collection):
+        self.collection = collection
+
+    async def ensure_indexes(self) -> None:
+        await self.collection.create_index([("user_id", ASCENDING)], unique=True)
+
+    async def get(self, user_id: str) -> Tuple[List[date], CycleStats]:
+        """Period starts (oldest first) and statistics for a user"""
+        starts, stats, _ = await self._read(user_id)
+        return starts, stats
+
+    async def _read(self, user_id: str) -> Tuple[List[date], CycleStats, Optional[int]]:
+        """Starts, statistics and version (-1 if the user has no document, None if it predates versions)"""
+        doc = await self.collection.find_one({"user_id": user_id}, {"starts": 1, "stats": 1, "version": 1})
+        if doc is None:
+            return [], CycleStats(), -1
+        starts = [parse_date(value) for value in doc.get("starts", [])]
+        return starts, CycleStats.from_dict(doc.get("stats")), doc.get("version")
+
+    async def get_stats(self, user_id: str) -> Optional[CycleStats]:
+        """Statistics only, without loading the history"""
+        doc = await self.collection.find_one({"user_id": user_id}, {"stats": 1})
+        return CycleStats.from_dict(doc.get("stats")) if doc else None
+
+    async def record_start(self, user_id: str, start: date) -> Tuple[List[date], CycleStats]:
+        """
+        Log a period start
+
+        The common case - a start after the most recent one - adds one cycle
+        length to the running statistics and appends the date, guarded on
+        the version read so concurrent writes cannot double-count. Anything
+        else (first log, back-filled date, lost race) rebuilds this user's
+        statistics from the history.
+        """
+        starts, stats, version = await self._read(user_id)
+        if start in starts:
+            return starts, stats
+
+        if starts and start > starts[-1]:
+            stats.add((start - starts[-1]).days)
+            result = await self.collection.update_one(
+                {"user_id": user_id, "version": version},
+                {
+                    "$push": {"starts": start.strftime(DATE_FORMAT)},
+                    "$set": {
+                        "last_start": start.strftime(DATE_FORMAT),
+                        "stats": stats.to_dict(),
+                        "updated_at": datetime.utcnow()
+                    },
+                    "$inc": {"version": 1}
+                }
+            )
+            if result.modified_count:
+                return starts + [start], stats
+
+        return await self._rebuild(user_id, add=start)
+
+    async def remove_start(self, user_id: str, start: date) -> Tuple[List[date], CycleStats]:
+        """Delete a wrongly logged period start"""
+        return await self._rebuild(user_id, remove=start)
+
+    async def _rebuild(
+        self,
+        user_id: str,
+        add: Optional[date] = None,
+        remove: Optional[date] = None
+    ) -> Tuple[List[date], CycleStats]:
+        """
+        Apply a change to the history and recompute its statistics
+
+        Read-modify-write conditional on the version read; retried when
+        another write got in between.
+
+        Raises:
+            CycleHistoryConflict: the history changed on every attempt
+        """
+        for _ in range(MAX_WRITE_ATTEMPTS):
+            starts, _, version = await self._read(user_id)
+            dates = set(starts)
+            if add is not None:
+                dates.add(add)
+            dates.discard(remove)
+            starts = sorted(dates)
+
+            stats = CycleStats.from_lengths(cycle_lengths(starts))
+            if await self._write(user_id, version, self._document(starts, stats)):
+                return starts, stats
+        raise CycleHistoryConflict(f"Cycle history of {user_id} kept changing")
+
+    async def _write(self, user_id: str, version: Optional[int], document: Dict) -> bool:
+        """Replace the history if it is still at version; False if another write got there first"""
+        if version == -1:
+            # No document when read: create it, unless a concurrent write just did
+            try:
+                result = await self.collection.update_one(
+                    {"user_id": user_id},
+                    {"$setOnInsert": {**document, "version": 1}},
+                    upsert=True
+                )
+            except DuplicateKeyError:
+                return False
+            return result.upserted_id is not None
+
+        result = await self.collection.update_one(
+            {"user_id": user_id, "version": version},
+            {"$set": document, "$inc": {"version": 1}}
+        )
+        return result.modified_count > 0
+
+    @staticmethod
+    def _document(starts: List[date], stats: CycleStats) -> Dict:
+        return {
+            "starts": [start.strftime(DATE_FORMAT) for start in starts],
+            "last_start": starts[-1].strftime(DATE_FORMAT) if starts else None,
+            "stats": stats.to_dict(),
+            "updated_at": datetime.utcnow()
+        }
+
+    async def refresh_all(self, batch_size: int = 5000) -> int:
+        """
+        Rebuild every user's statistics from their history (nightly job)
+
+        Reads histories in batches, recomputes each batch with one NumPy
+        pass and writes it back with one bulk write. A history written
+        meanwhile is skipped: its writer already stored fresh statistics.
+
+        Returns:
+            Number of users refreshed
+        """
+        refreshed = 0
+        batch: List[Dict] = []
+
+        async def flush() -> None:
+            histories = [[parse_date(value) for value in doc.get("starts", [])] for doc in batch]
+            updates = [
+                UpdateOne(
+                    {"_id": doc["_id"], "version": doc.get("version")},
+                    {"$set": {"stats": stats.to_dict(), "updated_at": datetime.utcnow()}}
+                )
+                for doc, stats in zip(batch, recompute_batch(histories))
+            ]
+            if updates:
+                await self.collection.bulk_write(updates, ordered=False)
+
+        async for doc in self.collection.find({}, {"starts": 1, "version": 1}).batch_size(batch_size):
+            batch.append(doc)
+            if len(batch) >= batch_size:
+                await flush()
+                refreshed += len(batch)
+                batch = []
+        if batch:
+            await flush()
+            refreshed += len(batch)
+        return refreshed
@@ -0,0 +1,247 @@
+"""
+Cycle Statistics
+
+Per-user menstrual cycle statistics for personalised period predictions.
+
+Each user's history is a list of period start dates. Cycle lengths (days
+between consecutive starts) feed running statistics that are updated in
+O(1) per new period, without rereading the history:
+
+- mean and variance via Welford's algorithm
+- trend (days per cycle) via running least-squares sums
+
+Predictions shrink the user's numbers towards a population prior while
+there are only a few cycles, so a new user starts at the default cycle
+length and moves towards her own as data arrives. Uncertainty grows with
+each cycle predicted ahead.
+
+recompute_batch() rebuilds the same statistics for many users at once
+from their full histories with NumPy, for the nightly refresh.
+"""
+
+import math
+import numpy as np
+from datetime import date, timedelta
+from statistics import NormalDist
+from typing import Dict, List, Optional, Sequence, Tuple
+from app.config.settings import settings
+
+# Lengths outside this range are almost always a missed or duplicate log,
+# so they are kept in the history but left out of the statistics
+MIN_CYCLE_LENGTH = 15
+MAX_CYCLE_LENGTH = 60
+
+# Cap on the trend used for predictions, in days per cycle
+MAX_TREND = 0.5
+
+
+def is_valid_length(length: float) -> bool:
+    return MIN_CYCLE_LENGTH <= length <= MAX_CYCLE_LENGTH
+
+
+class CycleStats:
+    """
+    Running statistics over one user's valid cycle lengths
+
+    x is the index of a cycle among the valid ones (0, 1, 2, ...) and y
+    its length, so the trend is the least-squares slope of y over x.
+    """
+
+    FIELDS = ("n", "mean", "m2", "sum_x", "sum_y", "sum_xx", "sum_xy")
+
+    def __init__(self, n: int = 0, mean: float = 0.0, m2: float = 0.0, sum_x: float = 0.0,
+                 sum_y: float = 0.0, sum_xx: float = 0.0, sum_xy: float = 0.0):
+        self.n = n
+        self.mean = mean
+        self.m2 = m2
+        self.sum_x = sum_x
+        self.sum_y = sum_y
+        self.sum_xx = sum_xx
+        self.sum_xy = sum_xy
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict]) -> "CycleStats":
+        data = data or {}
+        return cls(**{field: data.get(field, 0) for field in cls.FIELDS})
+
+    def to_dict(self) -> Dict:
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+    @classmethod
+    def from_lengths(cls, lengths: Sequence[float]) -> "CycleStats":
+        stats = cls()
+        for length in lengths:
+            stats.add(length)
+        return stats
+
+    def add(self, length: float) -> bool:
+        """
+        Add one cycle length in O(1)
+
+        Returns:
+            False if the length was out of range and ignored
+        """
+        if not is_valid_length(length):
+            return False
+
+        x = self.n
+        self.n += 1
+        delta = length - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (length - self.mean)
+
+        self.sum_x += x
+        self.sum_y += length
+        self.sum_xx += x * x
+        self.sum_xy += x * length
+        return True
+
+    @property
+    def variance(self) -> float:
+        """Sample variance of the cycle lengths (0 with fewer than two cycles)"""
+        return self.m2 / (self.n - 1) if self.n > 1 else 0.0
+
+    @property
+    def trend(self) -> float:
+        """Least-squares change in cycle length per cycle (0 with fewer than three cycles)"""
+        if self.n < 3:
+            return 0.0
+        denominator = self.n * self.sum_xx - self.sum_x ** 2
+        if denominator <= 0:
+            return 0.0
+        return (self.n * self.sum_xy - self.sum_x * self.sum_y) / denominator
+
+    def summary(self) -> Dict:
+        return {
+            "cycles": self.n,
+            "mean_length": round(self.mean, 2) if self.n else None,
+            "std_dev": round(math.sqrt(self.variance), 2) if self.n > 1 else None,
+            "trend_per_cycle": round(self.trend, 3) if self.n >= 3 else None
+        }
+
+
+def cycle_lengths(starts: Sequence[date]) -> List[int]:
+    """Days between consecutive period starts (starts sorted oldest first)"""
+    return [(later - earlier).days for earlier, later in zip(starts, starts[1:])]
+
+
+# ============================================
+# PREDICTION
+# ============================================
+
+def expected_length(stats: CycleStats) -> Tuple[float, float]:
+    """
+    Cycle length estimate and its standard deviation, shrunk towards the prior
+
+    With no cycles this is (DEFAULT_CYCLE_LENGTH, CYCLE_PRIOR_STD_DEV); each
+    recorded cycle counts as much as one of CYCLE_PRIOR_WEIGHT pseudo-cycles.
+    """
+    prior_mean = settings.DEFAULT_CYCLE_LENGTH
+    prior_var = settings.CYCLE_PRIOR_STD_DEV ** 2
+    weight = settings.CYCLE_PRIOR_WEIGHT
+
+    mean = (weight * prior_mean + stats.n * stats.mean) / (weight + stats.n)
+    variance = (weight * prior_var + stats.m2) / (weight + max(stats.n - 1, 0))
+    return mean, math.sqrt(variance)
+
+
+def predict_cycles(
+    stats: CycleStats,
+    last_start: date,
+    cycles: int = 3,
+    confidence: float = 0.8,
+    today: Optional[date] = None
+) -> List[Dict]:
+    """
+    Windows for the next few period starts
+
+    The k-th start is last_start plus k predicted cycle lengths. Its
+    uncertainty combines k independent cycle-to-cycle variations with the
+    uncertainty of the estimated mean, so windows widen further ahead.
+    When the last logged start is a few cycles old, windows that ended
+    before today are skipped, so the first one returned is still ahead.
+
+    Args:
+        stats: The user's running statistics
+        last_start: Most recent recorded period start
+        cycles: Number of upcoming cycles
+        confidence: Probability the start falls inside each window
+        today: Date to predict from (default: today)
+
+    Returns:
+        [{"cycle", "expected_start", "earliest", "latest", "expected_length"}],
+        cycle counting upcoming windows from 1
+    """
+    today = today or date.today()
+    mean, std_dev = expected_length(stats)
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+
+    trend = 0.0
+    if stats.n >= settings.CYCLE_TREND_MIN_CYCLES:
+        trend = max(-MAX_TREND, min(MAX_TREND, stats.trend))
+    center_x = stats.sum_x / stats.n if stats.n else 0.0
+    mean_error = std_dev ** 2 / (stats.n + settings.CYCLE_PRIOR_WEIGHT)
+
+    windows = []
+    offset = 0.0
+    k = 0
+    while len(windows) < cycles:
+        k += 1
+        length = mean + trend * (stats.n - 1 + k - center_x)
+        length = max(MIN_CYCLE_LENGTH, min(MAX_CYCLE_LENGTH, length))
+        offset += length
+        spread = z * math.sqrt(k * std_dev ** 2 + k * k * mean_error)
+        latest = last_start + timedelta(days=math.ceil(offset + spread))
+        if latest < today:
+            continue
+        windows.append({
+            "cycle": len(windows) + 1,
+            "expected_start": last_start + timedelta(days=round(offset)),
+            "earliest": last_start + timedelta(days=math.floor(offset - spread)),
+            "latest": latest,
+            "expected_length": round(length, 1)
+        })
+    return windows
+
+
+# ============================================
+# BULK RECOMPUTE
+# ============================================
+
+def recompute_batch(histories: Sequence[Sequence[date]]) -> List[CycleStats]:
+    """
+    Rebuild statistics for many users from their full histories at once
+
+    Histories are padded into one (users x cycles) matrix of lengths, and
+    every running sum is a masked reduction along the cycle axis. Gives the
+    same values as replaying each history through CycleStats.add().
+
+    Args:
+        histories: Per user, period starts sorted oldest first
+    """
+    if not histories:
+        return []
+
+    counts = np.fromiter((len(starts) for starts in histories), dtype=np.int64, count=len(histories))
+    width = max(int(counts.max()), 1)
+    ordinals = np.full((len(histories), width), np.nan)
+    ordinals[np.arange(width) < counts[:, None]] = np.fromiter(
+        (start.toordinal() for starts in histories for start in starts), dtype=np.float64, count=int(counts.sum())
+    )
+
+    lengths = np.diff(ordinals, axis=1)  # NaN where either start is missing
+    with np.errstate(invalid="ignore"):
+        valid = (lengths >= MIN_CYCLE_LENGTH) & (lengths <= MAX_CYCLE_LENGTH)
+    y = np.where(valid, lengths, 0.0)
+    x = np.where(valid, np.cumsum(valid, axis=1) - 1, 0.0)
+
+    n = valid.sum(axis=1)
+    sum_y = y.sum(axis=1)
+    mean = np.divide(sum_y, n, out=np.zeros_like(sum_y), where=n > 0)
+    m2 = (np.where(valid, lengths - mean[:, None], 0.0) ** 2).sum(axis=1)
+
+    columns = zip(n, mean, m2, x.sum(axis=1), sum_y, (x * x).sum(axis=1), (x * y).sum(axis=1))
+    return [
+        CycleStats(int(count), float(avg), float(sq), float(sx), float(sy), float(sxx), float(sxy))
+        for count, avg, sq, sx, sy, sxx, sxy in columns
+    ]
@@ -0,0 +1,142 @@
+"""
+Database Access
+
+One async MongoDB client (PyMongo's AsyncMongoClient) per worker process,
+shared by every route through FastAPI dependencies instead of per-module
+globals:
+
+    @router.get("/creators")
+    async def get_all_creators(db = Depends(get_db)):
+        creators = await db.creators.find().to_list(None)
+
+Database calls are awaited, so a slow query no longer holds up every
+other request on the event loop. The client and its connection pool are
+created at startup (connect) and closed at shutdown; pool size, timeouts
+and read/write concerns come from Settings (MONGO_*).
+"""
+
+from typing import Dict, Optional
+from fastapi import HTTPException, status
+from pymongo import ASCENDING, DESCENDING, AsyncMongoClient
+from app.config.settings import settings
+from app.services.cycle_history import CycleHistoryStore
+
+_client: Optional[AsyncMongoClient] = None
+_db = None
+
+
+def client_options() -> Dict:
+    """Connection pool, timeout and concern options for the client"""
+    write_concern = settings.MONGO_WRITE_CONCERN
+    options = {
+        "maxPoolSize": settings.MONGO_MAX_POOL_SIZE,
+        "minPoolSize": settings.MONGO_MIN_POOL_SIZE,
+        "maxIdleTimeMS": settings.MONGO_MAX_IDLE_TIME_MS,
+        "waitQueueTimeoutMS": settings.MONGO_WAIT_QUEUE_TIMEOUT_MS,
+        "connectTimeoutMS": settings.MONGO_CONNECT_TIMEOUT_MS,
+        "serverSelectionTimeoutMS": settings.MONGO_SERVER_SELECTION_TIMEOUT_MS,
+        "w": int(write_concern) if write_concern.isdigit() else write_concern,
+        "journal": settings.MONGO_WRITE_JOURNAL,
+        "readConcernLevel": settings.MONGO_READ_CONCERN,
+        "readPreference": settings.MONGO_READ_PREFERENCE,
+    }
+    if settings.MONGO_SOCKET_TIMEOUT_MS:
+        options["socketTimeoutMS"] = settings.MONGO_SOCKET_TIMEOUT_MS
+    return options
+
+
+async def connect(url: str = None, name: str = None):
+    """
+    Create the client and check the server answers
+
+    Raises:
+        pymongo.errors.ConnectionFailure: MongoDB is not reachable; the
+            client is closed again and routes keep answering 503
+    """
+    global _client, _db
+    client = AsyncMongoClient(url or settings.MONGODB_URL, **client_options())
+    try:
+        await client.admin.command("ping")
+    except Exception:
+        await client.close()
+        raise
+    _client = client
+    _db = client[name or settings.DATABASE_NAME]
+    return _db
+
+
+async def close() -> None:
+    """Close the client and its pool (shutdown)"""
+    global _client, _db
+    if _client is not None:
+        await _client.close()
+    _client = None
+    _db = None
+
+
+def get_database():
+    """The process-wide database, or None before connect() (or without MongoDB)"""
+    return _db
+
+
+def set_database(database) -> None:
+    """Replace the process-wide database (scripts, benchmarks)"""
+    global _db
+    _db = database
+
+
+async def get_db():
+    """
+    FastAPI dependency: the database for a request
+
+    Raises:
+        HTTPException: 503 while MongoDB is not connected
+    """
+    if _db is None:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Database unavailable")
+    return _db
+
+
+async def get_optional_db():
+    """FastAPI dependency for endpoints that still answer without a database"""
+    return _db
+
+
+# Collections listed with keyset pagination (services/pagination.py)
+PAGED_COLLECTIONS = ("creators", "products", "posts")
+
+
+async def ensure_indexes(database) -> None:
+    """Create the indexes the routes rely on (idempotent)"""
+    await database.users.create_index("phone", unique=True)
+    await database.creators.create_index("name")
+    await database.creators.create_index("skill_category")
+    await database.products.create_index("creator_name")
+    await database.products.create_index("category")
+    # Keyset pagination (services/pagination.py): equality filter, then (created_at, _id)
+    await database.creators.create_index([("created_at", DESCENDING), ("_id", DESCENDING)])
+    await database.products.create_index([("available", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)])
+    await database.posts.create_index([("created_at", DESCENDING), ("_id", DESCENDING)])
+    await CycleHistoryStore(database.cycle_histories).ensure_indexes()
+
+
+async def backfill_created_at(database) -> None:
+    """
+    Give paged documents written without created_at one (idempotent)
+
+    Keyset pages sort on created_at; a document without it sorts as null,
+    cannot be turned into a cursor and could never be paged past. The
+    ObjectId's timestamp is when the document was inserted.
+    """
+    for name in PAGED_COLLECTIONS:
+        try:
+            result = await database[name].update_many(
+                {"created_at": None},
+                [{"$set": {"created_at": {"$toDate": "$_id"}}}]  # Update pipeline: MongoDB 4.2+
+            )
+        except Exception as e:
+            # Not fatal: pages leave such documents out
+            print(f"⚠️  Could not backfill created_at on {name}: {e}")
+            continue
+        if result.modified_count:
+            print(f"✅ Backfilled created_at on {result.modified_count} {name}")
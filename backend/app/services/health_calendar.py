@@ -0,0 +1,195 @@
+"""
+Health Calendars
+
+Date arithmetic shared by the health bots and the calendar endpoints:
+cycle phases, fertile windows and pregnancy milestones.
+
+Calendars depend only on their inputs (a start date, cycle length and
+range), never on today's date, so each one is computed once, serialized
+once and memoized together with its ETag. Clients can keep a calendar
+offline and revalidate it with If-None-Match.
+"""
+
+import json
+import hashlib
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import Dict, List, NamedTuple
+from app.config.settings import settings
+from app.prompts.pregnancy_weekly_content import BABY_DEVELOPMENT, WEEK_CHECKUPS, trimester_of
+
+# Days from ovulation to the next period (the luteal phase is the stable part of a cycle)
+LUTEAL_DAYS = 14
+MENSTRUAL_DAYS = 5
+
+# Pregnancy weeks are counted from the last period; confirmation is taken as week 4
+CONFIRMATION_WEEK = 4
+FULL_TERM_WEEKS = 40
+
+TRIMESTER_LABELS = {
+    1: "First Trimester (Weeks 1-12)",
+    2: "Second Trimester (Weeks 13-26)",
+    3: "Third Trimester (Weeks 27-40)",
+}
+
+
+class CachedCalendar(NamedTuple):
+    body: bytes  # JSON response body
+    etag: str
+
+
+# ============================================
+# CYCLE ARITHMETIC
+# ============================================
+
+def ovulation_day(cycle_length: int) -> int:
+    """Cycle day (0 = first day of the period) on which ovulation is expected"""
+    return max(MENSTRUAL_DAYS, cycle_length - LUTEAL_DAYS)
+
+
+def cycle_phase(days_since: int, cycle_length: int = 28) -> str:
+    """
+    Phase for a day of the cycle
+
+    Menstrual for the first 5 days, ovulation for 2 days from the expected
+    ovulation day, luteal after it. Matches the fixed 28-day boundaries
+    (5 / 14 / 16) for a 28-day cycle.
+    """
+    ovulation = ovulation_day(cycle_length)
+    if days_since < MENSTRUAL_DAYS:
+        return "Menstrual Phase"
+    if days_since < ovulation:
+        return "Follicular Phase"
+    if days_since < ovulation + 2:
+        return "Ovulation Phase"
+    return "Luteal Phase"
+
+
+def trimester_label(week: int) -> str:
+    return TRIMESTER_LABELS[trimester_of(week)]
+
+
+def estimated_due_date(confirmation_date: date) -> date:
+    """Due date for a confirmation date, taking confirmation as week 4"""
+    return confirmation_date + timedelta(weeks=FULL_TERM_WEEKS - CONFIRMATION_WEEK)
+
+
+# ============================================
+# CALENDARS
+# ============================================
+
+def _cached(payload: Dict) -> CachedCalendar:
+    body = json.dumps(payload, default=str, separators=(",", ":")).encode("utf-8")
+    return CachedCalendar(body, '"' + hashlib.sha1(body).hexdigest() + '"')
+
+
+def build_period_calendar(last_period_date: date, cycle_length: int, months: int, period_length: int) -> Dict:
+    """
+    Predicted cycles from a last period date for the next few months
+
+    Each cycle carries its period days, fertile window (five days before
+    ovulation through the day after) and phase date ranges.
+    """
+    end = last_period_date + timedelta(days=round(months * 30.44))
+    ovulation = ovulation_day(cycle_length)
+    phase_starts = [
+        ("Menstrual Phase", 0),
+        ("Follicular Phase", MENSTRUAL_DAYS),
+        ("Ovulation Phase", ovulation),
+        ("Luteal Phase", ovulation + 2),
+    ]
+
+    cycles: List[Dict] = []
+    start = last_period_date
+    while start <= end:
+        next_start = start + timedelta(days=cycle_length)
+        ovulation_date = start + timedelta(days=ovulation)
+        phases = []
+        for index, (phase, offset) in enumerate(phase_starts):
+            until = phase_starts[index + 1][1] if index + 1 < len(phase_starts) else cycle_length
+            if until > offset:
+                phases.append({
+                    "phase": phase,
+                    "start": start + timedelta(days=offset),
+                    "end": start + timedelta(days=until - 1)
+                })
+        cycles.append({
+            "cycle": len(cycles),
+            "period_start": start,
+            "period_end": start + timedelta(days=period_length - 1),
+            "ovulation_date": ovulation_date,
+            "fertile_window": {
+                "start": ovulation_date - timedelta(days=5),
+                "end": ovulation_date + timedelta(days=1)
+            },
+            "phases": phases,
+            "next_period_start": next_start
+        })
+        start = next_start
+
+    return {
+        "last_period_date": last_period_date,
+        "cycle_length": cycle_length,
+        "period_length": period_length,
+        "months": months,
+        "cycles": cycles
+    }
+
+
+def build_pregnancy_calendar(confirmation_date: date) -> Dict:
+    """Week-by-week pregnancy timeline with trimesters, checkups and the due date"""
+    week_1 = confirmation_date - timedelta(weeks=CONFIRMATION_WEEK - 1)
+    due_date = estimated_due_date(confirmation_date)
+
+    weeks = []
+    for week in range(1, FULL_TERM_WEEKS + 1):
+        week_start = week_1 + timedelta(weeks=week - 1)
+        entry = {
+            "week": week,
+            "start": week_start,
+            "end": week_start + timedelta(days=6),
+            "trimester": trimester_of(week),
+            "baby_size": BABY_DEVELOPMENT[week][1],
+        }
+        if week in WEEK_CHECKUPS:
+            entry["checkup"] = WEEK_CHECKUPS[week]
+        weeks.append(entry)
+
+    trimesters = [
+        {"trimester": number, "label": TRIMESTER_LABELS[number], "start": week_1 + timedelta(weeks=first - 1),
+         "end": week_1 + timedelta(weeks=last) - timedelta(days=1)}
+        for number, first, last in ((1, 1, 12), (2, 13, 26), (3, 27, FULL_TERM_WEEKS))
+    ]
+
+    return {
+        "confirmation_date": confirmation_date,
+        "due_date": due_date,
+        "trimesters": trimesters,
+        "milestones": [
+            {"name": "Second trimester begins", "date": trimesters[1]["start"]},
+            {"name": "Third trimester begins", "date": trimesters[2]["start"]},
+            {"name": "Full term (37 weeks)", "date": week_1 + timedelta(weeks=36)},
+            {"name": "Due date", "date": due_date},
+        ],
+        "weeks": weeks
+    }
+
+
+@lru_cache(maxsize=settings.CALENDAR_CACHE_SIZE)
+def period_calendar(last_period_date: date, cycle_length: int, months: int, period_length: int) -> CachedCalendar:
+    """Serialized period calendar and its ETag, memoized by input"""
+    return _cached(build_period_calendar(last_period_date, cycle_length, months, period_length))
+
+
+@lru_cache(maxsize=settings.CALENDAR_CACHE_SIZE)
+def pregnancy_calendar(confirmation_date: date) -> CachedCalendar:
+    """Serialized pregnancy calendar and its ETag, memoized by input"""
+    return _cached(build_pregnancy_calendar(confirmation_date))
+
+
+def stats() -> Dict:
+    result = {}
+    for name, cached in (("period", period_calendar), ("pregnancy", pregnancy_calendar)):
+        info = cached.cache_info()
+        result[name] = {"hits": info.hits, "misses": info.misses, "size": info.currsize}
+    return result
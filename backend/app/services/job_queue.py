@@ -0,0 +1,269 @@
+"""
+Background Job Queue
+
+Runs slow chatbot calls in the background, so a client on a weak
+connection gets a job id straight away (HTTP 202) instead of holding a
+request open until the model answers.
+
+- A fixed pool of worker tasks takes jobs from a bounded queue; when the
+  queue is full, new jobs are refused with LLMOverloadedError (503)
+- Queued and running jobs are held until they finish; results are then
+  kept for a TTL and can be polled, or pushed over Socket.IO by the
+  on_finish callback when the job completes
+- Jobs submitted by a signed-in user with the same idempotency key map to
+  the same job id, so a client that resubmits after a reconnect gets the
+  original job back and the answer is never computed twice; reusing a key
+  for a different request is refused
+- A job belongs to the user who submitted it and is only shown to them;
+  anonymous jobs get a random id, which is their only credential
+- A job shed by the LLM path (overloaded, breaker open) waits for the
+  Retry-After hint and tries again, up to max_attempts
+
+Jobs live in this worker's memory, like the response cache.
+"""
+
+import time
+import uuid
+import asyncio
+import hashlib
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from app.services.admission import LLMOverloadedError, retry_after_seconds
+from app.services.cache import TTLLRUCache
+
+JobRunner = Callable[[], Awaitable[Dict]]
+JobCallback = Callable[["Job"], Awaitable[None]]
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+
+class JobError(Exception):
+    """A job failed in a way the client should see (status code and detail)"""
+
+    def __init__(self, status_code: int, detail: str):
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+
+
+class Job:
+    """One background call and its outcome"""
+
+    def __init__(
+        self,
+        job_id: str,
+        kind: str,
+        run: JobRunner,
+        rooms: List[str],
+        owner: str = "",
+        fingerprint: Optional[str] = None
+    ):
+        self.id = job_id
+        self.kind = kind
+        self.run = run
+        self.owner = owner  # User id, "" for anonymous jobs
+        self.fingerprint = fingerprint  # Hash of the request, checked when the key is reused
+        self.rooms = rooms  # Socket.IO rooms told about the result
+        self.state = QUEUED
+        self.attempts = 0
+        self.result: Optional[Dict] = None
+        self.error: Optional[Dict] = None
+        self.created_at = time.time()
+        self.finished_at: Optional[float] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.state in (DONE, FAILED)
+
+    def visible_to(self, user_id: Optional[str]) -> bool:
+        """Whether user_id (None/"" when anonymous) may see this job"""
+        return not self.owner or self.owner == user_id
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "job_id": self.id,
+            "kind": self.kind,
+            "status": self.state,
+            "attempts": self.attempts,
+            "result": self.result,
+            "error": self.error,
+            "created_at": self.created_at,
+            "finished_at": self.finished_at
+        }
+
+
+class JobQueue:
+    """
+    Bounded queue of background jobs served by a fixed worker pool
+
+    Usage:
+        job, created = await job_queue.submit("period", run, idempotency_key=key, owner=user_id)
+        job_queue.get(job.id, user_id).to_dict()
+    """
+
+    def __init__(
+        self,
+        workers: int = 4,
+        max_queued: int = 200,
+        result_ttl: float = 900,
+        max_jobs: int = 5000,
+        max_attempts: int = 3,
+        on_finish: Optional[JobCallback] = None
+    ):
+        """
+        :param workers: Number of jobs run at the same time
+        :param max_queued: Jobs waiting beyond this are refused with 503
+        :param result_ttl: Seconds a finished job and its result are kept
+        :param max_jobs: Upper bound on finished jobs kept in memory (LRU)
+        :param max_attempts: Attempts for a job that keeps being shed as overloaded
+        :param on_finish: Awaited with the job once it is done or failed
+        """
+        self.workers = workers
+        self.max_queued = max_queued
+        self.result_ttl = result_ttl
+        self.max_attempts = max_attempts
+        self.on_finish = on_finish
+
+        self._active: Dict[str, Job] = {}  # Queued or running; never expire or get evicted
+        self._jobs = TTLLRUCache(max_entries=max_jobs, default_ttl=result_ttl)  # Finished
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+
+        self.submitted = 0
+        self.deduplicated = 0
+        self.rejected = 0
+        self.completed = 0
+        self.failed = 0
+
+    @staticmethod
+    def job_id(kind: str, idempotency_key: Optional[str], owner: str = "") -> str:
+        """Stable id for a signed-in user's idempotency key, otherwise a random one"""
+        if not idempotency_key or not owner:
+            return uuid.uuid4().hex
+        return hashlib.sha1(f"{kind}:{owner}:{idempotency_key}".encode("utf-8")).hexdigest()[:32]
+
+    def _ensure_workers(self) -> None:
+        # Started on first use so the queue binds to the running event loop
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        self._tasks = [task for task in self._tasks if not task.done()]
+        while len(self._tasks) < self.workers:
+            self._tasks.append(asyncio.create_task(self._worker()))
+
+    def _find(self, job_id: str) -> Optional[Job]:
+        job = self._active.get(job_id)
+        return job if job is not None else self._jobs.get(job_id)
+
+    def get(self, job_id: str, user_id: Optional[str] = None) -> Optional[Job]:
+        """The job, or None if it is unknown, expired or owned by another user"""
+        job = self._find(job_id)
+        if job is None or not job.visible_to(user_id):
+            return None
+        return job
+
+    async def submit(
+        self,
+        kind: str,
+        run: JobRunner,
+        idempotency_key: Optional[str] = None,
+        owner: str = "",
+        rooms: Optional[List[str]] = None,
+        fingerprint: Optional[str] = None
+    ) -> Tuple[Job, bool]:
+        """
+        Queue a job, or return the existing one for the same idempotency key
+
+        Args:
+            kind: What the job does (period, pregnancy, krishi, ...)
+            run: Coroutine factory producing the result dict
+            idempotency_key: Client-chosen key; resubmitting it returns the same
+                job. Ignored without an owner, since anonymous callers cannot be
+                told apart
+            owner: User id the job belongs to; scopes the key
+            rooms: Socket.IO rooms to notify besides the job's own room
+            fingerprint: Hash of the request body, compared when a key is reused
+
+        Returns:
+            (job, created) - created is False for a resubmitted key
+
+        Raises:
+            LLMOverloadedError: the queue is full
+            JobError: 422 when the key was already used for a different request
+        """
+        job_id = self.job_id(kind, idempotency_key, owner)
+        existing = self._find(job_id)
+        if existing is not None:
+            if existing.fingerprint != fingerprint:
+                raise JobError(422, "Idempotency-Key was already used for a different request")
+            self.deduplicated += 1
+            return existing, False
+
+        self._ensure_workers()
+        if self._queue.qsize() >= self.max_queued:
+            self.rejected += 1
+            raise LLMOverloadedError(
+                retry_after=retry_after_seconds(self._queue.qsize() / max(self.workers, 1)),
+                reason="Background job queue is full"
+            )
+
+        job = Job(job_id, kind, run, [f"job:{job_id}"] + (rooms or []), owner, fingerprint)
+        self._active[job_id] = job
+        self._queue.put_nowait(job)
+        self.submitted += 1
+        return job, True
+
+    async def _worker(self) -> None:
+        while True:
+            job = await self._queue.get()
+            try:
+                await self._run(job)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job: Job) -> None:
+        job.state = RUNNING
+        while True:
+            job.attempts += 1
+            try:
+                job.result = await job.run()
+                job.state = DONE
+                self.completed += 1
+                break
+            except LLMOverloadedError as e:
+                if job.attempts < self.max_attempts:
+                    await asyncio.sleep(e.retry_after)
+                    continue
+                job.error = {"status_code": 503, "detail": e.reason, "retry_after": e.retry_after}
+            except JobError as e:
+                job.error = {"status_code": e.status_code, "detail": e.detail}
+            except Exception as e:
+                print(f"❌ Job {job.id} failed: {type(e).__name__}: {e}")
+                job.error = {"status_code": 500, "detail": "The request could not be completed"}
+            job.state = FAILED
+            self.failed += 1
+            break
+
+        job.finished_at = time.time()
+        # The TTL starts once the result is ready
+        self._jobs.set(job.id, job, self.result_ttl)
+        self._active.pop(job.id, None)
+        if self.on_finish is not None:
+            try:
+                await self.on_finish(job)
+            except Exception as e:
+                print(f"⚠️  Could not deliver job {job.id}: {e}")
+
+    def stats(self) -> Dict:
+        return {
+            "workers": self.workers,
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "active": len(self._active),
+            "stored": len(self._jobs),
+            "submitted": self.submitted,
+            "deduplicated": self.deduplicated,
+            "rejected": self.rejected,
+            "completed": self.completed,
+            "failed": self.failed
+        }
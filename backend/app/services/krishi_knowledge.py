@@ -0,0 +1,73 @@
+"""
+Krishi Knowledge Retrieval
+
+Finds the knowledge base passages most relevant to a Krishi Bot question,
+so the prompt carries a few specific facts (crop calendar, pest remedy,
+scheme details) instead of one long generic blurb.
+
+The index is built once per worker on first use.
+"""
+
+from datetime import date
+from typing import Dict, List, Optional
+from app.config.settings import settings
+from app.prompts.krishi_knowledge_base import KRISHI_PASSAGES
+from app.services.text_index import BM25Index, build_index
+
+PASSAGES_BY_ID = {passage["id"]: passage for passage in KRISHI_PASSAGES}
+_index: Optional[BM25Index] = None
+
+# Values the client sends when it does not know
+_UNKNOWN = {"", "current", "general", "mixed", "unknown"}
+
+
+def get_index() -> BM25Index:
+    """Return the knowledge index, building it on first use"""
+    global _index
+    if _index is None:
+        _index = build_index(
+            (passage["id"], f"{passage['title']} {passage['tags']} {passage['text']}")
+            for passage in KRISHI_PASSAGES
+        )
+    return _index
+
+
+def current_season(today: Optional[date] = None) -> str:
+    """Indian cropping season for a date: kharif (Jun-Oct), rabi (Nov-Mar) or zaid (Apr-May)"""
+    month = (today or date.today()).month
+    if 6 <= month <= 10:
+        return "kharif"
+    if month in (4, 5):
+        return "zaid"
+    return "rabi"
+
+
+def _known(value) -> str:
+    if isinstance(value, (list, tuple)):
+        value = " ".join(str(item) for item in value)
+    value = str(value or "").strip()
+    return "" if value.lower() in _UNKNOWN else value
+
+
+def retrieve_passages(user_message: str, user_info: Dict, k: Optional[int] = None) -> List[Dict]:
+    """
+    Top-k passages for a question and the farmer's context
+
+    The user's crops, location and season are added to the query with
+    extra weight, so a vague question ("what should I spray?") still
+    finds material about the crops they actually grow.
+    """
+    season = _known(user_info.get("season")) or current_season()
+    boosts = {season: settings.KRISHI_CONTEXT_BOOST}
+    for field in ("crops", "location"):
+        value = _known(user_info.get(field))
+        if value:
+            boosts[value] = settings.KRISHI_CONTEXT_BOOST
+
+    results = get_index().search(user_message, k=k or settings.KRISHI_RETRIEVAL_TOP_K, boosts=boosts)
+    return [PASSAGES_BY_ID[doc_id] for doc_id, _ in results]
+
+
+def format_passages(passages: List[Dict]) -> str:
+    """Render passages as a compact bulleted block for the prompt"""
+    return "\n".join(f"- {passage['title']}: {passage['text']}" for passage in passages)
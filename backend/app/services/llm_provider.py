@@ -0,0 +1,420 @@
+"""
+LLM Providers
+
+Backends that turn a prompt into text. AIService talks only to the
+LLMProvider interface; which backend is used is chosen by
+settings.LLM_PROVIDER:
+
+- "gemini": Google Gemini via google-generativeai (needs GOOGLE_API_KEY)
+- "stub":   local deterministic stand-in with configurable latency, token
+            rate, error/429 injection and canned outputs. Lets the backend
+            run and be load-tested on an offline box.
+- "workers": either of the above (LLM_WORKER_BACKEND) run in a pool of
+            separate processes, see llm_worker_pool.py
+"""
+
+import json
+import math
+import random
+import asyncio
+import hashlib
+from collections import OrderedDict
+from typing import AsyncIterator, Dict, List, Optional
+from app.config.settings import settings
+
+
+class LLMError(Exception):
+    """Upstream model call failed"""
+
+
+class LLMRateLimitError(LLMError):
+    """Upstream rejected the call because of rate limits or quota (HTTP 429)"""
+
+
+class LLMTransientError(LLMError):
+    """Temporary upstream failure worth retrying (5xx, unavailable, deadline)"""
+
+
+# ============================================
+# PROVIDER INTERFACE
+# ============================================
+
+# Health pings: enough output budget that a thinking model still ends with some text
+PING_CONFIG = {"max_output_tokens": 256}
+
+class LLMProvider:
+    """Interface every model backend implements"""
+
+    name = "base"
+
+    async def generate(self, prompt: str, config: Dict, prefix: Optional[str] = None) -> str:
+        """
+        Generate a full response
+
+        Args:
+            prompt: The prompt to send (the per-request part when prefix is given)
+            config: Generation settings (temperature, max_output_tokens, top_p, ...)
+            prefix: Stable system prompt shared across requests, sent so the
+                backend can reuse it (system instruction / prefix cache)
+
+        Raises:
+            LLMRateLimitError: upstream is rate limiting us
+            LLMError: any other upstream failure
+        """
+        raise NotImplementedError
+
+    def stream(self, prompt: str, config: Dict, prefix: Optional[str] = None) -> AsyncIterator[str]:
+        """Generate a response as an async iterator of text chunks"""
+        raise NotImplementedError
+
+    def check_capacity(self) -> None:
+        """
+        Raise LLMOverloadedError if the backend cannot take another call
+
+        Called before a request is admitted; in-process backends have no
+        limit of their own (the scheduler bounds them).
+        """
+
+    def close(self) -> None:
+        """Release processes or connections held by the backend"""
+
+    def stats(self) -> Dict:
+        return {"name": self.name}
+
+    async def ping(self) -> bool:
+        """Cheap connectivity check for health endpoints"""
+        try:
+            await self.generate("test", PING_CONFIG)
+            return True
+        except LLMError as e:
+            print(f"{self.name} connection test failed: {e}")
+            return False
+
+
+# ============================================
+# GOOGLE GEMINI BACKEND
+# ============================================
+
+class GeminiProvider(LLMProvider):
+    """Google Gemini backend using the async google-generativeai client"""
+
+    name = "gemini"
+
+    # Models per system instruction; bots only use a handful of prefixes
+    MAX_PREFIX_MODELS = 32
+
+    def __init__(self, api_key: str, model_name: str):
+        # Imported here so the stub backend works without the SDK configured
+        import google.generativeai as genai
+        from google.api_core import exceptions as google_exceptions
+
+        genai.configure(api_key=api_key)
+        self._genai = genai
+        self._google_exceptions = google_exceptions
+        self.model_name = model_name
+        self.model = genai.GenerativeModel(model_name)
+        self._prefix_models: "OrderedDict[str, object]" = OrderedDict()
+
+    def _model_for(self, prefix: Optional[str]):
+        """Model with the prefix as its system instruction, so it is not resent in the contents"""
+        if not prefix:
+            return self.model
+        model = self._prefix_models.get(prefix)
+        if model is None:
+            model = self._genai.GenerativeModel(self.model_name, system_instruction=prefix)
+            self._prefix_models[prefix] = model
+            if len(self._prefix_models) > self.MAX_PREFIX_MODELS:
+                self._prefix_models.popitem(last=False)
+        else:
+            self._prefix_models.move_to_end(prefix)
+        return model
+
+    def _translate_error(self, error: Exception) -> LLMError:
+        if isinstance(error, self._google_exceptions.ResourceExhausted):
+            return LLMRateLimitError(str(error))
+        if isinstance(error, (
+            self._google_exceptions.ServerError,
+            self._google_exceptions.DeadlineExceeded,
+            self._google_exceptions.ServiceUnavailable,
+        )):
+            return LLMTransientError(f"{type(error).__name__}: {error}")
+        message = str(error)
+        if "429" in message or "quota" in message.lower():
+            return LLMRateLimitError(message)
+        return LLMError(f"{type(error).__name__}: {message}")
+
+    async def generate(self, prompt: str, config: Dict, prefix: Optional[str] = None) -> str:
+        try:
+            response = await self._model_for(prefix).generate_content_async(
+                prompt,
+                generation_config=self._genai.types.GenerationConfig(**config)
+            )
+            return response.text.strip()
+        except Exception as e:
+            raise self._translate_error(e) from e
+
+    async def ping(self) -> bool:
+        """
+        Healthy when the call completes; the text is not read
+
+        Gemini 2.5 spends part of the output budget on thinking, so a short
+        reply can stop at MAX_TOKENS with no text, and response.text raises.
+        """
+        try:
+            await self.model.generate_content_async(
+                "test",
+                generation_config=self._genai.types.GenerationConfig(**PING_CONFIG)
+            )
+            return True
+        except Exception as e:
+            print(f"{self.name} connection test failed: {self._translate_error(e)}")
+            return False
+
+    async def stream(self, prompt: str, config: Dict, prefix: Optional[str] = None) -> AsyncIterator[str]:
+        try:
+            response = await self._model_for(prefix).generate_content_async(
+                prompt,
+                generation_config=self._genai.types.GenerationConfig(**config),
+                stream=True
+            )
+            async for chunk in response:
+                try:
+                    text = chunk.text
+                except ValueError:
+                    # Chunks without text parts (e.g. finish metadata)
+                    continue
+                if text:
+                    yield text
+        except Exception as e:
+            raise self._translate_error(e) from e
+
+
+# ============================================
+# OFFLINE STUB BACKEND
+# ============================================
+
+# Returned in JSON mode (response_mime_type "application/json") when no canned response matches
+DEFAULT_STUB_JSON_RESPONSE = '{"is_eligible": true, "reason": "(Stub response) You seem to meet the basic criteria. Please verify documents at your nearest center."}'
+
+DEFAULT_STUB_RESPONSES = [
+    "I'm here for you! This is a stub answer used for offline testing. Please remember to check with a doctor for any medical concerns. 💕",
+    "That's a great question! (Stub response) Drink plenty of water, rest well and eat iron-rich foods like spinach and jaggery.",
+    "🌱 Namaste! (Stub response) Try neem oil spray, add compost to your soil, and visit your nearest Krishi Vigyan Kendra for soil testing.",
+]
+
+
+class StubProvider(LLMProvider):
+    """
+    Deterministic local model for load tests and offline development
+
+    - Latency: first-token latency drawn from a fixed/uniform/normal/lognormal
+      distribution, then text is produced at a fixed token rate
+    - Faults: a fraction of calls fail with LLMTransientError or LLMRateLimitError
+    - Output: the first canned response whose "match" substring appears in
+      the prompt, otherwise a default picked by prompt hash (same prompt,
+      same answer), or a JSON object in JSON mode. Text is cut at the first
+      stop sequence, like the real model.
+    - Prefix cache: a local stand-in for an upstream context cache. Prefixes
+      not seen recently cost prefill_ms_per_1k_tokens extra before the first
+      token; hits and misses are counted in stats().
+    """
+
+    name = "stub"
+
+    def __init__(
+        self,
+        latency_distribution: str = "fixed",
+        latency_ms: float = 0.0,
+        latency_jitter_ms: float = 0.0,
+        tokens_per_second: float = 0.0,
+        error_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        responses: Optional[List[Dict]] = None,
+        seed: Optional[int] = None,
+        prefill_ms_per_1k_tokens: float = 0.0,
+        prefix_cache_size: int = 64
+    ):
+        """
+        :param latency_distribution: "fixed", "uniform", "normal" or "lognormal"
+        :param latency_ms: Mean time to first token in milliseconds
+        :param latency_jitter_ms: Spread (half-width for uniform, stdev otherwise)
+        :param tokens_per_second: Output rate after the first token; 0 = instant
+        :param error_rate: Fraction of calls failing with a generic error
+        :param rate_limit_rate: Fraction of calls failing with a 429
+        :param responses: Canned outputs, list of {"match": str, "response": str}
+        :param seed: Seed for latency and fault injection
+        :param prefill_ms_per_1k_tokens: Extra first-token delay for an uncached prefix
+        :param prefix_cache_size: Number of prefixes kept in the local prefix cache
+        """
+        if latency_distribution not in ("fixed", "uniform", "normal", "lognormal"):
+            raise ValueError(f"Unknown stub latency distribution: {latency_distribution}")
+
+        self.latency_distribution = latency_distribution
+        self.latency_ms = latency_ms
+        self.latency_jitter_ms = latency_jitter_ms
+        self.tokens_per_second = tokens_per_second
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.responses = responses or []
+        self._random = random.Random(seed)
+        self.prefill_ms_per_1k_tokens = prefill_ms_per_1k_tokens
+        self.prefix_cache_size = prefix_cache_size
+        self._prefix_cache: "OrderedDict[str, None]" = OrderedDict()  # sha1 of prefix
+        self.prefix_hits = 0
+        self.prefix_misses = 0
+
+        self.calls = 0
+        self.injected_errors = 0
+        self.injected_rate_limits = 0
+
+    @classmethod
+    def from_settings(cls) -> "StubProvider":
+        responses = []
+        if settings.STUB_RESPONSES_FILE:
+            with open(settings.STUB_RESPONSES_FILE, encoding="utf-8") as f:
+                responses = json.load(f)
+
+        return cls(
+            latency_distribution=settings.STUB_LATENCY_DISTRIBUTION,
+            latency_ms=settings.STUB_LATENCY_MS,
+            latency_jitter_ms=settings.STUB_LATENCY_JITTER_MS,
+            tokens_per_second=settings.STUB_TOKENS_PER_SECOND,
+            error_rate=settings.STUB_ERROR_RATE,
+            rate_limit_rate=settings.STUB_RATE_LIMIT_RATE,
+            responses=responses,
+            seed=settings.STUB_SEED,
+            prefill_ms_per_1k_tokens=settings.STUB_PREFILL_MS_PER_1K_TOKENS
+        )
+
+    def _first_token_delay(self) -> float:
+        mean, jitter = self.latency_ms, self.latency_jitter_ms
+
+        if self.latency_distribution == "uniform":
+            delay = self._random.uniform(mean - jitter, mean + jitter)
+        elif self.latency_distribution == "normal":
+            delay = self._random.gauss(mean, jitter)
+        elif self.latency_distribution == "lognormal" and mean > 0:
+            # Parameterised so the distribution has the requested mean and stdev
+            sigma2 = math.log(1 + (jitter / mean) ** 2)
+            delay = self._random.lognormvariate(math.log(mean) - sigma2 / 2, math.sqrt(sigma2))
+        else:
+            delay = mean
+
+        return max(0.0, delay) / 1000
+
+    def _prefill_delay(self, prefix: Optional[str]) -> float:
+        if not prefix:
+            return 0.0
+        key = hashlib.sha1(prefix.encode("utf-8")).hexdigest()
+        if key in self._prefix_cache:
+            self._prefix_cache.move_to_end(key)
+            self.prefix_hits += 1
+            return 0.0
+
+        self.prefix_misses += 1
+        self._prefix_cache[key] = None
+        if len(self._prefix_cache) > self.prefix_cache_size:
+            self._prefix_cache.popitem(last=False)
+        # ~4 characters per token
+        return len(prefix) / 4 / 1000 * self.prefill_ms_per_1k_tokens / 1000
+
+    def _inject_faults(self) -> None:
+        self.calls += 1
+        roll = self._random.random()
+        if roll < self.rate_limit_rate:
+            self.injected_rate_limits += 1
+            raise LLMRateLimitError("429 Resource has been exhausted (stub)")
+        if roll < self.rate_limit_rate + self.error_rate:
+            self.injected_errors += 1
+            raise LLMTransientError("Injected stub failure")
+
+    def _pick_response(self, prompt: str, config: Dict) -> str:
+        for canned in self.responses:
+            if canned.get("match", "") in prompt:
+                return canned["response"]
+
+        if config.get("response_mime_type") == "application/json":
+            return DEFAULT_STUB_JSON_RESPONSE
+
+        digest = int(hashlib.sha1(prompt.encode("utf-8")).hexdigest(), 16)
+        return DEFAULT_STUB_RESPONSES[digest % len(DEFAULT_STUB_RESPONSES)]
+
+    def _tokenize(self, text: str, config: Dict) -> List[str]:
+        for stop in config.get("stop_sequences") or []:
+            if stop in text:
+                text = text[:text.index(stop)]
+
+        # Whitespace-delimited "tokens" are close enough for pacing
+        tokens = text.split(" ")
+        max_tokens = config.get("max_output_tokens")
+        if max_tokens:
+            tokens = tokens[:max_tokens]
+        return [token + " " for token in tokens[:-1]] + tokens[-1:]
+
+    async def generate(self, prompt: str, config: Dict, prefix: Optional[str] = None) -> str:
+        parts = []
+        async for text in self.stream(prompt, config, prefix):
+            parts.append(text)
+        return "".join(parts).strip()
+
+    async def stream(self, prompt: str, config: Dict, prefix: Optional[str] = None) -> AsyncIterator[str]:
+        await asyncio.sleep(self._first_token_delay() + self._prefill_delay(prefix))
+        self._inject_faults()
+
+        if prefix:
+            prompt = f"{prefix}\n\n{prompt}"
+        token_delay = 1 / self.tokens_per_second if self.tokens_per_second > 0 else 0
+        for index, token in enumerate(self._tokenize(self._pick_response(prompt, config), config)):
+            if index and token_delay:
+                await asyncio.sleep(token_delay)
+            yield token
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "calls": self.calls,
+            "injected_errors": self.injected_errors,
+            "injected_rate_limits": self.injected_rate_limits,
+            "prefix_cache_hits": self.prefix_hits,
+            "prefix_cache_misses": self.prefix_misses
+        }
+
+
+# ============================================
+# PROVIDER SELECTION
+# ============================================
+
+_provider: Optional[LLMProvider] = None
+
+
+def create_provider(name: str) -> LLMProvider:
+    """Build a provider by name using values from Settings"""
+    if name == "gemini":
+        return GeminiProvider(settings.GOOGLE_API_KEY, settings.GEMINI_MODEL)
+    if name == "stub":
+        return StubProvider.from_settings()
+    if name == "workers":
+        from app.services.llm_worker_pool import WorkerPoolProvider
+        return WorkerPoolProvider.from_settings()
+    raise ValueError(f"Unknown LLM provider: {name}")
+
+
+def get_provider() -> LLMProvider:
+    """Return the process-wide provider, creating it on first use"""
+    global _provider
+    if _provider is None:
+        _provider = create_provider(settings.LLM_PROVIDER)
+    return _provider
+
+
+def set_provider(provider: LLMProvider) -> None:
+    """Replace the process-wide provider (benchmarks, scripts)"""
+    global _provider
+    _provider = provider
+
+
+def close_provider() -> None:
+    """Close the process-wide provider, if one was created (shutdown)"""
+    global _provider
+    if _provider is not None:
+        _provider.close()
+        _provider = None
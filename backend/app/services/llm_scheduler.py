@@ -0,0 +1,226 @@
+"""
+LLM Request Scheduler
+
+Sits in front of the LLM provider and decides which waiting call gets the
+next upstream slot. Each bot has its own queue with a weight
+(pregnancy > period > krishi > schemes by default), and a global
+concurrency cap keeps us inside the Gemini quota.
+
+Queues are served with stride scheduling: every queue gets slots in
+proportion to its weight, so a burst of scheme checks slows pregnancy
+questions down by at most its fair share instead of starving them.
+"""
+
+import time
+import asyncio
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Deque, Dict, Optional, Tuple
+from app.config.settings import settings
+
+DEFAULT_QUEUE = "default"
+
+
+class _QueueStats:
+    """Wait-time counters for one priority queue"""
+
+    def __init__(self, slo_ms: float):
+        self.slo_ms = slo_ms
+        self.dispatched = 0
+        self.cancelled = 0
+        self.slo_violations = 0
+        self.total_wait_ms = 0.0
+        self.max_wait_ms = 0.0
+        self.recent_waits_ms: Deque[float] = deque(maxlen=500)
+
+    def record_wait(self, wait_ms: float) -> None:
+        self.dispatched += 1
+        self.total_wait_ms += wait_ms
+        self.max_wait_ms = max(self.max_wait_ms, wait_ms)
+        self.recent_waits_ms.append(wait_ms)
+        if wait_ms > self.slo_ms:
+            self.slo_violations += 1
+
+    def p95_wait_ms(self) -> float:
+        if not self.recent_waits_ms:
+            return 0.0
+        ordered = sorted(self.recent_waits_ms)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+
+
+class LLMScheduler:
+    """
+    Weighted fair scheduler with a global concurrency cap
+
+    Usage:
+        async with scheduler.slot("pregnancy"):
+            await provider.generate(...)
+    """
+
+    def __init__(self, max_concurrency: int, weights: Dict[str, int], slo_ms: Dict[str, float]):
+        """
+        :param max_concurrency: Maximum upstream calls running at once
+        :param weights: Queue name -> relative share of slots
+        :param slo_ms: Queue name -> target max wait in milliseconds
+        """
+        self.max_concurrency = max_concurrency
+        self.weights = dict(weights)
+        self.weights.setdefault(DEFAULT_QUEUE, 1)
+
+        self._queues: Dict[str, Deque[Tuple[asyncio.Future, float]]] = {
+            name: deque() for name in self.weights
+        }
+        self._pass: Dict[str, float] = {name: 0.0 for name in self.weights}
+        self._virtual_time = 0.0
+        self._active = 0
+        self._stats: Dict[str, _QueueStats] = {
+            name: _QueueStats(slo_ms.get(name, slo_ms.get(DEFAULT_QUEUE, 10000)))
+            for name in self.weights
+        }
+
+    @property
+    def active(self) -> int:
+        """Upstream calls currently holding a slot"""
+        return self._active
+
+    def queue_name(self, priority: str) -> str:
+        """Map a caller name to its queue (unknown callers share the default queue)"""
+        return priority if priority in self._queues else DEFAULT_QUEUE
+
+    def depth(self, priority: Optional[str] = None) -> int:
+        """Waiting calls in one queue, or in all queues when priority is None"""
+        if priority is None:
+            return sum(len(queue) for queue in self._queues.values())
+        return len(self._queues[self.queue_name(priority)])
+
+    def slo_ms(self, priority: str) -> float:
+        """Target max wait for one queue"""
+        return self._stats[self.queue_name(priority)].slo_ms
+
+    @asynccontextmanager
+    async def slot(self, priority: str) -> AsyncIterator[None]:
+        """Hold one upstream slot for the duration of the block"""
+        await self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release()
+
+    async def acquire(self, priority: str) -> None:
+        """Wait for an upstream slot. Cancel-safe: a cancelled waiter never leaks a slot"""
+        name = self.queue_name(priority)
+        queue = self._queues[name]
+
+        # Fast path: free slot and nobody waiting
+        if self._active < self.max_concurrency and self.depth() == 0:
+            self._active += 1
+            self._stats[name].record_wait(0.0)
+            return
+
+        if not queue:
+            # A queue that was idle rejoins at the current virtual time so it
+            # cannot bank credit while empty and then monopolise the slots
+            self._pass[name] = max(self._pass[name], self._virtual_time)
+
+        future = asyncio.get_running_loop().create_future()
+        queue.append((future, time.monotonic()))
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Slot was granted just as we were cancelled - hand it on
+                self.release()
+            else:
+                self._stats[name].cancelled += 1
+                self._discard(queue, future)
+            raise
+
+    def try_acquire(self, priority: str) -> bool:
+        """Take a slot only if one is free right now and nobody is waiting"""
+        if self._active < self.max_concurrency and self.depth() == 0:
+            self._active += 1
+            return True
+        return False
+
+    @staticmethod
+    def _discard(queue: Deque[Tuple[asyncio.Future, float]], future: asyncio.Future) -> None:
+        for entry in queue:
+            if entry[0] is future:
+                queue.remove(entry)
+                return
+
+    def release(self) -> None:
+        """Give a slot back and start the next waiting call"""
+        self._active -= 1
+        self._dispatch()
+
+    def _next_queue(self) -> Optional[str]:
+        candidates = [name for name, queue in self._queues.items() if queue]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda name: (self._pass[name], -self.weights[name]))
+
+    def _dispatch(self) -> None:
+        while self._active < self.max_concurrency:
+            name = self._next_queue()
+            if name is None:
+                return
+
+            future, enqueued_at = self._queues[name].popleft()
+            if future.done():
+                continue
+
+            self._virtual_time = self._pass[name]
+            self._pass[name] += 1 / self.weights[name]
+            self._active += 1
+            self._stats[name].record_wait((time.monotonic() - enqueued_at) * 1000)
+            future.set_result(None)
+
+    def stats(self) -> Dict:
+        """Queue depth and wait times for the /metrics endpoint"""
+        queues = {}
+        for name, queue_stats in self._stats.items():
+            dispatched = queue_stats.dispatched
+            queues[name] = {
+                "weight": self.weights[name],
+                "depth": len(self._queues[name]),
+                "dispatched": dispatched,
+                "cancelled": queue_stats.cancelled,
+                "avg_wait_ms": round(queue_stats.total_wait_ms / dispatched, 2) if dispatched else 0.0,
+                "p95_wait_ms": round(queue_stats.p95_wait_ms(), 2),
+                "max_wait_ms": round(queue_stats.max_wait_ms, 2),
+                "slo_ms": queue_stats.slo_ms,
+                "slo_violations": queue_stats.slo_violations
+            }
+
+        return {
+            "max_concurrency": self.max_concurrency,
+            "active": self._active,
+            "queued": self.depth(),
+            "queues": queues
+        }
+
+
+def scheduler_concurrency() -> int:
+    """
+    Cap for the shared scheduler: LLM_MAX_CONCURRENCY, raised to the worker
+    pool's capacity with LLM_PROVIDER=workers so a lower cap cannot leave
+    worker slots idle
+    """
+    if settings.LLM_PROVIDER != "workers":
+        return settings.LLM_MAX_CONCURRENCY
+    pool_size = settings.LLM_WORKER_PROCESSES * settings.LLM_WORKER_CONCURRENCY
+    if settings.LLM_MAX_CONCURRENCY < pool_size:
+        print(f"⚠️  LLM_MAX_CONCURRENCY={settings.LLM_MAX_CONCURRENCY} is below the worker pool's "
+              f"{pool_size} slots; using {pool_size}")
+        return pool_size
+    return settings.LLM_MAX_CONCURRENCY
+
+
+# Shared scheduler for all AIService calls
+llm_scheduler = LLMScheduler(
+    max_concurrency=scheduler_concurrency(),
+    weights=settings.LLM_PRIORITY_WEIGHTS,
+    slo_ms=settings.LLM_QUEUE_SLO_MS
+)
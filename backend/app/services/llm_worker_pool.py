@@ -0,0 +1,378 @@
+"""
+LLM Worker Pool
+
+Optional deployment mode (LLM_PROVIDER=workers) that runs model calls in
+separate worker processes instead of the API process. Each worker runs
+its own event loop and a regular provider (LLM_WORKER_BACKEND, e.g.
+gemini or stub) and serves up to LLM_WORKER_CONCURRENCY calls at once;
+the API process only sends prompts and relays text back, so SDK work,
+response parsing and any blocking in the client library stay off the
+loop that serves HTTP and Socket.IO.
+
+    API process                                 worker processes
+    WorkerPoolProvider --- request queue --->   _worker_main (provider)
+          ^                                           |
+          +-------- result queue (reader thread) <----+
+
+- Calls go to the least loaded live worker, over one multiprocessing
+  queue per worker
+- Results come back on one shared queue, read by a thread that hands
+  them to the waiting coroutine on the API event loop
+- Backpressure: once every worker is full and LLM_WORKER_MAX_PENDING
+  calls are waiting on top, new calls are refused with
+  LLMOverloadedError (503 + Retry-After). AIService checks this before
+  admitting a request (check_capacity), so the API tier sheds load
+  before it queues work the pool cannot take
+- A caller that gives up (timeout, client gone) cancels the call in the
+  worker; a worker that dies fails its in-flight calls as transient
+  errors and is restarted
+
+The pool belongs to one API process: under uvicorn --workers N, each API
+worker starts its own LLM_WORKER_PROCESSES processes, so the upstream can
+see up to N x LLM_WORKER_PROCESSES x LLM_WORKER_CONCURRENCY calls at once.
+Size the per-process settings from the quota divided by N. The API-side
+scheduler still applies; with LLM_PROVIDER=workers its cap is raised to
+the pool's capacity if LLM_MAX_CONCURRENCY is lower (see llm_scheduler).
+"""
+
+import time
+import queue
+import asyncio
+import itertools
+import threading
+import multiprocessing
+from collections import deque
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional, Tuple
+from app.config.settings import settings
+from app.services.admission import LLMOverloadedError, retry_after_seconds
+from app.services.llm_provider import (
+    LLMError, LLMProvider, LLMRateLimitError, LLMTransientError, create_provider
+)
+
+# Message kinds sent back by workers: (worker, call_id, kind, payload)
+CHUNK = "chunk"
+DONE = "done"
+ERROR = "error"
+
+# How often the result reader checks for dead workers while no results arrive
+WORKER_CHECK_SECONDS = 1.0
+
+ERROR_TYPES = {
+    "rate_limit": LLMRateLimitError,
+    "transient": LLMTransientError,
+    "error": LLMError,
+}
+
+
+def _error_kind(error: Exception) -> str:
+    if isinstance(error, LLMRateLimitError):
+        return "rate_limit"
+    if isinstance(error, (LLMTransientError, asyncio.TimeoutError)):
+        return "transient"
+    return "error"
+
+
+# ============================================
+# WORKER PROCESS
+# ============================================
+
+def _worker_main(index: int, backend: str, concurrency: int, requests, results) -> None:
+    """
+    Entry point of a worker process
+
+    Requests are ("generate" | "stream", call_id, prompt, config, prefix),
+    ("cancel", call_id) or None to stop.
+    """
+    asyncio.run(_serve(index, backend, concurrency, requests, results))
+
+
+async def _serve(index: int, backend: str, concurrency: int, requests, results) -> None:
+    loop = asyncio.get_running_loop()
+    provider = create_provider(backend)
+    slots = asyncio.Semaphore(concurrency)
+    tasks: Dict[int, asyncio.Task] = {}
+
+    async def run(call_id: int, mode: str, prompt: str, config: Dict, prefix: Optional[str]) -> None:
+        try:
+            async with slots:
+                if mode == "stream":
+                    async for text in provider.stream(prompt, config, prefix=prefix):
+                        results.put((index, call_id, CHUNK, text))
+                    results.put((index, call_id, DONE, None))
+                else:
+                    results.put((index, call_id, DONE, await provider.generate(prompt, config, prefix=prefix)))
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            results.put((index, call_id, ERROR, (_error_kind(e), f"{type(e).__name__}: {e}")))
+        finally:
+            tasks.pop(call_id, None)
+
+    while True:
+        message = await loop.run_in_executor(None, requests.get)
+        if message is None:
+            break
+        if message[0] == "cancel":
+            task = tasks.get(message[1])
+            if task is not None:
+                task.cancel()
+            continue
+        mode, call_id, prompt, config, prefix = message
+        tasks[call_id] = asyncio.create_task(run(call_id, mode, prompt, config, prefix))
+
+    for task in list(tasks.values()):
+        task.cancel()
+
+
+# ============================================
+# API-SIDE PROVIDER
+# ============================================
+
+class _Call:
+    """A call waiting for its worker; messages arrive through an asyncio queue"""
+
+    __slots__ = ("worker", "messages")
+
+    def __init__(self, worker: int):
+        self.worker = worker
+        self.messages: asyncio.Queue = asyncio.Queue()
+
+
+class WorkerPoolProvider(LLMProvider):
+    """
+    LLMProvider that forwards calls to a pool of worker processes
+
+    Usage:
+        provider = WorkerPoolProvider("gemini", processes=2, concurrency=16)
+        text = await provider.generate(prompt, config, prefix=prefix)
+    """
+
+    name = "workers"
+
+    def __init__(self, backend: str, processes: int = 2, concurrency: int = 16, max_pending: int = 64):
+        """
+        :param backend: Provider each worker runs ("gemini" or "stub")
+        :param processes: Number of worker processes
+        :param concurrency: Calls each worker runs at the same time
+        :param max_pending: Calls allowed to wait once every worker is full
+        """
+        if backend == self.name:
+            raise ValueError("LLM_WORKER_BACKEND cannot itself be 'workers'")
+
+        self.backend = backend
+        self.processes = processes
+        self.concurrency = concurrency
+        self.max_pending = max_pending
+
+        self._context = multiprocessing.get_context("spawn")
+        self._workers: List[Optional[Any]] = [None] * processes
+        self._requests: List[Optional[Any]] = [None] * processes
+        self._load = [0] * processes
+        self._results = None
+        self._reader: Optional[threading.Thread] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._calls: Dict[int, _Call] = {}
+        self._ids = itertools.count()
+        self._latency: Deque[float] = deque(maxlen=200)
+
+        self.dispatched = 0
+        self.rejected = 0
+        self.restarts = 0
+        self.worker_failures = 0
+
+    # ---------- lifecycle ----------
+
+    def _start(self) -> None:
+        """Spawn workers and the result reader on first use, bound to the running loop"""
+        if self._results is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._results = self._context.Queue()
+        for index in range(self.processes):
+            self._spawn(index)
+        self._reader = threading.Thread(target=self._read_results, name="llm-worker-results", daemon=True)
+        self._reader.start()
+
+    def _spawn(self, index: int) -> None:
+        self._requests[index] = self._context.Queue()
+        process = self._context.Process(
+            target=_worker_main,
+            args=(index, self.backend, self.concurrency, self._requests[index], self._results),
+            name=f"llm-worker-{index}",
+            daemon=True
+        )
+        process.start()
+        self._workers[index] = process
+
+    def _revive(self) -> None:
+        """Fail the calls of dead workers and start replacements"""
+        for index, process in enumerate(self._workers):
+            if process is None or process.is_alive():
+                continue
+            print(f"⚠️  LLM worker {index} exited with code {process.exitcode}, restarting")
+            self.worker_failures += 1
+            for call_id, call in list(self._calls.items()):
+                if call.worker == index:
+                    self._deliver(call_id, ERROR, ("transient", f"LLM worker {index} exited"))
+            self._load[index] = 0
+            self._spawn(index)
+            self.restarts += 1
+
+    def close(self) -> None:
+        """Stop the workers and the reader thread"""
+        if self._results is None:
+            return
+        for requests in self._requests:
+            if requests is not None:
+                requests.put(None)
+        for process in self._workers:
+            if process is not None:
+                process.join(timeout=5)
+                if process.is_alive():
+                    process.terminate()
+        self._results.put(None)
+        self._reader.join(timeout=5)
+        self._results = None
+
+    # ---------- result delivery ----------
+
+    def _read_results(self) -> None:
+        results = self._results
+        try:
+            while True:
+                try:
+                    message = results.get(timeout=WORKER_CHECK_SECONDS)
+                except queue.Empty:
+                    # Quiet period: make sure no caller is waiting on a dead worker
+                    if any(process is not None and not process.is_alive() for process in self._workers):
+                        self._loop.call_soon_threadsafe(self._revive)
+                    continue
+                if message is None:
+                    return
+                _, call_id, kind, payload = message
+                self._loop.call_soon_threadsafe(self._deliver, call_id, kind, payload)
+        except (OSError, EOFError, RuntimeError):
+            # Queue or event loop closed at shutdown
+            return
+
+    def _deliver(self, call_id: int, kind: str, payload: Any) -> None:
+        call = self._calls.get(call_id)
+        if call is None:
+            return  # Caller already gave up
+        if kind != CHUNK:
+            self._finish(call_id)
+        call.messages.put_nowait((kind, payload))
+
+    def _finish(self, call_id: int) -> None:
+        call = self._calls.pop(call_id, None)
+        if call is not None:
+            self._load[call.worker] -= 1
+
+    # ---------- backpressure ----------
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._calls)
+
+    @property
+    def capacity(self) -> int:
+        return self.processes * self.concurrency + self.max_pending
+
+    def check_capacity(self) -> None:
+        """
+        Raise if the pool cannot take another call
+
+        Raises:
+            LLMOverloadedError: every worker is busy and the waiting list is full
+        """
+        if self.in_flight < self.capacity:
+            return
+        self.rejected += 1
+        waiting = self.in_flight - self.processes * self.concurrency + 1
+        typical = sorted(self._latency)[len(self._latency) // 2] if self._latency else 1.0
+        raise LLMOverloadedError(
+            retry_after=retry_after_seconds(waiting / max(self.processes * self.concurrency, 1) * typical),
+            reason=f"LLM worker pool is full ({self.in_flight} calls in flight)"
+        )
+
+    # ---------- calls ----------
+
+    def _dispatch(self, mode: str, prompt: str, config: Dict, prefix: Optional[str]) -> Tuple[int, _Call]:
+        self._start()
+        self._revive()
+        self.check_capacity()
+
+        worker = min(range(self.processes), key=lambda index: self._load[index])
+        call_id = next(self._ids)
+        call = _Call(worker)
+        self._calls[call_id] = call
+        self._load[worker] += 1
+        self.dispatched += 1
+        self._requests[worker].put((mode, call_id, prompt, config, prefix))
+        return call_id, call
+
+    def _abandon(self, call_id: int) -> None:
+        """Caller stopped waiting: free the call and tell its worker"""
+        call = self._calls.get(call_id)
+        if call is None:
+            return
+        self._finish(call_id)
+        self._requests[call.worker].put(("cancel", call_id))
+
+    @staticmethod
+    def _raise(payload: Tuple[str, str]) -> None:
+        kind, message = payload
+        raise ERROR_TYPES.get(kind, LLMError)(message)
+
+    async def generate(self, prompt: str, config: Dict, prefix: Optional[str] = None) -> str:
+        call_id, call = self._dispatch("generate", prompt, config, prefix)
+        started = time.monotonic()
+        try:
+            kind, payload = await call.messages.get()
+        finally:
+            self._abandon(call_id)
+        if kind == ERROR:
+            self._raise(payload)
+        self._latency.append(time.monotonic() - started)
+        return payload
+
+    async def stream(self, prompt: str, config: Dict, prefix: Optional[str] = None) -> AsyncIterator[str]:
+        call_id, call = self._dispatch("stream", prompt, config, prefix)
+        started = time.monotonic()
+        try:
+            while True:
+                kind, payload = await call.messages.get()
+                if kind == CHUNK:
+                    yield payload
+                elif kind == ERROR:
+                    self._raise(payload)
+                else:
+                    break
+        finally:
+            self._abandon(call_id)
+        self._latency.append(time.monotonic() - started)
+
+    def stats(self) -> Dict:
+        return {
+            "name": self.name,
+            "backend": self.backend,
+            "processes": self.processes,
+            "alive": sum(1 for process in self._workers if process is not None and process.is_alive()),
+            "concurrency_per_process": self.concurrency,
+            "in_flight": self.in_flight,
+            "capacity": self.capacity,
+            "load": list(self._load),
+            "dispatched": self.dispatched,
+            "rejected": self.rejected,
+            "worker_failures": self.worker_failures,
+            "restarts": self.restarts
+        }
+
+    @classmethod
+    def from_settings(cls) -> "WorkerPoolProvider":
+        return cls(
+            backend=settings.LLM_WORKER_BACKEND,
+            processes=settings.LLM_WORKER_PROCESSES,
+            concurrency=settings.LLM_WORKER_CONCURRENCY,
+            max_pending=settings.LLM_WORKER_MAX_PENDING
+        )
@@ -0,0 +1,91 @@
+"""
+Keyset Pagination
+
+List endpoints return pages newest first, ordered by (created_at, _id),
+with an opaque cursor for the next page:
+
+    page = await fetch_page(db.products, {"available": True}, cursor, limit)
+    # {"items": [...], "next_cursor": "MjAyNi0wMS0xOF..." or None}
+
+The cursor encodes the sort key of the last item returned, and the next
+page starts strictly after it. Unlike skip/limit, every page is a bounded
+index range scan on a compound index ending in (created_at, _id), so a
+page costs the same on the first visit as on the thousandth, and items
+inserted meanwhile neither repeat nor go missing.
+"""
+
+import base64
+import binascii
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+from bson import ObjectId
+from bson.errors import InvalidId
+from pymongo import DESCENDING
+
+# Sort order shared by every paged list; indexes must end with these keys
+PAGE_SORT = [("created_at", DESCENDING), ("_id", DESCENDING)]
+
+
+def encode_cursor(created_at: datetime, oid: ObjectId) -> str:
+    """Opaque cursor for the item a page ended on"""
+    raw = f"{created_at.isoformat()}|{oid}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, ObjectId]:
+    """
+    Sort key stored in a cursor
+
+    Raises:
+        ValueError: the cursor was not issued by encode_cursor
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, oid = raw.split("|")
+        return datetime.fromisoformat(created_at), ObjectId(oid)
+    except (binascii.Error, UnicodeDecodeError, ValueError, InvalidId):
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+
+
+def after_cursor(query: Dict, cursor: Optional[str]) -> Dict:
+    """Query restricted to items that sort after the cursor"""
+    if not cursor:
+        return query
+    created_at, oid = decode_cursor(cursor)
+    return {
+        **query,
+        "$or": [
+            {"created_at": {"$lt": created_at}},
+            {"created_at": created_at, "_id": {"$lt": oid}}
+        ]
+    }
+
+
+async def fetch_page(
+    collection,
+    query: Dict,
+    cursor: Optional[str],
+    limit: int,
+    projection: Optional[Dict] = None
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    One page of raw documents and the cursor for the next one
+
+    Reads limit + 1 documents to learn whether another page exists
+    without a count query. Documents without created_at are left out:
+    no cursor can point at them (database.backfill_created_at gives old
+    documents one at startup).
+
+    Raises:
+        ValueError: invalid cursor
+    """
+    query = {**query, "created_at": {"$ne": None}}
+    documents = await collection.find(after_cursor(query, cursor), projection) \
+        .sort(PAGE_SORT).limit(limit + 1).to_list(None)
+
+    next_cursor = None
+    if len(documents) > limit:
+        documents = documents[:limit]
+        last = documents[-1]
+        next_cursor = encode_cursor(last["created_at"], last["_id"])
+    return documents, next_cursor
@@ -0,0 +1,137 @@
+"""
+Pregnancy Week Content Routing
+
+Answers the common week-specific pregnancy questions ("what should I eat
+this week?", "how big is my baby?", "what are the warning signs?", "which
+tests are due?") from the precomputed table in
+app/prompts/pregnancy_weekly_content.py, without a model call.
+
+A small rule-based intent classifier decides what is covered. It is
+deliberately conservative: anything that reads like a personal symptom,
+a "can I / is it safe" question or a longer free-form message goes to
+the model as before.
+"""
+
+import re
+from functools import lru_cache
+from typing import NamedTuple, Optional, Tuple
+from app.prompts.pregnancy_weekly_content import CONTENT_VERSION, WEEKLY_CONTENT
+
+# Longer messages are rarely one of the stock questions
+MAX_WORDS = 20
+
+# Intent -> patterns, checked in this order (also the order of the sections in an answer)
+INTENT_PATTERNS = {
+    "development": [
+        r"\b(baby|babies|fetus|foetus|bachch?a)\b.*\b(grow\w*|develop\w*|size|big|weigh\w*|look\w* like|doing)\b",
+        r"\bhow big\b",
+        r"\b(baby|fetal|foetal) development\b",
+    ],
+    "nutrition": [
+        r"\b(what|which)\b.*\b(eat|food|foods|diet|meals?)\b",
+        r"\b(diet|food|nutrition|meal) (plan|chart|tips?)\b",
+        r"\bnutrition\b",
+        r"\bkya (khana|khaye?n?|khau)\b",
+    ],
+    "warning_signs": [
+        r"\b(warning|danger)\s+signs?\b",
+        r"\bred flags?\b",
+        r"\bwhen (should|do|to) (i )?(go|see|call|visit|rush)\b.*\b(doctor|hospital)\b",
+    ],
+    "checkups": [
+        r"\b(which|what|when|any)\b.*\b(check-?ups?|tests?|scans?|ultrasound|sonography|vaccines?|injections?)\b",
+        r"\b(check-?ups?|tests?|scans?|vaccines?) (due|needed|this week)\b",
+    ],
+}
+
+# Personal symptoms, safety questions and worries need a real conversation
+FREE_FORM_PATTERNS = [
+    r"\b(i am|i'm|im) (having|feeling|bleeding|in pain|worried|scared)\b",
+    r"\bi (have|feel|felt|had|got|noticed)\b",
+    r"\b(pain|hurts?|bleeding|spotting|fever|vomit\w*|cramps?|swollen|swelling|dizzy|itch\w*|discharge)\b",
+    r"\b(can|could|may) i\b",
+    r"\bis it (safe|ok|okay|normal|fine)\b",
+    r"\bis (my|the) baby (ok|okay|fine|safe|normal|healthy)\b",
+    r"\b(not moving|less movement|stopped moving|no movement)\b",
+    r"\b(why|twins?|miscarriage|sex|medicine|tablet dose)\b",
+]
+
+_INTENTS = [(intent, [re.compile(pattern) for pattern in patterns]) for intent, patterns in INTENT_PATTERNS.items()]
+_FREE_FORM = re.compile("|".join(FREE_FORM_PATTERNS))
+_WEEK = re.compile(r"\bweek\s*(\d{1,2})\b|\b(\d{1,2})(?:st|nd|rd|th)?\s*week\b")
+
+
+class ContentAnswer(NamedTuple):
+    text: str
+    intents: Tuple[str, ...]
+    week: int
+    version: str
+
+
+def classify(message: str) -> Tuple[str, ...]:
+    """
+    Intents of a message that the weekly table can answer
+
+    Returns:
+        Tuple of intents in answer order, or () when the model should answer
+    """
+    text = message.lower().strip()
+    if len(text.split()) > MAX_WORDS or _FREE_FORM.search(text):
+        return ()
+    return tuple(intent for intent, patterns in _INTENTS if any(p.search(text) for p in patterns))
+
+
+def mentioned_week(message: str) -> Optional[int]:
+    """Week number asked about explicitly ("week 30", "30th week"), if any"""
+    match = _WEEK.search(message.lower())
+    if not match:
+        return None
+    week = int(match.group(1) or match.group(2))
+    return week if 1 <= week <= 40 else None
+
+
+@lru_cache(maxsize=256)
+def render(week: int, intents: Tuple[str, ...]) -> str:
+    """Friendly answer text for a week; 40 weeks x a few intent combinations"""
+    content = WEEKLY_CONTENT[week]
+    sections = []
+    for intent in intents:
+        if intent == "development":
+            if content["size"]:
+                sections.append(f"👶 Your baby this week is about the size of {content['size']}. {content['development']}")
+            else:
+                sections.append(f"👶 {content['development']}")
+        elif intent == "nutrition":
+            sections.append(f"🥗 What to eat: {content['nutrition']}")
+        elif intent == "warning_signs":
+            sections.append(f"🚨 Go to a doctor or hospital straight away if you notice: {content['warning_signs']}.")
+        elif intent == "checkups":
+            sections.append(f"🏥 Checkups: {content['checkups']}")
+
+    body = "\n\n".join(sections)
+    return f"""🤰 Week {week} of your pregnancy
+
+{body}
+
+Every pregnancy is a little different, so keep going for your regular checkups and ask me anything else on your mind. You're doing great! 💕"""
+
+
+def answer(message: str, weeks_pregnant: int) -> Optional[ContentAnswer]:
+    """
+    Answer from the weekly table, or None if the model should handle the message
+
+    Args:
+        message: The user's message
+        weeks_pregnant: Current week from calculate_pregnancy_info, used
+            unless the message names another week
+    """
+    intents = classify(message)
+    if not intents:
+        return None
+    week = mentioned_week(message) or min(max(weeks_pregnant, 1), 40)
+    return ContentAnswer(render(week, intents), intents, week, CONTENT_VERSION)
+
+
+def stats() -> dict:
+    info = render.cache_info()
+    return {"version": CONTENT_VERSION, "weeks": len(WEEKLY_CONTENT), "rendered": info.currsize, "hits": info.hits}
@@ -0,0 +1,141 @@
+"""
+Prompt Assembly
+
+Builds bot prompts from two parts:
+
+- prefix: the static system prompt of a bot, compiled once at import and
+  byte-identical across users, so an upstream context/prefix cache (or
+  Gemini's system instruction) can reuse it
+- body:   the per-request part - user context, conversation history and
+  the message
+
+Context blocks only depend on a few small values (age, dates, week,
+farm details), so they are rendered once and memoized in bounded LRU
+caches instead of being rebuilt on every request. The Krishi Bot blocks
+live in krishi_bot_prompt.py and are memoized the same way.
+"""
+
+from functools import lru_cache
+from typing import Dict, NamedTuple
+from app.config.settings import settings
+from app.prompts.krishi_bot_prompt import get_knowledge_block, get_user_context
+from app.prompts.period_bot_prompt import PERIOD_CARE_SYSTEM_PROMPT, get_period_context_prompt
+from app.prompts.pregnancy_bot_prompt import PREGNANCY_CARE_SYSTEM_PROMPT, get_pregnancy_context_prompt
+from app.prompts.translation_prompt import SUPPORTED_LANGUAGES, TRANSLATION_SYSTEM_PROMPT
+
+RESPONSE_INSTRUCTIONS = "Respond as a caring friend. Be warm, empathetic, and conversational. Answer their question completely and thoroughly. If they're sharing pain or discomfort, comfort them first. Make them feel heard and supported:"
+CHAT_INSTRUCTIONS = "Respond warmly and helpfully:"
+
+
+class Prompt(NamedTuple):
+    """A prompt split into its stable prefix and per-request body"""
+
+    prefix: str
+    body: str
+
+    @property
+    def text(self) -> str:
+        """The whole prompt as a single string"""
+        if not self.prefix:
+            return self.body
+        return f"{self.prefix}\n\n{self.body}"
+
+
+# ============================================
+# PRECOMPILED PREFIXES
+# ============================================
+
+PERIOD_PREFIX = PERIOD_CARE_SYSTEM_PROMPT.strip()
+PREGNANCY_PREFIX = PREGNANCY_CARE_SYSTEM_PROMPT.strip()
+TRANSLATION_PREFIXES = {
+    code: TRANSLATION_SYSTEM_PROMPT.format(language=name).strip()
+    for code, name in SUPPORTED_LANGUAGES.items()
+}
+
+# Tail shared by every health bot body: only the message is spliced in
+_HEALTH_TAIL = "\n\n" + RESPONSE_INSTRUCTIONS
+_CHAT_TAIL = "\n\n" + CHAT_INSTRUCTIONS
+
+
+# ============================================
+# MEMOIZED CONTEXT BLOCKS
+# ============================================
+
+@lru_cache(maxsize=settings.PROMPT_CONTEXT_CACHE_SIZE)
+def period_context(age: int, last_period_date: str, next_period_prediction: str, days_since: int) -> str:
+    return get_period_context_prompt(
+        age=age,
+        last_period_date=last_period_date,
+        next_period_prediction=next_period_prediction,
+        days_since=days_since
+    ).strip()
+
+
+@lru_cache(maxsize=settings.PROMPT_CONTEXT_CACHE_SIZE)
+def pregnancy_context(confirmation_date: str, weeks_pregnant: int, trimester: str, due_date: str) -> str:
+    return get_pregnancy_context_prompt(
+        confirmation_date=confirmation_date,
+        weeks_pregnant=weeks_pregnant,
+        trimester=trimester,
+        due_date=due_date
+    ).strip()
+
+
+# ============================================
+# PROMPT BUILDERS
+# ============================================
+
+def _body(context: str, history: str, user_message: str, tail: str) -> str:
+    parts = [context] if context else []
+    if history:
+        parts.append(history)
+    parts.append(f"User's Message: {user_message}")
+    return "\n\n".join(parts) + tail
+
+
+def period_prompt(
+    user_message: str,
+    age: int,
+    last_period_date: str,
+    next_period_prediction: str,
+    days_since: int,
+    history: str = ""
+) -> Prompt:
+    context = period_context(age, last_period_date, next_period_prediction, days_since)
+    return Prompt(PERIOD_PREFIX, _body(context, history, user_message, _HEALTH_TAIL))
+
+
+def pregnancy_prompt(
+    user_message: str,
+    confirmation_date: str,
+    weeks_pregnant: int,
+    trimester: str,
+    due_date: str,
+    history: str = ""
+) -> Prompt:
+    context = pregnancy_context(confirmation_date, weeks_pregnant, trimester, due_date)
+    return Prompt(PREGNANCY_PREFIX, _body(context, history, user_message, _HEALTH_TAIL))
+
+
+def chat_prompt(user_message: str, system_prompt: str, context: str = "") -> Prompt:
+    """Generic bot prompt: caller's system prompt as the prefix, optional context block"""
+    return Prompt(system_prompt.strip(), _body(context.strip(), "", user_message, _CHAT_TAIL))
+
+
+def translation_prompt(text: str, language: str) -> Prompt:
+    """Prompt translating an English answer into a supported language code"""
+    return Prompt(TRANSLATION_PREFIXES[language], f"Message:\n{text}\n\nTranslation:")
+
+
+def stats() -> Dict:
+    """Hit rates of the memoized context blocks"""
+    result = {}
+    for name, cached in (
+        ("period_context", period_context),
+        ("pregnancy_context", pregnancy_context),
+        ("krishi_user_context", get_user_context),
+        ("krishi_knowledge", get_knowledge_block),
+    ):
+        info = cached.cache_info()
+        result[name] = {"hits": info.hits, "misses": info.misses, "size": info.currsize}
+    return result
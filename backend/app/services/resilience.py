@@ -0,0 +1,205 @@
+"""
+Resilience Helpers for Upstream LLM Calls
+
+- CircuitBreaker: stops sending traffic to an upstream that keeps failing.
+  While open, calls fail in microseconds with CircuitOpenError (a 503 with
+  Retry-After) instead of each waiting for its own timeout. After a cool
+  down, a few half-open probe calls test whether the upstream recovered.
+- hedged_call: if a call runs longer than a latency percentile, start a
+  second identical call and take whichever answers first.
+"""
+
+import time
+import asyncio
+from collections import deque
+from typing import Awaitable, Callable, Deque, Dict, TypeVar
+from app.services.admission import LLMOverloadedError, retry_after_seconds
+
+T = TypeVar("T")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(LLMOverloadedError):
+    """The breaker is open; the upstream is not being called"""
+
+
+class CircuitBreaker:
+    """
+    Failure-rate circuit breaker
+
+    Closed:    calls pass; outcomes are recorded in a rolling window. When
+               at least min_calls are recorded and the failure rate reaches
+               failure_rate, the breaker opens.
+    Open:      calls are rejected until open_seconds have passed.
+    Half-open: up to half_open_probes calls are let through. A success
+               closes the breaker, a failure re-opens it.
+    """
+
+    def __init__(
+        self,
+        window: int = 20,
+        min_calls: int = 5,
+        failure_rate: float = 0.5,
+        open_seconds: float = 30,
+        half_open_probes: int = 1
+    ):
+        self.window = window
+        self.min_calls = min_calls
+        self.failure_rate = failure_rate
+        self.open_seconds = open_seconds
+        self.half_open_probes = half_open_probes
+
+        self._outcomes: Deque[bool] = deque(maxlen=window)  # True = failure
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+
+        self.times_opened = 0
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        """Current state; an open breaker turns half-open once the cool down ends"""
+        if self._state == OPEN and self.remaining_open_seconds() == 0:
+            self._state = HALF_OPEN
+            self._probes_in_flight = 0
+        return self._state
+
+    def remaining_open_seconds(self) -> float:
+        if self._state != OPEN:
+            return 0.0
+        return max(0.0, self._opened_at + self.open_seconds - time.monotonic())
+
+    def _reject(self) -> None:
+        self.rejected += 1
+        raise CircuitOpenError(
+            retry_after=retry_after_seconds(self.remaining_open_seconds()),
+            reason="AI service is temporarily unavailable (circuit open)"
+        )
+
+    def check(self) -> None:
+        """Fail fast if the breaker is open (does not take a probe slot)"""
+        if self.state == OPEN:
+            self._reject()
+
+    def before_call(self) -> None:
+        """
+        Ask permission for one upstream call
+
+        Raises:
+            CircuitOpenError: breaker is open, or all half-open probes are busy
+        """
+        state = self.state
+        if state == OPEN:
+            self._reject()
+        if state == HALF_OPEN:
+            if self._probes_in_flight >= self.half_open_probes:
+                self._reject()
+            self._probes_in_flight += 1
+
+    def release_probe(self) -> None:
+        """A permitted call ended without an outcome (e.g. it was cancelled)"""
+        if self._state == HALF_OPEN and self._probes_in_flight > 0:
+            self._probes_in_flight -= 1
+
+    def record_success(self) -> None:
+        if self._state == HALF_OPEN:
+            # Upstream answered a probe: start over with a clean window
+            self._state = CLOSED
+            self._outcomes.clear()
+            self._probes_in_flight = 0
+        self._outcomes.append(False)
+
+    def record_failure(self) -> None:
+        if self._state == HALF_OPEN:
+            self._open()
+            return
+
+        self._outcomes.append(True)
+        if len(self._outcomes) >= self.min_calls and self._current_failure_rate() >= self.failure_rate:
+            self._open()
+
+    def _open(self) -> None:
+        self._state = OPEN
+        self._opened_at = time.monotonic()
+        self._probes_in_flight = 0
+        self.times_opened += 1
+        print(f"⚠️  LLM circuit breaker opened for {self.open_seconds}s")
+
+    def _current_failure_rate(self) -> float:
+        if not self._outcomes:
+            return 0.0
+        return sum(self._outcomes) / len(self._outcomes)
+
+    def stats(self) -> Dict:
+        return {
+            "state": self.state,
+            "failure_rate": round(self._current_failure_rate(), 3),
+            "window_calls": len(self._outcomes),
+            "remaining_open_seconds": round(self.remaining_open_seconds(), 1),
+            "times_opened": self.times_opened,
+            "rejected": self.rejected
+        }
+
+
+class HedgeStats:
+    """Counters for hedged calls"""
+
+    def __init__(self):
+        self.hedged = 0     # Second calls started
+        self.hedge_wins = 0  # Second call answered first
+
+    def stats(self) -> Dict[str, int]:
+        return {"hedged": self.hedged, "hedge_wins": self.hedge_wins}
+
+
+async def hedged_call(
+    make_call: Callable[[], Awaitable[T]],
+    make_hedge: Callable[[], Awaitable[T]],
+    hedge_delay: float,
+    try_acquire_hedge: Callable[[], bool],
+    release_hedge: Callable[[], None],
+    stats: HedgeStats
+) -> T:
+    """
+    Run make_call(); if it is still running after hedge_delay, also run make_hedge()
+
+    The first successful result wins and the other call is cancelled. A
+    hedge is only started if try_acquire_hedge() grants spare capacity,
+    so hedging never queues behind other users' requests.
+
+    :param make_call: Zero-argument coroutine function for the first call
+    :param make_hedge: Same call, run on the capacity taken by try_acquire_hedge
+    :param hedge_delay: Seconds to wait before hedging
+    :param try_acquire_hedge: Non-blocking capacity check for the second call
+    :param release_hedge: Returns the capacity taken for the second call
+    :param stats: Counters to update
+    """
+    primary = asyncio.ensure_future(make_call())
+    try:
+        done, _ = await asyncio.wait({primary}, timeout=hedge_delay)
+        if done or not try_acquire_hedge():
+            return await primary
+
+        stats.hedged += 1
+        hedge = asyncio.ensure_future(make_hedge())
+        try:
+            pending = {primary, hedge}
+            error = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            stats.hedge_wins += 1
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            hedge.cancel()
+            release_hedge()
+    finally:
+        primary.cancel()
@@ -0,0 +1,86 @@
+"""
+AI Response Cache
+
+Caches bot answers keyed by the normalized user message plus the
+bucketed context that the bot prompts inject. Two users asking
+"cramps remedy?" on day 2 of their cycle share one Gemini call.
+
+Context is bucketed (cycle phase, age band, pregnancy week) rather than
+keyed on exact dates, so a cached answer is reused across users whose
+prompts only differ in details the answer does not depend on.
+
+Answers are cached in English; translations into the user's language
+are cached next to them, keyed by the English text (see
+AIService.translate), so every language shares one generation.
+"""
+
+import re
+import hashlib
+from typing import Hashable, Optional
+from app.config.settings import settings
+from app.services.cache import TTLLRUCache
+from app.services.health_calendar import cycle_phase
+
+# Shared cache instance for all bots
+response_cache = TTLLRUCache(
+    max_entries=settings.RESPONSE_CACHE_MAX_ENTRIES,
+    default_ttl=settings.RESPONSE_CACHE_TTLS.get("default", 3600)
+)
+
+_PUNCTUATION = re.compile(r"[^\w\s]")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_message(message: str) -> str:
+    """Lowercase, drop punctuation and collapse whitespace"""
+    message = _PUNCTUATION.sub(" ", message.lower())
+    return _WHITESPACE.sub(" ", message).strip()
+
+
+def get_ttl(bot: str) -> float:
+    """TTL in seconds for one bot's cached answers"""
+    return settings.RESPONSE_CACHE_TTLS.get(bot, settings.RESPONSE_CACHE_TTLS.get("default", 3600))
+
+
+def _age_band(age: int) -> str:
+    if age < 18:
+        return "teen"
+    if age < 40:
+        return "adult"
+    return "40plus"
+
+
+def _cycle_bucket(days_since: int, cycle_length: int) -> str:
+    # Same phases as calculate_next_period
+    if days_since < 0:
+        return "future"
+    if days_since > cycle_length:
+        return "late"
+    return cycle_phase(days_since, cycle_length)
+
+
+def period_cache_key(
+    user_message: str,
+    age: int,
+    days_since: int,
+    cycle_length: int = settings.DEFAULT_CYCLE_LENGTH
+) -> Hashable:
+    """Cache key for a Period Care Bot answer (cycle_length: the user's, if known)"""
+    return ("period", normalize_message(user_message), _age_band(age), _cycle_bucket(days_since, cycle_length))
+
+
+def pregnancy_cache_key(user_message: str, weeks_pregnant: int) -> Hashable:
+    """Cache key for a Pregnancy Care Bot answer (trimester follows from the week)"""
+    return ("pregnancy", normalize_message(user_message), weeks_pregnant)
+
+
+def prompt_cache_key(namespace: str, user_message: str, system_prompt: str) -> Hashable:
+    """Cache key for a generic bot answer, keyed on its full system prompt"""
+    prompt_hash = hashlib.sha1(system_prompt.encode("utf-8")).hexdigest()
+    return (namespace, normalize_message(user_message), prompt_hash)
+
+
+def translation_cache_key(text: str, language: str) -> Hashable:
+    """Cache key for the translation of an exact English answer into a language"""
+    text_hash = hashlib.sha1(text.encode("utf-8")).hexdigest()
+    return ("translation", language, text_hash)
@@ -0,0 +1,329 @@
+"""
+Scheme Eligibility Rules
+
+Structured catalog of the government schemes shown on the Schemes page,
+with eligibility written as data (field, operator, value) and compiled
+into plain predicates at import time. Checking a catalogued scheme is a
+dictionary lookup plus a handful of comparisons, so it runs in-process in
+microseconds; only schemes missing from the catalog go to the LLM.
+
+The same conditions are also compiled to NumPy column predicates, so a
+batch of applicant profiles is checked against every scheme in one
+vectorized pass (evaluate_batch).
+
+The rules cover the published headline criteria (age, annual household
+income, residence, social category). Document checks still happen at the
+enrolment center, which every reason reminds the user of.
+"""
+
+import re
+import operator
+import numpy as np
+from functools import lru_cache
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+# ============================================
+# SCHEME CATALOG
+# ============================================
+# Condition: {"field", "op", "value", "reason"} or {"any": [conditions], "reason"}
+# Fields: age (years), income (annual, rupees), residence (rural/urban),
+# caste (general/obc/sc/st). Text values are compared lower-cased.
+
+SCHEME_CATALOG: List[Dict] = [
+    {
+        "id": "sukanya_samriddhi",
+        "name": "Sukanya Samriddhi Yojana (SSY)",
+        "aliases": ["sukanya", "ssy"],
+        "conditions": [
+            {"field": "age", "op": "<", "value": 10, "reason": "Age must be less than 10 years."},
+        ],
+        "eligible_reason": "Your girl child is under 10, so you can open an SSY account at a post office or bank!",
+    },
+    {
+        "id": "pmmvy",
+        "name": "PM Matru Vandana Yojana (PMMVY)",
+        "aliases": ["pmmvy", "matru vandana", "matritva vandana"],
+        "conditions": [
+            {"field": "age", "op": ">=", "value": 19, "reason": "Mothers must be at least 19 years old."},
+            {"field": "income", "op": "<", "value": 800000, "reason": "Household income must be below ₹8 lakh a year."},
+        ],
+        "eligible_reason": "You meet the age and income criteria for PMMVY maternity support!",
+    },
+    {
+        "id": "ujjwala",
+        "name": "PM Ujjwala Yojana 2.0",
+        "aliases": ["ujjwala", "pmuy"],
+        "conditions": [
+            {"field": "age", "op": ">=", "value": 18, "reason": "The applicant must be a woman aged 18 or above."},
+            {
+                "any": [
+                    {"field": "income", "op": "<=", "value": 100000},
+                    {"field": "caste", "op": "in", "value": ["sc", "st"]},
+                ],
+                "reason": "Ujjwala is for BPL households (income up to ₹1 lakh) or SC/ST families.",
+            },
+        ],
+        "eligible_reason": "You qualify for a free LPG connection under Ujjwala 2.0!",
+    },
+    {
+        "id": "nrlm",
+        "name": "National Rural Livelihood Mission (NRLM)",
+        "aliases": ["nrlm", "rural livelihood", "aajeevika", "day-nrlm"],
+        "conditions": [
+            {"field": "age", "op": ">=", "value": 18, "reason": "SHG members must be 18 or older."},
+            {"field": "residence", "op": "==", "value": "rural", "reason": "NRLM is for women in rural households."},
+        ],
+        "eligible_reason": "You can join a Self Help Group under NRLM and access low-interest loans!",
+    },
+    {
+        "id": "stand_up_india",
+        "name": "Stand Up India Scheme",
+        "aliases": ["stand up india", "standup india", "stand-up india"],
+        "conditions": [
+            {"field": "age", "op": ">=", "value": 18, "reason": "Entrepreneurs must be at least 18 years old."},
+        ],
+        "eligible_reason": "Women entrepreneurs 18+ can apply for a Stand Up India loan for a new business!",
+    },
+    {
+        "id": "beti_bachao",
+        "name": "Beti Bachao Beti Padhao",
+        "aliases": ["beti bachao", "bbbp"],
+        "conditions": [
+            {"field": "age", "op": "<=", "value": 18, "reason": "The scheme supports girls up to 18 years."},
+        ],
+        "eligible_reason": "Girls up to 18 can benefit from Beti Bachao Beti Padhao programs!",
+    },
+    {
+        "id": "mahila_shakti_kendra",
+        "name": "Mahila Shakti Kendra (MSK)",
+        "aliases": ["mahila shakti", "msk"],
+        "conditions": [
+            {"field": "age", "op": ">=", "value": 18, "reason": "Participants must be 18 to 65 years old."},
+            {"field": "age", "op": "<=", "value": 65, "reason": "Participants must be 18 to 65 years old."},
+            {"field": "residence", "op": "==", "value": "rural", "reason": "Mahila Shakti Kendras serve rural women."},
+        ],
+        "eligible_reason": "You can get free skill training at your nearest Mahila Shakti Kendra!",
+    },
+    {
+        "id": "mudra",
+        "name": "PM Mudra Yojana",
+        "aliases": ["mudra", "pmmy"],
+        "conditions": [
+            {"field": "age", "op": ">=", "value": 18, "reason": "Borrowers must be at least 18 years old."},
+        ],
+        "eligible_reason": "You can apply for a Mudra loan for your small business!",
+    },
+]
+
+DOCUMENT_REMINDER = " Please carry your documents to the enrolment center to confirm."
+
+# ============================================
+# RULE COMPILATION
+# ============================================
+
+_OPERATORS: Dict[str, Callable] = {
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "==": operator.eq,
+    "!=": operator.ne,
+    "in": lambda value, allowed: value in allowed,
+}
+
+Applicant = Dict[str, object]
+Predicate = Callable[[Applicant], bool]
+Columns = Dict[str, np.ndarray]
+ColumnPredicate = Callable[[Columns], np.ndarray]
+
+
+class CompiledScheme(NamedTuple):
+    id: str
+    name: str
+    checks: Tuple[Tuple[Predicate, str], ...]  # (predicate, reason when it fails)
+    column_checks: Tuple[ColumnPredicate, ...]  # Same checks over whole columns
+    eligible_reason: str
+
+
+class EligibilityResult(NamedTuple):
+    scheme_id: str
+    is_eligible: bool
+    reason: str
+
+
+def _condition_value(condition: Dict):
+    value = condition["value"]
+    if isinstance(value, str):
+        return value.lower()
+    if isinstance(value, list):
+        return [item.lower() if isinstance(item, str) else item for item in value]
+    return value
+
+
+def _compile_condition(condition: Dict) -> Predicate:
+    if "any" in condition:
+        options = [_compile_condition(option) for option in condition["any"]]
+        return lambda applicant: any(option(applicant) for option in options)
+
+    compare = _OPERATORS[condition["op"]]
+    field = condition["field"]
+    value = _condition_value(condition)
+    if isinstance(value, list):
+        value = frozenset(value)
+    return lambda applicant: compare(applicant[field], value)
+
+
+def _compile_column_condition(condition: Dict) -> ColumnPredicate:
+    if "any" in condition:
+        options = [_compile_column_condition(option) for option in condition["any"]]
+        return lambda columns: np.logical_or.reduce([option(columns) for option in options])
+
+    field = condition["field"]
+    value = _condition_value(condition)
+    if condition["op"] == "in":
+        return lambda columns: np.isin(columns[field], value)
+    # The operator module functions broadcast elementwise over arrays
+    compare = _OPERATORS[condition["op"]]
+    return lambda columns: compare(columns[field], value)
+
+
+def compile_scheme(scheme: Dict) -> CompiledScheme:
+    return CompiledScheme(
+        id=scheme["id"],
+        name=scheme["name"],
+        checks=tuple((_compile_condition(c), c["reason"]) for c in scheme["conditions"]),
+        column_checks=tuple(_compile_column_condition(c) for c in scheme["conditions"]),
+        eligible_reason=scheme["eligible_reason"],
+    )
+
+
+def normalize_scheme_name(name: str) -> str:
+    return re.sub(r"[^a-z0-9]+", " ", name.lower()).strip()
+
+
+COMPILED_SCHEMES: Dict[str, CompiledScheme] = {
+    scheme["id"]: compile_scheme(scheme) for scheme in SCHEME_CATALOG
+}
+
+# Exact names and aliases first, then alias substrings for longer free-text names
+_NAME_INDEX: Dict[str, str] = {}
+for _scheme in SCHEME_CATALOG:
+    for _name in [_scheme["name"], _scheme["id"]] + _scheme["aliases"]:
+        _NAME_INDEX[normalize_scheme_name(_name)] = _scheme["id"]
+_ALIASES: List[Tuple[str, str]] = sorted(
+    ((normalize_scheme_name(alias), s["id"]) for s in SCHEME_CATALOG for alias in s["aliases"]),
+    key=lambda item: -len(item[0])  # Longest alias wins ("stand up india" before "india")
+)
+
+# ============================================
+# LOOKUP AND EVALUATION
+# ============================================
+
+@lru_cache(maxsize=1024)
+def find_scheme(scheme_name: str) -> Optional[str]:
+    """Catalog id for a scheme name as sent by the client, or None if not catalogued"""
+    normalized = normalize_scheme_name(scheme_name)
+    if normalized in _NAME_INDEX:
+        return _NAME_INDEX[normalized]
+
+    padded = f" {normalized} "
+    for alias, scheme_id in _ALIASES:
+        if f" {alias} " in padded:
+            return scheme_id
+    return None
+
+
+def make_applicant(age: int, income: int, residence: str, caste: str) -> Applicant:
+    return {
+        "age": age,
+        "income": income,
+        "residence": residence.strip().lower(),
+        "caste": caste.strip().lower(),
+    }
+
+
+def evaluate(scheme_id: str, applicant: Applicant) -> EligibilityResult:
+    """Run a catalogued scheme's rules; the first failing rule gives the reason"""
+    scheme = COMPILED_SCHEMES[scheme_id]
+    for predicate, reason in scheme.checks:
+        if not predicate(applicant):
+            return EligibilityResult(scheme.id, False, reason + DOCUMENT_REMINDER)
+    return EligibilityResult(scheme.id, True, scheme.eligible_reason + DOCUMENT_REMINDER)
+
+
+def check_eligibility(
+    scheme_name: str,
+    age: int,
+    income: int,
+    residence: str = "Rural",
+    caste: str = "General"
+) -> Optional[EligibilityResult]:
+    """
+    Answer an eligibility question from the catalog
+
+    Returns:
+        EligibilityResult, or None if the scheme is not in the catalog
+    """
+    scheme_id = find_scheme(scheme_name)
+    if scheme_id is None:
+        return None
+    return evaluate(scheme_id, make_applicant(age, income, residence, caste))
+
+
+# ============================================
+# BATCH EVALUATION
+# ============================================
+
+class BatchResult(NamedTuple):
+    scheme_ids: List[str]
+    eligible: np.ndarray      # bool, shape (profiles, schemes)
+    failed_check: np.ndarray  # int8, index of the first failing condition, -1 if eligible
+
+    def reasons(self) -> List[List[str]]:
+        """Reason text for every cell, same shape as eligible"""
+        columns = []
+        for column, scheme_id in enumerate(self.scheme_ids):
+            scheme = COMPILED_SCHEMES[scheme_id]
+            # Failing reasons by check index, eligible reason last so -1 selects it
+            texts = [reason for _, reason in scheme.checks] + [scheme.eligible_reason]
+            table = np.array([text + DOCUMENT_REMINDER for text in texts], dtype=object)
+            columns.append(table[self.failed_check[:, column]])
+        if not columns:
+            return [[] for _ in range(len(self.eligible))]
+        return np.stack(columns, axis=1).tolist()
+
+
+def to_columns(applicants: Sequence[Applicant]) -> Columns:
+    """Turn applicant dicts (see make_applicant) into one array per field"""
+    return {
+        "age": np.fromiter((a["age"] for a in applicants), dtype=np.int64, count=len(applicants)),
+        "income": np.fromiter((a["income"] for a in applicants), dtype=np.int64, count=len(applicants)),
+        "residence": np.array([a["residence"] for a in applicants], dtype=str),
+        "caste": np.array([a["caste"] for a in applicants], dtype=str),
+    }
+
+
+def evaluate_batch(applicants: Sequence[Applicant], scheme_ids: Optional[Sequence[str]] = None) -> BatchResult:
+    """
+    Check every applicant against every scheme in one vectorized pass
+
+    Each condition runs once over whole columns instead of once per
+    applicant, so thousands of profile x scheme checks take milliseconds.
+
+    :param applicants: Profiles built with make_applicant
+    :param scheme_ids: Catalog ids to check; all catalogued schemes when None
+    """
+    scheme_ids = list(scheme_ids) if scheme_ids is not None else list(COMPILED_SCHEMES)
+    columns = to_columns(applicants)
+
+    eligible = np.ones((len(applicants), len(scheme_ids)), dtype=bool)
+    failed_check = np.full((len(applicants), len(scheme_ids)), -1, dtype=np.int8)
+
+    for column, scheme_id in enumerate(scheme_ids):
+        passing = eligible[:, column]  # View: updated in place
+        for index, column_check in enumerate(COMPILED_SCHEMES[scheme_id].column_checks):
+            newly_failed = passing & ~column_check(columns)
+            failed_check[newly_failed, column] = index
+            passing &= ~newly_failed
+
+    return BatchResult(scheme_ids, eligible, failed_check)
@@ -0,0 +1,41 @@
+"""
+JSON Serialization for List Endpoints
+
+Turns raw MongoDB documents into a response body in one json.dumps call:
+ObjectId and datetime values are converted by the encoder's default hook
+as it meets them, instead of a Python loop rewriting every document first
+and FastAPI then validating and re-encoding the result.
+
+    return json_response({"items": documents, "next_cursor": next_cursor})
+
+Returning a Response skips response_model validation; the route's
+response_model still documents the shape in OpenAPI.
+"""
+
+import json
+from datetime import date, datetime
+from typing import Any
+from bson import ObjectId
+from fastapi import Response
+
+
+def _encode(value: Any) -> Any:
+    if isinstance(value, ObjectId):
+        return str(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> str:
+    """Compact JSON for documents that may hold ObjectId / datetime values"""
+    return json.dumps(content, default=_encode, ensure_ascii=False, separators=(",", ":"))
+
+
+def encoded_response(body: str, status_code: int = 200) -> Response:
+    """Response for a body already encoded with dumps() (e.g. from a cache)"""
+    return Response(content=body, status_code=status_code, media_type="application/json")
+
+
+def json_response(content: Any, status_code: int = 200) -> Response:
+    return encoded_response(dumps(content), status_code)
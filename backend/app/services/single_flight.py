@@ -0,0 +1,72 @@
+"""
+Single-Flight Request Coalescing
+
+When many callers ask for the same thing at the same time, only the first
+one (the leader) runs the upstream call. Everyone else awaits the same
+result. Used under AIService so a burst of identical prompts costs one
+Gemini call instead of dozens.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class SingleFlight:
+    """
+    Deduplicate concurrent calls that share a key
+    
+    Waiters are cancel-safe: a cancelled waiter stops waiting, but the
+    shared call keeps running for the others (and for anything it caches).
+    """
+    
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Task] = {}
+        
+        self.executed = 0          # Upstream calls actually started
+        self.coalesced = 0         # Callers that joined an in-flight call
+        self.cancelled_waiters = 0  # Callers that gave up while waiting
+    
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run fn() once per key at a time and share its result
+        
+        :param key: Identity of the call (e.g. the full prompt)
+        :param fn: Zero-argument coroutine function doing the real work
+        """
+        task = self._calls.get(key)
+        
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda done, key=key: self._finish(key, done))
+            self.executed += 1
+        else:
+            self.coalesced += 1
+        
+        try:
+            # shield() keeps one waiter's cancellation from cancelling the shared task
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if not task.done():
+                self.cancelled_waiters += 1
+            raise
+    
+    def in_flight(self, key: Hashable) -> bool:
+        """True if a call with this key is running and can be joined"""
+        return key in self._calls
+    
+    def _finish(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # Mark the exception as retrieved even if every waiter was cancelled
+        if not task.cancelled():
+            task.exception()
+    
+    def stats(self) -> Dict[str, int]:
+        """Counters for the /metrics endpoint"""
+        return {
+            "in_flight": len(self._calls),
+            "executed": self.executed,
+            "coalesced": self.coalesced,
+            "cancelled_waiters": self.cancelled_waiters
+        }
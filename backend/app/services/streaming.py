@@ -0,0 +1,73 @@
+"""
+Streaming Helpers
+
+Turns a stream of model text chunks into chat events, and encodes those
+events as Server-Sent Events for HTTP clients. The same event sequence is
+emitted over Socket.IO by socket_events.chat_stream.
+
+Event order:
+    meta  -> {"prediction": ..., "additional_info": ..., "session_id": ..., "source": ...}
+    chunk -> {"text": ...}          (repeated)
+    done  -> {"response": full_text}
+"""
+
+import json
+from typing import AsyncIterator, Optional, Tuple
+from fastapi.responses import StreamingResponse
+
+ChatEvent = Tuple[str, dict]
+
+
+async def chat_events(
+    chunks: AsyncIterator[str],
+    prediction: Optional[str] = None,
+    additional_info: Optional[dict] = None,
+    session_id: Optional[str] = None,
+    source: str = "llm"
+) -> AsyncIterator[ChatEvent]:
+    """
+    Wrap model chunks with a leading meta event and a trailing done event
+    
+    The meta block is sent before the model is awaited so the client can
+    render predictions while the answer is still being generated.
+    """
+    yield "meta", {
+        "prediction": prediction,
+        "additional_info": additional_info,
+        "session_id": session_id,
+        "source": source
+    }
+    
+    parts = []
+    async for text in chunks:
+        parts.append(text)
+        yield "chunk", {"text": text}
+    
+    yield "done", {"response": "".join(parts).strip()}
+
+
+async def single_chunk(text: str) -> AsyncIterator[str]:
+    """Chunk stream for an answer that is already complete (cache, content table)"""
+    yield text
+
+
+def format_sse(event: str, data: dict) -> str:
+    """Encode one event in text/event-stream format"""
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+async def _encode_sse(events: AsyncIterator[ChatEvent]) -> AsyncIterator[str]:
+    async for event, data in events:
+        yield format_sse(event, data)
+
+
+def sse_response(events: AsyncIterator[ChatEvent]) -> StreamingResponse:
+    """Build a StreamingResponse that sends chat events as SSE"""
+    return StreamingResponse(
+        _encode_sse(events),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no"  # Stop reverse proxies from buffering chunks
+        }
+    )
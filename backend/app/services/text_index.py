@@ -0,0 +1,446 @@
+"""
+In-Process Text Index
+
+Small BM25 search index over short passages. Documents are tokenized once
+into an inverted index (term -> postings), so a query only touches the
+postings of its own terms instead of scanning every document.
+
+- BM25Index: built once, for retrieval-augmented prompts (see
+  krishi_knowledge.py). Cheap enough to rebuild at import time for a few
+  thousand passages.
+- SearchIndex: fielded, updated document by document, with Hindi /
+  Hinglish term folding and prefix matching for type-ahead search (see
+  catalog_search.py).
+"""
+
+import re
+import math
+import heapq
+import bisect
+import unicodedata
+from functools import lru_cache
+from collections import Counter, defaultdict
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+import numpy as np
+
+# Latin words and Devanagari words (vowel signs included)
+_TOKEN = re.compile(r"[a-z0-9]+|[ऀ-ॿ]+")
+
+STOPWORDS = frozenset("""
+a an and are as at be by can do does for from has have how i if in is it its
+my of on or our should so that the their them there these this to was what
+when which who why will with you your me we
+""".split())
+
+
+def _stem(token: str) -> str:
+    # Just enough to fold common plurals (tomatoes -> tomato, aphids -> aphid)
+    if len(token) > 4 and token.endswith("ies"):
+        return token[:-3] + "y"
+    if len(token) > 4 and token.endswith("oes"):
+        return token[:-2]
+    if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+        return token[:-1]
+    return token
+
+
+def tokenize(text: str) -> List[str]:
+    """Lower-case, split into words, drop stopwords and fold plurals"""
+    return [_stem(token) for token in _TOKEN.findall(text.lower()) if token not in STOPWORDS]
+
+
+class BM25Index:
+    """
+    Okapi BM25 over an inverted index
+
+    Usage:
+        index = BM25Index()
+        index.add("doc-1", "neem oil spray for aphids")
+        index.build()
+        index.search("aphid on mustard", k=3)  # [("doc-1", 1.23)]
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        """
+        :param k1: Term frequency saturation
+        :param b: Document length normalisation (0 = none, 1 = full)
+        """
+        self.k1 = k1
+        self.b = b
+
+        self._doc_ids: List[Hashable] = []
+        self._doc_lengths: List[int] = []
+        self._postings: Dict[str, List[Tuple[int, int]]] = defaultdict(list)  # term -> [(doc, tf)]
+        self._idf: Dict[str, float] = {}
+        self._norms: List[float] = []  # Per-document length normalisation, set by build()
+        self._avg_length = 0.0
+
+    def __len__(self) -> int:
+        return len(self._doc_ids)
+
+    def add(self, doc_id: Hashable, text: str) -> None:
+        """Index one document; call build() after the last add()"""
+        doc = len(self._doc_ids)
+        tokens = tokenize(text)
+        self._doc_ids.append(doc_id)
+        self._doc_lengths.append(len(tokens))
+        for term, tf in Counter(tokens).items():
+            self._postings[term].append((doc, tf))
+
+    def build(self) -> "BM25Index":
+        """Compute IDF and length statistics for the documents added so far"""
+        count = len(self._doc_ids)
+        self._avg_length = sum(self._doc_lengths) / count if count else 0.0
+        self._idf = {
+            term: math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for term, postings in self._postings.items()
+        }
+        avg_length = self._avg_length or 1.0
+        self._norms = [self.k1 * (1 - self.b + self.b * length / avg_length) for length in self._doc_lengths]
+        return self
+
+    def search(
+        self,
+        query: str,
+        k: int = 5,
+        boosts: Optional[Dict[str, float]] = None
+    ) -> List[Tuple[Hashable, float]]:
+        """
+        Top-k documents for a query
+
+        :param query: Free text
+        :param k: Number of results
+        :param boosts: Extra query text -> weight (e.g. the user's crops), scored
+            as if those terms appeared weight more times in the query
+        :returns: [(doc_id, score)], best first; only documents matching a term
+        """
+        weights: Dict[str, float] = Counter(tokenize(query))
+        for text, weight in (boosts or {}).items():
+            for term in tokenize(text):
+                weights[term] = weights.get(term, 0) + weight
+
+        scores: Dict[int, float] = defaultdict(float)
+        k1, norms = self.k1, self._norms
+        for term, weight in weights.items():
+            idf = self._idf.get(term)
+            if idf is None:
+                continue
+            term_weight = weight * idf * (k1 + 1)
+            for doc, tf in self._postings[term]:
+                scores[doc] += term_weight * tf / (tf + norms[doc])
+
+        best = heapq.nlargest(k, scores.items(), key=lambda item: item[1])
+        return [(self._doc_ids[doc], score) for doc, score in best]
+
+    def stats(self) -> Dict:
+        return {
+            "documents": len(self._doc_ids),
+            "terms": len(self._postings),
+            "avg_length": round(self._avg_length, 1)
+        }
+
+
+def build_index(documents: Iterable[Tuple[Hashable, str]], k1: float = 1.5, b: float = 0.75) -> BM25Index:
+    """Build an index from (doc_id, text) pairs"""
+    index = BM25Index(k1=k1, b=b)
+    for doc_id, text in documents:
+        index.add(doc_id, text)
+    return index.build()
+
+
+# ============================================
+# HINDI / HINGLISH TERMS
+# ============================================
+
+# Common Hindi function words, in Devanagari and romanized
+HINDI_STOPWORDS = frozenset("""
+ka ki ke ko se me mein mai hai hain aur ya par bhi ek wala wali wale
+का की के को से में है हैं और या पर भी एक वाला वाली वाले
+""".split())
+
+# Devanagari -> Latin, close to how people type Hindi words in Roman script
+_CONSONANTS = {
+    "क": "k", "ख": "kh", "ग": "g", "घ": "gh", "ङ": "n",
+    "च": "ch", "छ": "chh", "ज": "j", "झ": "jh", "ञ": "n",
+    "ट": "t", "ठ": "th", "ड": "d", "ढ": "dh", "ण": "n",
+    "त": "t", "थ": "th", "द": "d", "ध": "dh", "न": "n",
+    "प": "p", "फ": "ph", "ब": "b", "भ": "bh", "म": "m",
+    "य": "y", "र": "r", "ल": "l", "ळ": "l", "व": "v",
+    "श": "sh", "ष": "sh", "स": "s", "ह": "h",
+}
+_NUKTA_CONSONANTS = {"क": "q", "ख": "kh", "ग": "g", "ज": "z", "ड": "r", "ढ": "rh", "फ": "f"}
+_VOWELS = {
+    "अ": "a", "आ": "aa", "इ": "i", "ई": "ii", "उ": "u", "ऊ": "uu", "ऋ": "ri",
+    "ए": "e", "ऐ": "ai", "ओ": "o", "औ": "au", "ऍ": "e", "ऑ": "o",
+}
+_MATRAS = {
+    "ा": "aa", "ि": "i", "ी": "ii", "ु": "u", "ू": "uu", "ृ": "ri",
+    "े": "e", "ै": "ai", "ो": "o", "ौ": "au", "ॅ": "e", "ॉ": "o",
+}
+_NASALS = {"ं": "n", "ँ": "n", "ः": "h"}
+_NUKTA = "़"
+_VIRAMA = "्"
+
+# Spelling variants of romanized Hindi folded to one form (saree/sari, khoon/khun)
+_LATIN_FOLDS = (("ee", "i"), ("oo", "u"), ("w", "v"), ("ph", "f"), ("z", "j"), ("q", "k"))
+_REPEATS = re.compile(r"(.)\1+")
+_VOWEL_LETTERS = re.compile(r"[aeiou]")
+
+
+def transliterate(word: str) -> str:
+    """
+    Romanize one Devanagari word (कुर्ता -> kurta, मटका -> matkaa)
+
+    Each consonant carries an implicit "a" unless a vowel sign or virama
+    follows. Like spoken Hindi, that "a" is dropped at the end of the word
+    and between two syllables that have their own vowel.
+    """
+    # [letter, romanized consonant, vowel] per syllable; vowel None means the implicit "a"
+    syllables: List[List[Optional[str]]] = []
+    for char in unicodedata.normalize("NFD", word):
+        if char in _CONSONANTS:
+            syllables.append([char, _CONSONANTS[char], None])
+        elif char == _NUKTA and syllables:
+            syllables[-1][1] = _NUKTA_CONSONANTS.get(syllables[-1][0], syllables[-1][1])
+        elif char in _MATRAS and syllables:
+            syllables[-1][2] = _MATRAS[char]
+        elif char == _VIRAMA and syllables:
+            syllables[-1][2] = ""
+        elif char in _VOWELS:
+            syllables.append([char, "", _VOWELS[char]])
+        elif char in _NASALS and syllables:
+            vowel = syllables[-1][2]
+            syllables[-1][2] = (vowel if vowel is not None else "a") + _NASALS[char]
+
+    # Schwa deletion: word-final, and medial between two syllables that keep a vowel
+    if syllables and syllables[-1][2] is None:
+        syllables[-1][2] = ""
+    for i in range(1, len(syllables) - 1):
+        if syllables[i][2] is None and syllables[i - 1][2] != "" and syllables[i + 1][2] != "":
+            syllables[i][2] = ""
+    return "".join(consonant + ("a" if vowel is None else vowel) for _, consonant, vowel in syllables)
+
+
+@lru_cache(maxsize=100_000)
+def fold_term(token: str) -> str:
+    """One spelling for a word however it is typed: Devanagari or Roman, long or short vowels"""
+    if token and "\u0900" <= token[0] <= "\u097f":
+        token = transliterate(token)
+    else:
+        token = _stem(token)
+    for old, new in _LATIN_FOLDS:
+        token = token.replace(old, new)
+    return _REPEATS.sub(r"\1", token)
+
+
+def phonetic_key(term: str) -> str:
+    """
+    Consonant skeleton of a folded term (chunri / chunari -> cnr)
+
+    Catches the vowel and aspiration differences folding cannot
+    (madhubani / madubani). Keys shorter than 3 letters match too much
+    and are returned empty.
+    """
+    if not term:
+        return ""
+    skeleton = term[0] + _VOWEL_LETTERS.sub("", term[1:]).replace("h", "")
+    skeleton = _REPEATS.sub(r"\1", skeleton)
+    return skeleton if len(skeleton) >= 3 else ""
+
+
+def search_terms(text: str) -> List[str]:
+    """Folded search terms of a text, English, Hindi and Hinglish stopwords dropped"""
+    return [
+        fold_term(token) for token in _TOKEN.findall(text.lower())
+        if token not in STOPWORDS and token not in HINDI_STOPWORDS
+    ]
+
+
+# ============================================
+# INCREMENTAL FIELDED SEARCH INDEX
+# ============================================
+
+# Query weight of matches that are not the exact term
+PHONETIC_WEIGHT = 0.5
+PREFIX_WEIGHT = 0.7
+
+
+class _Postings:
+    """Documents and weighted term frequencies of one term, appended as Python lists, scored as arrays"""
+
+    __slots__ = ("docs", "tfs", "_arrays")
+
+    def __init__(self):
+        self.docs: List[int] = []
+        self.tfs: List[float] = []
+        self._arrays = None
+
+    def __len__(self) -> int:
+        return len(self.docs)
+
+    def append(self, doc: int, tf: float) -> None:
+        self.docs.append(doc)
+        self.tfs.append(tf)
+        self._arrays = None
+
+    def arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        if self._arrays is None:
+            self._arrays = (np.array(self.docs, dtype=np.int64), np.array(self.tfs, dtype=np.float64))
+        return self._arrays
+
+
+class SearchIndex:
+    """
+    BM25 over weighted fields, updated one document at a time
+
+    - Field weights scale term frequencies (a word in the product name
+      counts more than one in its description)
+    - IDF and length normalisation are computed at query time from running
+      totals, so add() never needs a rebuild
+    - Each query term matches its folded form, its phonetic key and, for
+      the last term while typing, every indexed term it is a prefix of
+    - Scoring runs on NumPy arrays over each postings list; a list is
+      converted again only after a document containing the term is added
+
+    Usage:
+        index = SearchIndex({"product_name": 3.0, "description": 1.0})
+        index.add(("product", "65a1..."), {"product_name": "Matka", "description": "..."}, group=1)
+        index.search("matk", k=10)  # [(("product", "65a1..."), 2.3)]
+    """
+
+    def __init__(self, fields: Dict[str, float], k1: float = 1.2, b: float = 0.75, max_expansions: int = 30):
+        """
+        :param fields: Field name -> weight; other fields are ignored
+        :param max_expansions: Most indexed terms one prefix expands to (most frequent first)
+        """
+        self.fields = fields
+        self.k1 = k1
+        self.b = b
+        self.max_expansions = max_expansions
+
+        self._doc_ids: List[Hashable] = []
+        self._doc_numbers: Dict[Hashable, int] = {}
+        self._doc_lengths: List[float] = []
+        self._groups: List[int] = []
+        self._total_length = 0.0
+        self._postings: Dict[str, _Postings] = defaultdict(_Postings)  # term -> postings
+        self._phonetic: Dict[str, _Postings] = defaultdict(_Postings)  # phonetic key -> postings
+        self._phonetic_terms: Dict[str, set] = defaultdict(set)  # phonetic key -> terms sharing it
+        self._terms: List[str] = []  # Sorted, for prefix lookups
+        self._arrays = None  # (lengths, groups) as arrays, refreshed after adds
+
+    def __len__(self) -> int:
+        return len(self._doc_ids)
+
+    def __contains__(self, doc_id: Hashable) -> bool:
+        return doc_id in self._doc_numbers
+
+    def add(self, doc_id: Hashable, document: Dict[str, str], group: int = 0) -> bool:
+        """
+        Index a document once; returns False if doc_id is already indexed
+
+        :param group: Small integer searches can be restricted to (e.g. creators vs products)
+        """
+        if doc_id in self._doc_numbers:
+            return False
+        doc = len(self._doc_ids)
+        self._doc_ids.append(doc_id)
+        self._doc_numbers[doc_id] = doc
+        self._groups.append(group)
+
+        weighted: Dict[str, float] = defaultdict(float)
+        for field, weight in self.fields.items():
+            for term in search_terms(document.get(field) or ""):
+                weighted[term] += weight
+        length = sum(weighted.values())
+        self._doc_lengths.append(length)
+        self._total_length += length
+        self._arrays = None
+
+        phonetic: Dict[str, float] = defaultdict(float)
+        for term, tf in weighted.items():
+            postings = self._postings[term]
+            if not postings:
+                bisect.insort(self._terms, term)
+            postings.append(doc, tf)
+            key = phonetic_key(term)
+            if key:
+                phonetic[key] += tf
+                self._phonetic_terms[key].add(term)
+        for key, tf in phonetic.items():
+            self._phonetic[key].append(doc, tf)
+        return True
+
+    def _expand(self, prefix: str) -> List[str]:
+        """Indexed terms starting with prefix, most frequent first"""
+        start = bisect.bisect_left(self._terms, prefix)
+        end = bisect.bisect_left(self._terms, prefix + "\uffff", lo=start)
+        if end - start <= self.max_expansions:
+            return self._terms[start:end]
+        return heapq.nlargest(self.max_expansions, self._terms[start:end], key=lambda term: len(self._postings[term]))
+
+    def _matches(self, term: str, prefix: bool) -> List[Tuple[_Postings, float]]:
+        """Postings lists a query term matches, with their query weights"""
+        lists = []
+        if term in self._postings:
+            lists.append((self._postings[term], 1.0))
+        key = phonetic_key(term)
+        # Skip the phonetic list when it holds nothing but the exact term
+        if key in self._phonetic and self._phonetic_terms[key] != {term}:
+            lists.append((self._phonetic[key], PHONETIC_WEIGHT))
+        if prefix and len(term) >= 2:
+            lists.extend((self._postings[other], PREFIX_WEIGHT) for other in self._expand(term) if other != term)
+        return lists
+
+    def search(
+        self,
+        query: str,
+        k: int = 20,
+        prefix: bool = True,
+        group: Optional[int] = None
+    ) -> List[Tuple[Hashable, float]]:
+        """
+        Top-k documents for a query
+
+        :param prefix: Treat the last query word as unfinished (type-ahead)
+        :param group: Only documents added with this group
+        :returns: [(doc_id, score)], best first
+        """
+        terms = search_terms(query)
+        count = len(self._doc_ids)
+        if not terms or not count:
+            return []
+
+        if self._arrays is None:
+            self._arrays = (np.array(self._doc_lengths), np.array(self._groups, dtype=np.int16))
+        lengths, groups = self._arrays
+        k1, b = self.k1, self.b
+        norms = k1 * (1 - b + b * lengths / (self._total_length / count or 1.0))
+        scores = np.zeros(count)
+
+        for position, term in enumerate(terms):
+            # A document scores once per query term, by its best matching form
+            best = np.zeros(count)
+            for postings, weight in self._matches(term, prefix and position == len(terms) - 1):
+                docs, tfs = postings.arrays()
+                df = len(docs)
+                term_weight = weight * math.log(1 + (count - df + 0.5) / (df + 0.5)) * (k1 + 1)
+                best[docs] = np.maximum(best[docs], term_weight * tfs / (tfs + norms[docs]))
+            scores += best
+
+        if group is not None:
+            scores[groups != group] = 0.0
+        candidates = np.flatnonzero(scores)
+        if len(candidates) > k:
+            candidates = candidates[np.argpartition(scores[candidates], -k)[-k:]]
+        candidates = candidates[np.argsort(-scores[candidates], kind="stable")]
+        return [(self._doc_ids[doc], float(scores[doc])) for doc in candidates]
+
+    def stats(self) -> Dict:
+        count = len(self._doc_ids)
+        return {
+            "documents": count,
+            "terms": len(self._postings),
+            "phonetic_keys": len(self._phonetic),
+            "avg_length": round(self._total_length / count, 1) if count else 0.0
+        }
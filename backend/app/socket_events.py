@@ -1,6 +1,9 @@
 
 import socketio
 from typing import Dict, List
+from fastapi import HTTPException
+from pydantic import ValidationError
+from app.services.admission import LLMOverloadedError
 
 # Create Socket.IO server
 # async_mode='asgi' is compatible with FastAPI
@@ -86,3 +89,100 @@ async def share_location(sid, data):
             'location': location,
             'timestamp': data.get('timestamp')
         })
+
+def _get_chat_streamers():
+    """
+    Map bot name -> (request model, event builder)
+    
+    Imported lazily because the route modules import this module for `sio`.
+    """
+    from app.models.schemas import PeriodChatRequest, PregnancyChatRequest
+    from app.routes.health_bots import period_chat_events, pregnancy_chat_events
+    from app.routes.krishi_bot import KrishiBotRequest, krishi_chat_events
+    
+    return {
+        'period': (PeriodChatRequest, period_chat_events),
+        'pregnancy': (PregnancyChatRequest, pregnancy_chat_events),
+        'krishi': (KrishiBotRequest, krishi_chat_events),
+    }
+
+@sio.event
+async def chat_stream(sid, data):
+    """
+    Stream a health/Krishi bot answer back to the requesting socket
+    
+    Expects {'bot': 'period'|'pregnancy'|'krishi', 'requestId': ..., 'payload': {...}}
+    where payload matches the HTTP request body for that bot. Emits
+    'chat_meta' first, then 'chat_chunk' events, then 'chat_done'.
+    Failures are reported with 'chat_error'.
+    """
+    request_id = data.get('requestId')
+    streamers = _get_chat_streamers()
+    bot = data.get('bot')
+    
+    if bot not in streamers:
+        await sio.emit('chat_error', {'requestId': request_id, 'error': f"Unknown bot: {bot}"}, to=sid)
+        return
+    
+    request_model, build_events = streamers[bot]
+    
+    try:
+        events = build_events(request_model(**(data.get('payload') or {})))
+    except ValidationError as e:
+        await sio.emit('chat_error', {'requestId': request_id, 'error': str(e)}, to=sid)
+        return
+    except HTTPException as e:
+        await sio.emit('chat_error', {'requestId': request_id, 'error': e.detail}, to=sid)
+        return
+    except LLMOverloadedError as e:
+        await sio.emit('chat_error', {
+            'requestId': request_id,
+            'error': e.reason,
+            'status': 'overloaded',
+            'retryAfter': e.retry_after
+        }, to=sid)
+        return
+    
+    async for event, payload in events:
+        await sio.emit(f'chat_{event}', {'requestId': request_id, **payload}, to=sid)
+
+@sio.event
+async def watch_job(sid, data):
+    """
+    Get a background job's result on this socket (see routes/jobs.py)
+    
+    Expects {'jobId': ..., 'token': <JWT>}; the token is needed for jobs
+    submitted by a signed-in user. Joins the job's room so 'job_done'
+    arrives when it finishes; if it already has, 'job_done' is sent straight
+    away, so a client that reconnects just watches the job again.
+    """
+    from app.routes.auth import user_id_from_token
+    from app.routes.jobs import job_event, job_queue
+    
+    job_id = data.get('jobId')
+    user_id = user_id_from_token(data.get('token') or '')
+    job = job_queue.get(job_id, user_id) if job_id else None
+    if job is None:
+        await sio.emit('job_error', {'jobId': job_id, 'error': 'Job not found or expired'}, to=sid)
+        return
+    
+    await sio.enter_room(sid, f"job:{job_id}")
+    if job.finished:
+        await sio.emit('job_done', job_event(job), to=sid)
+
+@sio.event
+async def watch_jobs(sid, data):
+    """
+    Get every background job of the signed-in user on this socket
+    
+    Expects {'token': <JWT>}. Joins the user's room, where 'job_done' is
+    sent for each job submitted with that token.
+    """
+    from app.routes.auth import user_id_from_token
+    
+    user_id = user_id_from_token(data.get('token') or '')
+    if user_id is None:
+        await sio.emit('job_error', {'error': 'Could not validate credentials'}, to=sid)
+        return
+    
+    await sio.enter_room(sid, f"user:{user_id}")
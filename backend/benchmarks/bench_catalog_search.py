@@ -0,0 +1,121 @@
+"""
+Benchmark - catalog search at 100k documents
+
+Builds the catalog search index over synthetic creators and products
+written in English, Hinglish and Devanagari Hindi, then times:
+
+- loading the index (one add() per document, as at worker startup)
+- adding one document (what a create-profile / add-product costs)
+- queries: exact words, Hinglish spelling variants, Devanagari, and
+  type-ahead prefixes of 2-4 letters
+- the same queries as a substring scan over every document, roughly what
+  an unindexed $regex query does, for comparison
+
+Usage:
+    python benchmarks/bench_catalog_search.py [--docs 100000] [--queries 2000]
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+
+# Add the backend directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.catalog_search import CREATOR, GROUPS, PRODUCT, new_index
+
+ITEMS = [
+    "clay pot", "matka", "मटका", "kulhad", "terracotta lamp", "diya", "दीया",
+    "kurta", "कुर्ता", "saree", "साड़ी", "dupatta", "chunri", "chunari", "dupatta with gota",
+    "madhubani painting", "मधुबनी पेंटिंग", "warli art", "bamboo basket", "टोकरी", "jute bag",
+    "achaar", "अचार", "papad", "पापड़", "honey", "shahad", "pickle", "embroidered cushion",
+]
+SKILLS = ["Tailoring", "Art", "Handicrafts", "Cooking", "Pottery", "Weaving", "सिलाई", "कढ़ाई", "zari embroidery"]
+VILLAGES = ["Rampur", "Sitapur", "Kishanpur", "Bilaspur", "Durgpur", "Sonapur", "रामपुर", "सीतापुर"] + \
+    [f"Gaon{i}" for i in range(300)]
+FILLER = (
+    "handmade by women of the village with natural material traditional design "
+    "haath se bana hua gaon ki mahilaon dwara paramparik design "
+    "हाथ से बना हुआ गाँव की महिलाओं द्वारा पारंपरिक डिज़ाइन"
+).split()
+
+QUERIES = {
+    "exact": ["clay pot", "madhubani painting", "bamboo basket", "jute bag", "Rampur tailoring"],
+    "hinglish": ["sari", "achar", "madubani", "chunri", "matkaa", "mitti ka matka"],
+    "devanagari": ["मटका", "साड़ी", "अचार", "कढ़ाई", "रामपुर"],
+    "prefix": ["ma", "mad", "madh", "sa", "sar", "emb", "kur", "ach"],
+}
+
+
+def synthetic_catalog(docs: int, seed: int = 17):
+    rng = random.Random(seed)
+    for i in range(docs):
+        if i % 4 == 0:
+            yield (CREATOR, i), {
+                "name": f"Sakhi {i}",
+                "village": rng.choice(VILLAGES),
+                "skill_category": rng.choice(SKILLS),
+                "experience": " ".join(rng.choices(FILLER + ITEMS, k=rng.randint(20, 120)))
+            }
+        else:
+            item = rng.choice(ITEMS)
+            yield (PRODUCT, i), {
+                "product_name": f"{item} {rng.choice(['set', 'small', 'large', 'classic', ''])}".strip(),
+                "category": rng.choice(SKILLS),
+                "description": " ".join(rng.choices(FILLER + ITEMS, k=rng.randint(10, 60)))
+            }
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def run(docs: int, queries: int):
+    catalog = list(synthetic_catalog(docs))
+
+    index = new_index()
+    start = time.perf_counter()
+    for doc_id, document in catalog:
+        index.add(doc_id, document, GROUPS[doc_id[0]])
+    build_s = time.perf_counter() - start
+    print(f"{docs} documents: load {build_s:.1f}s ({build_s / docs * 1e6:.0f} us/doc), {index.stats()}")
+
+    extra = list(synthetic_catalog(1000, seed=99))
+    start = time.perf_counter()
+    for (kind, i), document in extra:
+        index.add((kind, docs + i), document, GROUPS[kind])
+    print(f"add one document: {(time.perf_counter() - start) / len(extra) * 1e6:.0f} us")
+
+    texts = [" ".join(document.values()).lower() for _, document in catalog]
+    rng = random.Random(5)
+    for label, samples in QUERIES.items():
+        latencies = []
+        for _ in range(queries // len(QUERIES)):
+            query = rng.choice(samples)
+            start = time.perf_counter()
+            index.search(query, k=20)
+            latencies.append((time.perf_counter() - start) * 1000)
+
+        scan = []
+        for query in samples:
+            start = time.perf_counter()
+            words = query.lower().split()
+            [i for i, text in enumerate(texts) if all(word in text for word in words)]
+            scan.append((time.perf_counter() - start) * 1000)
+
+        print(f"{label:>10}: p50 {percentile(latencies, 50):6.2f} ms  p99 {percentile(latencies, 99):6.2f} ms   "
+              f"substring scan {sum(scan) / len(scan):7.1f} ms")
+
+    sample = rng.choice(QUERIES["hinglish"])
+    print(f"e.g. {sample!r}: {index.search(sample, k=3)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--docs", type=int, default=100000)
+    parser.add_argument("--queries", type=int, default=2000)
+    args = parser.parse_args()
+    run(args.docs, args.queries)
@@ -0,0 +1,85 @@
+"""
+Benchmark - cycle statistics: incremental updates and bulk recompute
+
+Generates synthetic period histories, then times:
+- one O(1) CycleStats.add() per new period (the request path)
+- rebuilding every user's statistics by replaying histories in Python
+- rebuilding them with the NumPy batch (recompute_batch, the nightly job)
+
+and checks both rebuilds agree.
+
+Usage:
+    python benchmarks/bench_cycle_stats.py [--users 100000] [--cycles 24]
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+from datetime import date, timedelta
+
+# Add the backend directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.cycle_stats import CycleStats, cycle_lengths, predict_cycles, recompute_batch
+
+
+def synthetic_histories(users: int, max_cycles: int, seed: int = 11):
+    rng = random.Random(seed)
+    histories = []
+    for _ in range(users):
+        mean, spread, drift = rng.gauss(29, 2.5), rng.uniform(1, 4), rng.uniform(-0.2, 0.2)
+        start = date(2024, 1, 1) + timedelta(days=rng.randint(0, 30))
+        starts = [start]
+        for k in range(rng.randint(1, max_cycles)):
+            # Occasional missed log doubles a cycle, which the stats must skip
+            length = mean + drift * k + rng.gauss(0, spread)
+            if rng.random() < 0.03:
+                length *= 2
+            start = start + timedelta(days=max(1, round(length)))
+            starts.append(start)
+        histories.append(starts)
+    return histories
+
+
+def run(users: int, cycles: int):
+    histories = synthetic_histories(users, cycles)
+    total_cycles = sum(len(starts) - 1 for starts in histories)
+    print(f"{users} users, {total_cycles} cycles")
+
+    stats = CycleStats()
+    start = time.perf_counter()
+    for length in range(100000):
+        stats.add(26 + length % 6)
+    print(f"incremental add: {(time.perf_counter() - start) / 100000 * 1e6:.2f} us per period")
+
+    start = time.perf_counter()
+    replayed = [CycleStats.from_lengths(cycle_lengths(starts)) for starts in histories]
+    replay_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batched = recompute_batch(histories)
+    batch_s = time.perf_counter() - start
+    print(f"rebuild all: python replay {replay_s * 1000:.0f} ms, numpy batch {batch_s * 1000:.0f} ms "
+          f"({replay_s / batch_s:.1f}x)")
+
+    mismatches = sum(
+        1 for a, b in zip(replayed, batched)
+        if a.n != b.n or abs(a.mean - b.mean) > 1e-6 or abs(a.m2 - b.m2) > 1e-4 or abs(a.trend - b.trend) > 1e-6
+    )
+    print(f"mismatches between replay and batch: {mismatches}")
+
+    start = time.perf_counter()
+    for starts, user_stats in zip(histories[:10000], batched):
+        predict_cycles(user_stats, starts[-1], cycles=3)
+    count = min(users, 10000)
+    print(f"predict 3 cycles: {(time.perf_counter() - start) / count * 1e6:.1f} us per user")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=100000)
+    parser.add_argument("--cycles", type=int, default=24)
+    args = parser.parse_args()
+    run(args.users, args.cycles)
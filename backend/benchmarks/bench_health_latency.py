@@ -0,0 +1,108 @@
+"""
+Benchmark - /health latency while chat requests are in flight
+
+Fires a burst of period-chat requests against a slow stub provider and
+keeps polling /health at the same time. With a non-blocking AI service the
+/health p99 should stay in the low milliseconds no matter how slow the
+model is.
+
+Usage:
+    python benchmarks/bench_health_latency.py [--chats 50] [--model-delay 2.0] [--blocking] [--workers N]
+
+--blocking makes the stub sleep synchronously, reproducing the old
+behaviour of calling a sync client from async handlers.
+--workers N runs the stub in N worker processes (LLM_PROVIDER=workers)
+and prints the pool's counters; chats beyond the pool's capacity get 503.
+"""
+
+import os
+import sys
+import time
+import asyncio
+import argparse
+
+# Add the backend directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+from app.main import fastapi_app
+from app.middleware.rate_limiter import api_limiter
+from app.services.llm_provider import StubProvider, set_provider
+from app.services.llm_worker_pool import WorkerPoolProvider
+
+
+class BlockingStubProvider(StubProvider):
+    """Stub that sleeps synchronously, like a sync client called from async code"""
+
+    async def generate(self, prompt, config):
+        time.sleep(self.latency_ms / 1000)
+        return "Stub answer from the blocking model."
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def run(chats: int, model_delay: float, blocking: bool, workers: int):
+    if workers:
+        # Worker processes build their stub from the environment
+        os.environ["STUB_LATENCY_DISTRIBUTION"] = "fixed"
+        os.environ["STUB_LATENCY_MS"] = str(model_delay * 1000)
+        provider = WorkerPoolProvider("stub", processes=workers)
+    else:
+        provider_class = BlockingStubProvider if blocking else StubProvider
+        provider = provider_class(latency_ms=model_delay * 1000)
+    set_provider(provider)
+    fastapi_app.dependency_overrides[api_limiter] = lambda: None
+
+    transport = httpx.ASGITransport(app=fastapi_app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        # Distinct messages and no cache, so every request reaches the model
+        chat_tasks = [
+            asyncio.create_task(client.post("/api/health-bots/period-chat", json={
+                "age": 25,
+                "last_period_date": "2026-01-10",
+                "user_message": f"I have severe cramps. What can I do? ({i})",
+                "use_cache": False
+            }))
+            for i in range(chats)
+        ]
+
+        # Let the chat requests reach the model before probing
+        await asyncio.sleep(0.05)
+
+        health_latencies = []
+        while not all(task.done() for task in chat_tasks):
+            start = time.perf_counter()
+            response = await client.get("/health")
+            health_latencies.append((time.perf_counter() - start) * 1000)
+            assert response.status_code == 200
+            await asyncio.sleep(0.01)
+
+        results = await asyncio.gather(*chat_tasks)
+
+    ok = sum(1 for r in results if r.status_code == 200)
+    shed = sum(1 for r in results if r.status_code == 503)
+    print(f"Chat requests: {chats} ({ok} OK, {shed} shed), model delay {model_delay}s, blocking={blocking}, workers={workers}")
+    if workers:
+        print(f"Worker pool: {provider.stats()}")
+        provider.close()
+    if not health_latencies:
+        print("/health was never answered while chats were in flight (event loop blocked)")
+        return
+    print(f"/health samples: {len(health_latencies)}")
+    print(f"/health p50: {percentile(health_latencies, 50):.2f} ms")
+    print(f"/health p99: {percentile(health_latencies, 99):.2f} ms")
+    print(f"/health max: {max(health_latencies):.2f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--chats", type=int, default=50)
+    parser.add_argument("--model-delay", type=float, default=2.0)
+    parser.add_argument("--blocking", action="store_true")
+    parser.add_argument("--workers", type=int, default=0)
+    args = parser.parse_args()
+    asyncio.run(run(args.chats, args.model_delay, args.blocking, args.workers))
@@ -0,0 +1,89 @@
+"""
+Benchmark - Krishi knowledge index build and query latency
+
+Builds the BM25 index over the real knowledge base and over a synthetic
+corpus scaled up from it, then times queries and reports the size of the
+generated Krishi Bot prompts.
+
+Usage:
+    python benchmarks/bench_krishi_retrieval.py [--scale 10000] [--queries 2000]
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+
+# Add the backend directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.prompts.krishi_bot_prompt import get_krishi_prompt
+from app.prompts.krishi_knowledge_base import KRISHI_PASSAGES
+from app.services.conversation_store import estimate_tokens
+from app.services.text_index import build_index
+
+QUERIES = [
+    ("My tomato plants have yellow leaves", {"crops": "tomato"}),
+    ("what should I spray for insects?", {"crops": "mustard", "location": "Rajasthan", "season": "rabi"}),
+    ("How do I get a loan for seeds?", {"crops": "paddy"}),
+    ("maize me keede lag gaye", {"crops": "maize"}),
+    ("when to sow wheat", {"location": "Punjab"}),
+    ("how to save water", {"crops": "sugarcane", "location": "Maharashtra"}),
+    ("best crop for 1 acre", {}),
+    ("white powder on gourd leaves", {"season": "zaid"}),
+]
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def synthetic_corpus(size: int, seed: int = 3):
+    """Passages recombined from real sentences, so term statistics stay realistic"""
+    rng = random.Random(seed)
+    sentences = [s.strip() for p in KRISHI_PASSAGES for s in p["text"].split(". ") if s.strip()]
+    tags = [p["tags"] for p in KRISHI_PASSAGES]
+    return [
+        (f"doc-{i}", f"{rng.choice(tags)} " + ". ".join(rng.sample(sentences, 4)))
+        for i in range(size)
+    ]
+
+
+def time_queries(index, count: int):
+    latencies = []
+    for i in range(count):
+        message, info = QUERIES[i % len(QUERIES)]
+        boosts = {value: 2.0 for value in info.values()}
+        start = time.perf_counter()
+        index.search(message, k=4, boosts=boosts)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def run(scale: int, queries: int):
+    for name, documents in [
+        ("knowledge base", [(p["id"], f"{p['title']} {p['tags']} {p['text']}") for p in KRISHI_PASSAGES]),
+        (f"synthetic x{scale}", synthetic_corpus(scale)),
+    ]:
+        start = time.perf_counter()
+        index = build_index(documents)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        latencies = time_queries(index, queries)
+        stats = index.stats()
+        print(f"{name}: {stats['documents']} docs, {stats['terms']} terms, build {build_ms:.1f} ms")
+        print(f"  query p50 {percentile(latencies, 50) * 1000:.0f} us, p99 {percentile(latencies, 99) * 1000:.0f} us")
+
+    prompts = [get_krishi_prompt(info, message) for message, info in QUERIES]
+    sizes = [estimate_tokens(prompt) for prompt in prompts]
+    print(f"Krishi prompt size: avg {sum(sizes) / len(sizes):.0f} tokens, max {max(sizes)} tokens")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=int, default=10000)
+    parser.add_argument("--queries", type=int, default=2000)
+    args = parser.parse_args()
+    run(args.scale, args.queries)
@@ -0,0 +1,127 @@
+"""
+Benchmark - marketplace list payloads: full documents vs summary projections
+
+Builds a page of synthetic creators and products as MongoDB returns them
+and times turning that page into a response body two ways:
+
+- full:    whole documents, a Python loop stringifying _id / created_at,
+           then FastAPI's response_model validation + jsonable_encoder
+           (the old list endpoints)
+- summary: card fields only, as the CREATOR_SUMMARY / PRODUCT_SUMMARY
+           projections return them, encoded in one json.dumps
+           (services/serialization.py)
+
+and prints body bytes and CPU time per page. Runs without MongoDB, so
+the time the database spends reading the dropped fields is not included.
+
+Usage:
+    python benchmarks/bench_list_payload.py [--page 100] [--rounds 500]
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+from datetime import datetime, timedelta
+from typing import List
+
+# Add the backend directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bson import ObjectId
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+from app.routes.skill_hub import CREATOR_SUMMARY, EXPERIENCE_PREVIEW_CHARS, PRODUCT_SUMMARY
+from app.services.serialization import json_response
+
+WORDS = "I have been making traditional pottery and decorative clay items for ten years in my village".split()
+
+
+def creator(rng: random.Random, i: int) -> dict:
+    return {
+        "_id": ObjectId(),
+        "name": f"Creator {i}",
+        "village": f"Village {i % 300}",
+        "skill_category": rng.choice(["Tailoring", "Art", "Handicrafts", "Cooking"]),
+        "experience": " ".join(rng.choice(WORDS) for _ in range(170))[:1000],
+        "work_samples": [f"https://example.com/samples/{i}/{k}.jpg" for k in range(rng.randint(2, 8))],
+        "contact_number": "+91-9876543210",
+        "email": f"creator{i}@example.com",
+        "created_at": datetime(2026, 1, 1) + timedelta(minutes=i)
+    }
+
+
+def product(rng: random.Random, i: int) -> dict:
+    return {
+        "_id": ObjectId(),
+        "product_name": f"Handmade item {i}",
+        "creator_name": f"Creator {i % 500}",
+        "price": round(rng.uniform(50, 5000), 2),
+        "description": " ".join(rng.choice(WORDS) for _ in range(85))[:500],
+        "image_url": f"https://example.com/products/{i}.jpg",
+        "category": rng.choice(["Handicrafts", "Clothing", "Art"]),
+        "available": True,
+        "created_at": datetime(2026, 1, 1) + timedelta(minutes=i)
+    }
+
+
+def project(document: dict, projection: dict) -> dict:
+    """What MongoDB returns for a summary projection"""
+    summary = {"_id": document["_id"]}
+    for field in projection:
+        if field == "experience_preview":
+            summary[field] = document["experience"][:EXPERIENCE_PREVIEW_CHARS]
+        elif field == "work_samples":
+            summary[field] = document[field][:1]
+        else:
+            summary[field] = document[field]
+    return summary
+
+
+LIST_OF_DICTS = TypeAdapter(List[dict])
+
+
+def full_body(documents: List[dict]) -> bytes:
+    page = []
+    for document in documents:
+        document = dict(document)
+        document["_id"] = str(document["_id"])
+        document["created_at"] = document["created_at"].isoformat()
+        page.append(document)
+    content = jsonable_encoder({"items": LIST_OF_DICTS.validate_python(page), "next_cursor": "x"})
+    return JSONResponse(content).body
+
+
+def summary_body(documents: List[dict]) -> bytes:
+    return json_response({"items": documents, "next_cursor": "x"}).body
+
+
+def time_per_call(fn, documents, rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn(documents)
+    return (time.perf_counter() - start) / rounds * 1000
+
+
+def run(page: int, rounds: int):
+    rng = random.Random(3)
+    for label, make, projection in [("creators", creator, CREATOR_SUMMARY), ("products", product, PRODUCT_SUMMARY)]:
+        documents = [make(rng, i) for i in range(page)]
+        summaries = [project(document, projection) for document in documents]
+
+        full_bytes, summary_bytes = len(full_body(documents)), len(summary_body(summaries))
+        full_ms = time_per_call(full_body, documents, rounds)
+        summary_ms = time_per_call(summary_body, summaries, rounds)
+        print(f"{label:>8} x{page}: full {full_bytes / 1024:7.1f} KiB {full_ms:6.2f} ms   "
+              f"summary {summary_bytes / 1024:7.1f} KiB {summary_ms:6.2f} ms   "
+              f"({full_bytes / summary_bytes:.1f}x smaller, {full_ms / summary_ms:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--page", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=500)
+    args = parser.parse_args()
+    run(args.page, args.rounds)
@@ -0,0 +1,139 @@
+"""
+Benchmark - sync vs async MongoDB access from async handlers
+
+Seeds a throwaway database with products, then runs the same "list a
+category" request many times concurrently two ways:
+
+- sync:  pymongo.MongoClient called straight from the coroutine (the old
+         routes) - every query blocks the event loop
+- async: pymongo.AsyncMongoClient awaited (app.services.database)
+
+and reports throughput, request latency and the worst event-loop lag seen
+by a ticker running alongside. Needs a running MongoDB; the bench database
+is dropped at the end.
+
+Usage:
+    python benchmarks/bench_mongo_async.py [--url mongodb://localhost:27017] [--docs 20000]
+                                           [--requests 2000] [--concurrency 50]
+"""
+
+import os
+import sys
+import time
+import random
+import asyncio
+import argparse
+
+# Add the backend directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pymongo import AsyncMongoClient, MongoClient
+from app.services.database import client_options
+
+CATEGORIES = ["Handicrafts", "Clothing", "Art", "Food", "Jewellery", "Home Decor"]
+PAGE_SIZE = 20
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def seed(url: str, name: str, docs: int) -> None:
+    rng = random.Random(5)
+    client = MongoClient(url)
+    products = client[name].products
+    products.drop()
+    products.insert_many([
+        {
+            "product_name": f"Product {i}",
+            "creator_name": f"Creator {i % 500}",
+            "price": round(rng.uniform(50, 5000), 2),
+            "description": "Handmade " * rng.randint(5, 40),
+            "category": rng.choice(CATEGORIES),
+            "available": True
+        }
+        for i in range(docs)
+    ])
+    products.create_index("category")
+    client.close()
+
+
+async def measure_lag(stop: asyncio.Event, interval: float = 0.005) -> float:
+    """Worst delay between when a tick was due and when it ran"""
+    worst = 0.0
+    while not stop.is_set():
+        due = time.perf_counter() + interval
+        await asyncio.sleep(interval)
+        worst = max(worst, time.perf_counter() - due)
+    return worst
+
+
+async def run_mode(mode: str, url: str, name: str, requests: int, concurrency: int) -> None:
+    if mode == "sync":
+        client = MongoClient(url, **client_options())
+        products = client[name].products
+
+        async def handler(category):
+            # What the old routes did: a blocking call inside a coroutine
+            return list(products.find({"category": category}).limit(PAGE_SIZE))
+    else:
+        client = AsyncMongoClient(url, **client_options())
+        products = client[name].products
+
+        async def handler(category):
+            return await products.find({"category": category}).limit(PAGE_SIZE).to_list(None)
+
+    # Warm up the pool
+    await handler(CATEGORIES[0])
+
+    slots = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def request(i):
+        async with slots:
+            start = time.perf_counter()
+            await handler(CATEGORIES[i % len(CATEGORIES)])
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    stop = asyncio.Event()
+    lag_task = asyncio.create_task(measure_lag(stop))
+    started = time.perf_counter()
+    await asyncio.gather(*(request(i) for i in range(requests)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    worst_lag = await lag_task
+
+    if mode == "sync":
+        client.close()
+    else:
+        await client.close()
+
+    print(f"{mode:>5}: {requests / elapsed:8.0f} req/s   "
+          f"p50 {percentile(latencies, 50):7.2f} ms   p99 {percentile(latencies, 99):7.2f} ms   "
+          f"max loop lag {worst_lag * 1000:7.2f} ms")
+
+
+async def main(args):
+    for mode in ("sync", "async"):
+        await run_mode(mode, args.url, args.db, args.requests, args.concurrency)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default="mongodb://localhost:27017")
+    parser.add_argument("--db", default="sakhi_bench")
+    parser.add_argument("--docs", type=int, default=20000)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+
+    seed(args.url, args.db, args.docs)
+    print(f"{args.docs} products, {args.requests} requests, concurrency {args.concurrency}")
+    try:
+        asyncio.run(main(args))
+    finally:
+        client = MongoClient(args.url)
+        client.drop_database(args.db)
+        client.close()
@@ -0,0 +1,34 @@
+"""
+Nightly refresh of every user's cycle statistics
+
+Rebuilds the running statistics stored with each cycle history from the
+full list of period starts, in NumPy batches. Run from cron, e.g.:
+
+    0 2 * * *  cd backend && python refresh_cycle_stats.py
+"""
+import sys
+import time
+import asyncio
+from app.config.settings import settings
+from app.services import database
+from app.services.cycle_history import CycleHistoryStore
+
+
+async def main() -> int:
+    print("🔄 Refreshing cycle statistics...")
+    started = time.perf_counter()
+    try:
+        db = await database.connect()
+        store = CycleHistoryStore(db.cycle_histories)
+        refreshed = await store.refresh_all(batch_size=settings.CYCLE_REFRESH_BATCH_SIZE)
+        print(f"✅ Refreshed {refreshed} users in {time.perf_counter() - started:.1f}s")
+        return 0
+    except Exception as e:
+        # Exit non-zero so cron and monitoring see the failure
+        print(f"❌ Refresh failed: {e}")
+        return 1
+    finally:
+        await database.close()
+
+
+sys.exit(asyncio.run(main()))
@@ -0,0 +1,78 @@
+import random
+from datetime import date, timedelta
+
+import pytest
+
+from app.services.cycle_stats import CycleStats, cycle_lengths, predict_cycles, recompute_batch
+
+
+def random_history(rng: random.Random, count: int):
+    """Sorted starts with mostly normal cycles and a few out-of-range gaps (missed or double logs)"""
+    start = date(2024, 1, 1) + timedelta(days=rng.randint(0, 300))
+    starts = [start]
+    for _ in range(count - 1):
+        gap = rng.choice([rng.randint(21, 35)] * 8 + [rng.randint(2, 14), rng.randint(61, 90)])
+        starts.append(starts[-1] + timedelta(days=gap))
+    return starts
+
+
+def test_recompute_batch_matches_incremental_add():
+    rng = random.Random(7)
+    histories = [random_history(rng, rng.randint(0, 25)) for _ in range(300)]
+    histories += [[], [date(2026, 1, 1)]]
+
+    for starts, batch in zip(histories, recompute_batch(histories)):
+        replayed = CycleStats.from_lengths(cycle_lengths(starts))
+        for field in CycleStats.FIELDS:
+            assert getattr(batch, field) == pytest.approx(getattr(replayed, field), abs=1e-9), field
+
+
+def test_recompute_batch_empty():
+    assert recompute_batch([]) == []
+
+
+def stats_for(lengths):
+    return CycleStats.from_lengths(lengths)
+
+
+def test_windows_widen_further_ahead():
+    stats = stats_for([27, 29, 28, 30, 26, 28])
+    last_start = date(2026, 10, 1)
+    windows = predict_cycles(stats, last_start, cycles=4, today=last_start)
+
+    assert [window["cycle"] for window in windows] == [1, 2, 3, 4]
+    widths = [(window["latest"] - window["earliest"]).days for window in windows]
+    assert widths == sorted(widths)
+    assert widths[0] < widths[-1]
+    for window in windows:
+        assert window["earliest"] <= window["expected_start"] <= window["latest"]
+
+
+def test_windows_narrow_with_more_history_and_confidence():
+    last_start = date(2026, 10, 1)
+
+    def first_width(stats, confidence=0.8):
+        window = predict_cycles(stats, last_start, cycles=1, confidence=confidence, today=last_start)[0]
+        return (window["latest"] - window["earliest"]).days
+
+    regular = stats_for([28] * 12)
+    assert first_width(regular) <= first_width(stats_for([28, 28]))
+    assert first_width(regular, confidence=0.6) <= first_width(regular, confidence=0.95)
+
+
+def test_predictions_start_after_today_for_old_history():
+    stats = stats_for([28, 28, 28, 28])
+    last_start = date(2026, 1, 5)
+    today = date(2026, 6, 20)
+    windows = predict_cycles(stats, last_start, cycles=3, today=today)
+
+    assert [window["cycle"] for window in windows] == [1, 2, 3]
+    assert windows[0]["latest"] >= today
+    starts = [window["expected_start"] for window in windows]
+    assert starts == sorted(starts)
+
+
+def test_no_history_uses_default_cycle_length():
+    last_start = date(2026, 10, 1)
+    window = predict_cycles(CycleStats(), last_start, cycles=1, today=last_start)[0]
+    assert 21 <= (window["expected_start"] - last_start).days <= 35
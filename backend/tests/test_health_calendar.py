@@ -0,0 +1,36 @@
+import pytest
+
+from app.services.health_calendar import cycle_phase, ovulation_day
+
+PHASES = ["Menstrual Phase", "Follicular Phase", "Ovulation Phase", "Luteal Phase"]
+
+
+@pytest.mark.parametrize("day, phase", [
+    (0, "Menstrual Phase"),
+    (4, "Menstrual Phase"),
+    (5, "Follicular Phase"),
+    (13, "Follicular Phase"),
+    (14, "Ovulation Phase"),
+    (15, "Ovulation Phase"),
+    (16, "Luteal Phase"),
+    (27, "Luteal Phase"),
+])
+def test_28_day_boundaries(day, phase):
+    assert cycle_phase(day) == phase
+    assert cycle_phase(day, 28) == phase
+
+
+@pytest.mark.parametrize("cycle_length", [21, 24, 28, 32, 35, 45])
+def test_phases_in_order(cycle_length):
+    phases = [cycle_phase(day, cycle_length) for day in range(cycle_length)]
+    order = [PHASES.index(phase) for phase in phases]
+    assert order == sorted(order)
+    assert phases.count("Ovulation Phase") == 2
+    assert phases.index("Ovulation Phase") == ovulation_day(cycle_length)
+
+
+def test_ovulation_follows_cycle_length():
+    assert ovulation_day(28) == 14
+    assert ovulation_day(35) == 21
+    # Never before the period ends
+    assert ovulation_day(15) == 5
@@ -0,0 +1,35 @@
+from datetime import datetime
+
+import pytest
+from bson import ObjectId
+
+from app.services.pagination import after_cursor, decode_cursor, encode_cursor
+
+
+def test_cursor_round_trip():
+    created_at = datetime(2026, 3, 14, 9, 26, 53, 589000)
+    oid = ObjectId()
+    cursor = encode_cursor(created_at, oid)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == (created_at, oid)
+
+
+@pytest.mark.parametrize("cursor", ["", "Zm9v", "not base64!", encode_cursor(datetime(2026, 1, 1), ObjectId()) + "x"])
+def test_invalid_cursor(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+
+
+def test_after_cursor():
+    created_at, oid = datetime(2026, 1, 1), ObjectId()
+    query = {"available": True}
+
+    assert after_cursor(query, None) is query
+    assert after_cursor(query, encode_cursor(created_at, oid)) == {
+        "available": True,
+        "$or": [
+            {"created_at": {"$lt": created_at}},
+            {"created_at": created_at, "_id": {"$lt": oid}}
+        ]
+    }
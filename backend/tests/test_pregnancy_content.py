@@ -0,0 +1,11 @@
+from app.services.pregnancy_content import render
+
+
+def test_size_sentence_omitted_before_conception():
+    text = render(1, ("development",))
+    assert "size of" not in text
+    assert "Week 1 is counted" in text
+
+
+def test_size_sentence_included_once_there_is_a_comparison():
+    assert "about the size of a poppy seed" in render(4, ("development",))
@@ -0,0 +1,57 @@
+import itertools
+
+from app.services.scheme_rules import (
+    COMPILED_SCHEMES, DOCUMENT_REMINDER, check_eligibility, evaluate, evaluate_batch, find_scheme, make_applicant
+)
+
+AGES = [5, 9, 10, 17, 18, 19, 40, 65, 66]
+INCOMES = [0, 100000, 100001, 799999, 800000]
+RESIDENCES = ["Rural", "urban"]
+CASTES = ["General", "SC", "st", "OBC"]
+
+APPLICANTS = [
+    make_applicant(age, income, residence, caste)
+    for age, income, residence, caste in itertools.product(AGES, INCOMES, RESIDENCES, CASTES)
+]
+
+
+def test_batch_matches_evaluate():
+    batch = evaluate_batch(APPLICANTS)
+    reasons = batch.reasons()
+
+    for row, applicant in enumerate(APPLICANTS):
+        for column, scheme_id in enumerate(batch.scheme_ids):
+            single = evaluate(scheme_id, applicant)
+            assert batch.eligible[row, column] == single.is_eligible, (scheme_id, applicant)
+            assert reasons[row][column] == single.reason, (scheme_id, applicant)
+
+
+def test_batch_subset_of_schemes():
+    batch = evaluate_batch(APPLICANTS[:3], ["ujjwala", "nrlm"])
+    assert batch.scheme_ids == ["ujjwala", "nrlm"]
+    assert batch.eligible.shape == (3, 2)
+
+
+def test_batch_without_applicants():
+    batch = evaluate_batch([])
+    assert batch.eligible.shape == (0, len(COMPILED_SCHEMES))
+    assert batch.reasons() == []
+
+
+def test_first_failing_rule_gives_the_reason():
+    result = evaluate("mahila_shakti_kendra", make_applicant(30, 50000, "Urban", "General"))
+    assert not result.is_eligible
+    assert result.reason == "Mahila Shakti Kendras serve rural women." + DOCUMENT_REMINDER
+
+
+def test_any_condition():
+    assert evaluate("ujjwala", make_applicant(30, 500000, "Rural", "SC")).is_eligible
+    assert evaluate("ujjwala", make_applicant(30, 90000, "Urban", "General")).is_eligible
+    assert not evaluate("ujjwala", make_applicant(30, 500000, "Rural", "General")).is_eligible
+
+
+def test_scheme_lookup():
+    assert find_scheme("Sukanya Samriddhi Yojana (SSY)") == "sukanya_samriddhi"
+    assert find_scheme("apply for stand-up india loan") == "stand_up_india"
+    assert find_scheme("Some Unknown Scheme") is None
+    assert check_eligibility("Some Unknown Scheme", 30, 50000) is None
@@ -6,6 +6,7 @@ import { getUserData, isAuthenticated } from '../utils/auth';
 
 const CommunityChat = () => {
     const [posts, setPosts] = useState([]);
+    const [nextCursor, setNextCursor] = useState(null);
     const [newPost, setNewPost] = useState("");
     const [user, setUser] = useState("Sakhi User");
 
@@ -36,13 +37,27 @@ const CommunityChat = () => {
 
     const fetchPosts = async () => {
         try {
-            const data = await getCommunityPosts();
-            setPosts(data);
+            const page = await getCommunityPosts();
+            setPosts(page.items);
+            setNextCursor(page.next_cursor);
         } catch (error) {
             console.error("Failed to fetch posts", error);
         }
     };
 
+    const loadOlderPosts = async () => {
+        try {
+            const page = await getCommunityPosts({ cursor: nextCursor });
+            setPosts(prevPosts => [
+                ...prevPosts,
+                ...page.items.filter(post => !prevPosts.some(p => p.id === post.id))
+            ]);
+            setNextCursor(page.next_cursor);
+        } catch (error) {
+            console.error("Failed to fetch older posts", error);
+        }
+    };
+
     const handleSend = async () => {
         if (!newPost.trim()) return;
         
@@ -111,6 +126,14 @@ const CommunityChat = () => {
                         </div>
                     ))
                 )}
+                {nextCursor && (
+                    <button
+                        onClick={loadOlderPosts}
+                        className="w-full text-sm font-bold text-gray-400 hover:text-yellow-600 transition-colors py-2"
+                    >
+                        Load older messages
+                    </button>
+                )}
             </div>
 
             <div className="relative">
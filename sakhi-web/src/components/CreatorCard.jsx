@@ -26,7 +26,7 @@ const CreatorCard = ({ creator }) => {
                         {creator.skill_category}
                     </span>
                 </div>
-                <p className="text-gray-600 text-sm mb-4 line-clamp-2">{creator.experience}</p>
+                <p className="text-gray-600 text-sm mb-4 line-clamp-2">{creator.experience_preview ?? creator.experience}</p>
                 <a
                     href={`tel:${creator.contact || '1234567890'}`}
                     className="w-full bg-secondary text-white py-3 rounded-2xl hover:bg-purple-800 transition-all flex items-center justify-center gap-2 font-black shadow-lg shadow-purple-100"
@@ -12,6 +12,7 @@ const PeriodBot = () => {
         { role: 'assistant', content: "Namaste! I am Sakhi. Please tell me your age and last period date to start." }
     ]);
     const [loading, setLoading] = useState(false);
+    const [sessionId, setSessionId] = useState(null);
     const [prediction, setPrediction] = useState(null);
 
     const handleStart = (e) => {
@@ -34,10 +35,11 @@ const PeriodBot = () => {
                 last_period_date: formData.lastDate,
                 user_message: text,
                 language: language,
-                history: messages
+                session_id: sessionId
             });
 
             setMessages([...newHistory, { role: 'assistant', content: data.response }]);
+            if (data.session_id) setSessionId(data.session_id);
             if (data.prediction) setPrediction(data.prediction);
         } catch (error) {
             setMessages([...newHistory, { role: 'assistant', content: `Sorry, I am having trouble connecting. Details: ${error.message}` }]);
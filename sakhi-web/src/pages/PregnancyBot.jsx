@@ -12,6 +12,7 @@ const PregnancyBot = () => {
         { role: 'assistant', content: "Namaste! I am Maa Sakhi. I am here to support your pregnancy journey. When did your pregnancy start?" }
     ]);
     const [loading, setLoading] = useState(false);
+    const [sessionId, setSessionId] = useState(null);
 
     const handleStart = (e) => {
         e.preventDefault();
@@ -31,10 +32,11 @@ const PregnancyBot = () => {
                 pregnancy_start_date: formData.startDate,
                 user_message: text,
                 language: language,
-                history: messages
+                session_id: sessionId
             });
 
             setMessages([...newHistory, { role: 'assistant', content: data.response }]);
+            if (data.session_id) setSessionId(data.session_id);
         } catch (error) {
             setMessages([...newHistory, { role: 'assistant', content: `Sorry, I am having trouble connecting. Details: ${error.message}` }]);
             console.error("API Error:", error);
@@ -29,6 +29,8 @@ const SkillHub = () => {
     const { t } = useLanguage();
     const [creators, setCreators] = useState([]);
     const [products, setProducts] = useState([]);
+    const [creatorsCursor, setCreatorsCursor] = useState(null);
+    const [productsCursor, setProductsCursor] = useState(null);
     const [isRegisterOpen, setIsRegisterOpen] = useState(false);
     const [selectedProduct, setSelectedProduct] = useState(null);
     const [filter, setFilter] = useState('All');
@@ -44,22 +46,25 @@ const SkillHub = () => {
                 setError(null);
                 
                 // Try to fetch from backend
-                const [creatorsData, productsData] = await Promise.all([
-                    getCreators().catch(() => []),
-                    getProducts().catch(() => [])
+                const emptyPage = { items: [], next_cursor: null };
+                const [creatorsPage, productsPage] = await Promise.all([
+                    getCreators().catch(() => emptyPage),
+                    getProducts().catch(() => emptyPage)
                 ]);
                 
                 // If backend data is empty, use mock data as fallback
-                if (creatorsData.length === 0) {
+                if (creatorsPage.items.length === 0) {
                     setCreators(MOCK_CREATORS);
                 } else {
-                    setCreators(creatorsData);
+                    setCreators(creatorsPage.items);
+                    setCreatorsCursor(creatorsPage.next_cursor);
                 }
                 
-                if (productsData.length === 0) {
+                if (productsPage.items.length === 0) {
                     setProducts(MOCK_PRODUCTS);
                 } else {
-                    setProducts(productsData);
+                    setProducts(productsPage.items);
+                    setProductsCursor(productsPage.next_cursor);
                 }
                 
             } catch (err) {
@@ -76,6 +81,26 @@ const SkillHub = () => {
         fetchData();
     }, []);
 
+    const loadMoreCreators = async () => {
+        try {
+            const page = await getCreators({ cursor: creatorsCursor });
+            setCreators(prev => [...prev, ...page.items]);
+            setCreatorsCursor(page.next_cursor);
+        } catch (err) {
+            console.error('Error loading creators:', err);
+        }
+    };
+
+    const loadMoreProducts = async () => {
+        try {
+            const page = await getProducts({ cursor: productsCursor });
+            setProducts(prev => [...prev, ...page.items]);
+            setProductsCursor(page.next_cursor);
+        } catch (err) {
+            console.error('Error loading products:', err);
+        }
+    };
+
     const handleRegister = async (newCreator) => {
         try {
             // Map frontend form data to backend schema
@@ -160,6 +185,17 @@ const SkillHub = () => {
                         <CreatorCard key={creator.id} creator={creator} />
                     ))}
                 </div>
+
+                {creatorsCursor && (
+                    <div className="flex justify-center mt-12">
+                        <button
+                            onClick={loadMoreCreators}
+                            className="px-8 py-3 rounded-full font-bold border-2 border-secondary/30 text-secondary hover:bg-secondary hover:text-white transition-all"
+                        >
+                            Show more Sakhis
+                        </button>
+                    </div>
+                )}
             </section>
 
             {/* PRODUCTS SECTION */}
@@ -192,6 +228,17 @@ const SkillHub = () => {
                         />
                     ))}
                 </div>
+
+                {productsCursor && (
+                    <div className="flex justify-center mt-12 relative z-10">
+                        <button
+                            onClick={loadMoreProducts}
+                            className="px-8 py-3 rounded-full font-bold border-2 border-orange-200 text-orange-600 hover:bg-orange-500 hover:text-white transition-all"
+                        >
+                            Show more products
+                        </button>
+                    </div>
+                )}
             </section>
 
             {/* Modals */}
@@ -18,13 +18,44 @@ api.interceptors.request.use(
     (error) => Promise.reject(error)
 );
 
-export const getCreators = async () => {
-    const response = await api.get('/api/skill-hub/creators');
+// Back off and retry when the AI service sheds load (503 + Retry-After)
+const MAX_OVERLOAD_RETRIES = 2;
+
+api.interceptors.response.use(
+    (response) => response,
+    async (error) => {
+        const { config, response } = error;
+        if (!config || !response || response.status !== 503) {
+            return Promise.reject(error);
+        }
+
+        const retryAfter = parseInt(response.headers['retry-after'] ?? response.data?.retry_after, 10);
+        config._overloadRetries = (config._overloadRetries || 0) + 1;
+        if (!retryAfter || config._overloadRetries > MAX_OVERLOAD_RETRIES) {
+            return Promise.reject(error);
+        }
+
+        await new Promise((resolve) => setTimeout(resolve, retryAfter * 1000));
+        return api(config);
+    }
+);
+
+// List endpoints are paged, newest first: { items, next_cursor }.
+// Pass next_cursor back as cursor for the next page; it is null on the last page.
+export const getCreators = async ({ cursor, limit } = {}) => {
+    const response = await api.get('/api/skill-hub/creators', { params: { cursor, limit } });
+    return response.data;
+};
+
+export const getProducts = async ({ cursor, limit } = {}) => {
+    const response = await api.get('/api/skill-hub/products', { params: { cursor, limit } });
     return response.data;
 };
 
-export const getProducts = async () => {
-    const response = await api.get('/api/skill-hub/products');
+// Ranked search over creators and products; type is 'all', 'creators' or 'products'.
+// The last word matches as a prefix, so this can run on every keystroke.
+export const searchCatalog = async (q, { type = 'all', limit } = {}) => {
+    const response = await api.get('/api/skill-hub/search', { params: { q, type, limit } });
     return response.data;
 };
 
@@ -64,6 +95,50 @@ export const sendKrishiChat = async (data) => {
     return response.data;
 };
 
+// Calendars: no chatbot call; responses carry an ETag the browser revalidates
+export const getPeriodCalendar = async (lastPeriodDate, { cycleLength, months = 6 } = {}) => {
+    const response = await api.get('/api/health-bots/period-calendar', {
+        params: { last_period_date: lastPeriodDate, cycle_length: cycleLength, months }
+    });
+    return response.data;
+};
+
+export const getPregnancyCalendar = async (pregnancyStartDate) => {
+    const response = await api.get('/api/health-bots/pregnancy-calendar', {
+        params: { pregnancy_start_date: pregnancyStartDate }
+    });
+    return response.data;
+};
+
+// Cycle tracking APIs (signed-in users)
+export const logPeriodStart = async (startDate) => {
+    const response = await api.post('/api/cycles/periods', { start_date: startDate });
+    return response.data;
+};
+
+export const getCycleHistory = async () => {
+    const response = await api.get('/api/cycles/history');
+    return response.data;
+};
+
+export const getCyclePrediction = async (cycles = 3) => {
+    const response = await api.get('/api/cycles/prediction', { params: { cycles } });
+    return response.data;
+};
+
+// Background chat jobs - bot is 'period', 'pregnancy' or 'krishi'.
+// Reuse the same idempotencyKey when resubmitting after a lost connection.
+export const submitChatJob = async (bot, data, idempotencyKey) => {
+    const headers = idempotencyKey ? { 'Idempotency-Key': idempotencyKey } : {};
+    const response = await api.post(`/api/jobs/${bot}-chat`, data, { headers });
+    return response.data;
+};
+
+export const getChatJob = async (jobId) => {
+    const response = await api.get(`/api/jobs/${jobId}`);
+    return response.data;
+};
+
 // Authentication APIs
 export const signup = async (data) => {
     const response = await api.post('/api/auth/signup', data);
@@ -91,8 +166,8 @@ export const updateUser = async (data) => {
 };
 
 // Community APIs
-export const getCommunityPosts = async () => {
-    const response = await api.get('/api/community/posts');
+export const getCommunityPosts = async ({ cursor, limit } = {}) => {
+    const response = await api.get('/api/community/posts', { params: { cursor, limit } });
     return response.data;
 };
 